@@ -0,0 +1,28 @@
+from .Scheduler import Scheduler
+
+
+class AdversarialScheduler(Scheduler):
+    """A scheduler whose activations are chosen by an adversary."""
+
+    def __init__(self, adversary):
+        """A scheduler delegating its choices to a function of the form
+        ``adversary(simulation)``, which may inspect the whole simulation
+        (positions of the agents, step, ...) and returns the indices of the
+        agents to activate, in order. Useful to test algorithms against
+        worst-case daemons.
+
+        :param adversary: The function choosing the activated agents.
+        :type adversary: function
+        """
+        self._adversary = adversary
+
+    def activations(self, simulation):
+        """Activate the agents chosen by the adversary.
+
+        :param simulation: An asynchronous simulation.
+        :type simulation: :class:`mas.agent.Simulation.Simulation`
+
+        :returns: Indices of agents, in order of activation.
+        :rtype: list of int
+        """
+        return list(self._adversary(simulation))
@@ -1,5 +1,6 @@
-import random
-from collections import defaultdict
+from .IDAllocator import IDAllocator
+import numpy as np
+from mas.graph.graph_memory import container_size, sampled_size
 
 
 class AgentManager:
@@ -7,7 +8,8 @@ class AgentManager:
     Used for managing all the data about agents during a simulation.
     """
 
-    def __init__(self, agents_list, topology, possible_latencies=[1]):
+    def __init__(self, agents_list, topology, possible_latencies=[1],
+                 rng=None, id_space=None):
         """An agent manager. It encapsulates all the data about agents in an 
         agent list: their identifiers; their positions; the information they
         store; ...
@@ -22,20 +24,31 @@ class AgentManager:
             is generated with a latency randomly picked in this list.
             Default to [1].
         :type possible_latencies: list of int, optional
+
+        :param rng: Random generator drawing identifiers, latencies and
+            positions.
+            Default to None (a generator seeded from fresh entropy).
+        :type rng: numpy.random.Generator, optional
+
+        :param id_space: Number of possible identifiers of agents (see
+            :class:`mas.agent.IDAllocator.IDAllocator`).
+            Default to None (at least 50000, and twice the number of agents).
+        :type id_space: int, optional
         """
 
+        if rng is None:
+            rng = np.random.default_rng()
+
+        self._topology = topology
         self._agents_position = dict()
-        self._pos_to_agents_list = defaultdict(list)
-        self._init_position(agents_list, topology)
+        self._pos_to_agents_list = dict()
+        self._agents_index = dict()
+        self._init_position(agents_list, topology, rng)
 
-        self._agents_id = dict()
-        self._init_ids(agents_list)
+        self._init_ids(agents_list, rng, id_space)
 
         self._agents_latency = dict()
-        self._init_latencies(agents_list, possible_latencies)
-
-        self._agents_position_contains_mate = dict()
-        self._init_positions_contains_mate()
+        self._init_latencies(agents_list, possible_latencies, rng)
 
         self._agents_port_back = dict()
         self._agents_last_move = dict()
@@ -44,34 +57,30 @@ class AgentManager:
             self._set_agent_port_back(agent, None)
             self._set_agent_last_move(agent, 0)
 
-    def _init_ids(self, agents_list):
-        ids = random.sample(range(0, 50000), len(agents_list))
-        i = 0
-        for agent in agents_list:
-            id = agent.desired_id()
-            if (id is None) or (id in self._agents_id.values()):
-                id = ids[i]
-            self._agents_id[agent] = id
-            i += 1
-
-    def _init_latencies(self, agents_list, possible_latencies):
-        for agent in agents_list:
-            latency = agent.desired_latency()
+    def _init_ids(self, agents_list, rng, id_space):
+        allocator = IDAllocator(id_space, rng)
+        ids = allocator.allocate([agent.desired_id() for agent in agents_list])
+        self._agents_id = dict(zip(agents_list, ids.tolist()))
+        self._id_to_agent = dict(zip(ids.tolist(), agents_list))
+
+    def _init_latencies(self, agents_list, possible_latencies, rng):
+        # Latencies are only drawn for the agents without a desired one.
+        desired = [agent.desired_latency() for agent in agents_list]
+        missing = desired.count(None)
+        drawn = iter(rng.choice(possible_latencies, missing).tolist()
+                     if missing != 0 else ())
+        for agent, latency in zip(agents_list, desired):
             if latency is None:
-                latency = random.choice(possible_latencies)
+                latency = next(drawn)
             self._agents_latency[agent] = latency
 
-    def _init_position(self, agents_list, topology):
+    def _init_position(self, agents_list, topology, rng):
         for agent in agents_list:
             pos = agent.desired_initial_position()
             if pos is None:
-                pos = random.choice(list(topology.vertices()))
+                pos = topology.random_vertex(rng)
             self._agents_position[agent] = pos
-            self._pos_to_agents_list[pos].append(agent)
-
-    def _init_positions_contains_mate(self):
-        for vertex in self._pos_to_agents_list:
-            self._notify_encounter_on_position(vertex)
+            self._add_to_position(agent, pos)
 
     def agent_moved(self, agent, step):
         """Specify that an agent moved at current step.
@@ -84,6 +93,41 @@ class AgentManager:
         """
         self._set_agent_last_move(agent, step)
 
+    def agents_at(self, vertex):
+        """Get the agents located on a vertex.
+
+        :param vertex: A vertex of the topology.
+        :type vertex: :class:`mas.graph.Vertex.Vertex`
+
+        :returns: The agents on the vertex, in no particular order. The list
+            is shared with the manager and must not be modified.
+        :rtype: list
+        """
+        return self._pos_to_agents_list.get(vertex, [])
+
+    def count_at(self, vertex):
+        """Get the number of agents located on a vertex.
+
+        :param vertex: A vertex of the topology.
+        :type vertex: :class:`mas.graph.Vertex.Vertex`
+
+        :returns: A number of agents.
+        :rtype: int
+        """
+        return len(self._pos_to_agents_list.get(vertex, ()))
+
+    def get_agent_by_id(self, ID):
+        """Get an agent given its identifier.
+
+        :param ID: An identifier.
+        :type ID: int
+
+        :returns: The agent with this identifier if it exists, None
+            otherwise.
+        :rtype: class:`mas.agent.Agent.Agent`
+        """
+        return self._id_to_agent.get(ID)
+
     def get_agent_last_move(self, agent):
         """Get the last step the agent moved.
 
@@ -148,7 +192,7 @@ class AgentManager:
             agent, False otherwise.
         :rtype: boolean
         """
-        return self._agents_position_contains_mate[agent]
+        return self.count_at(self._agents_position[agent]) > 1
 
     def get_occupied_positions(self):
         """Get the list of every vertex of the topology containing at least one
@@ -159,8 +203,40 @@ class AgentManager:
         """
         return list(self._pos_to_agents_list)
 
+    def memory_usage(self):
+        """Get the memory used by the data about agents, broken down by
+        dictionary. Sizes of the values are estimated from samples (see
+        :mod:`mas.graph.graph_memory`); agents and vertices themselves are not
+        counted.
+
+        :returns: Numbers of bytes keyed by component: "agents_position",
+            "pos_to_agents_list", "agents_index", "agents_id",
+            "id_to_agent", "agents_latency", "agents_port_back",
+            "agents_last_move", and "total".
+        :rtype: dict
+        """
+        report = {
+            "agents_position": container_size(self._agents_position),
+            "pos_to_agents_list": container_size(self._pos_to_agents_list) +
+            sampled_size(self._pos_to_agents_list.values()),
+            "agents_index": container_size(self._agents_index) +
+            sampled_size(self._agents_index.values()),
+            "agents_id": container_size(self._agents_id) +
+            sampled_size(self._agents_id.values()),
+            "id_to_agent": container_size(self._id_to_agent),
+            "agents_latency": container_size(self._agents_latency) +
+            sampled_size(self._agents_latency.values()),
+            "agents_port_back": container_size(self._agents_port_back) +
+            sampled_size(self._agents_port_back.values()),
+            "agents_last_move": container_size(self._agents_last_move) +
+            sampled_size(self._agents_last_move.values()),
+        }
+        report["total"] = sum(report.values())
+        return report
+
     def move_agent(self, agent, port):
-        """Modify the position of an agent.
+        """Modify the position of an agent. Only the lists of agents of its
+        previous and new positions are updated, in constant time.
 
         :param agent: A mobile agent.
         :type agent: class:`mas.agent.Agent.Agent`
@@ -168,19 +244,12 @@ class AgentManager:
         :param port: Port of the edge for the agent to traverse.
         :type port: int
         """
-        self._set_agent_position_contains_mate(agent, False)
-
         oldpos = self.get_agent_position(agent)
         newpos = oldpos.get_neighbor_by_port(port)
         self._set_agent_position(agent, newpos)
 
-        if agent in self._pos_to_agents_list[oldpos]:
-            self._pos_to_agents_list[oldpos].remove(agent)
-            if len(self._pos_to_agents_list[oldpos]) == 0:
-                del(self._pos_to_agents_list[oldpos])
-        self._pos_to_agents_list[newpos].append(agent)
-
-        self._notify_encounter_on_position(newpos)
+        self._remove_from_position(agent, oldpos)
+        self._add_to_position(agent, newpos)
 
         port_back = newpos.get_port_by_neighbor(oldpos)
         self._set_agent_port_back(agent, port_back)
@@ -194,16 +263,23 @@ class AgentManager:
         """
         for (agent, port) in agents_with_ports:
             self.move_agent(agent, port)
-        self._notify_all_encounters()
-
-    def _notify_all_encounters(self):
-        for vertex in self.get_occupied_positions():
-            self._notify_encounter_on_position(vertex)
 
-    def _notify_encounter_on_position(self, vertex):
-        numerous_agents = len(self._pos_to_agents_list[vertex]) > 1
-        for agent in self._pos_to_agents_list[vertex]:
-            self._set_agent_position_contains_mate(agent, numerous_agents)
+    def _add_to_position(self, agent, vertex):
+        agents = self._pos_to_agents_list.setdefault(vertex, [])
+        self._agents_index[agent] = len(agents)
+        agents.append(agent)
+
+    def _remove_from_position(self, agent, vertex):
+        # Swap-remove: the last agent of the list takes the place of the
+        # removed one.
+        agents = self._pos_to_agents_list[vertex]
+        index = self._agents_index.pop(agent)
+        last = agents.pop()
+        if last is not agent:
+            agents[index] = last
+            self._agents_index[last] = index
+        if len(agents) == 0:
+            del self._pos_to_agents_list[vertex]
 
     def _set_agent_last_move(self, agent, step):
         self._agents_last_move[agent] = step
@@ -214,5 +290,39 @@ class AgentManager:
     def _set_agent_position(self, agent, position):
         self._agents_position[agent] = position
 
-    def _set_agent_position_contains_mate(self, agent, position_contains_mate):
-        self._agents_position_contains_mate[agent] = position_contains_mate
+    def __getstate__(self):
+        # Agents data is pickled as columns aligned with a single list of
+        # agents, instead of one dictionary keyed by agents per attribute.
+        # Positions are pickled as identifiers of vertices of the topology.
+        agents = list(self._agents_position)
+        return {
+            "topology": self._topology,
+            "agents": agents,
+            "positions": np.array(
+                [self._topology.get_vertex_id(self._agents_position[a])
+                 for a in agents], np.int64),
+            "ids": np.array([self._agents_id[a] for a in agents], np.int64),
+            "latencies": np.array(
+                [self._agents_latency[a] for a in agents], np.int64),
+            "ports_back": [self._agents_port_back[a] for a in agents],
+            "last_moves": np.array(
+                [self._agents_last_move[a] for a in agents], np.int64),
+        }
+
+    def __setstate__(self, state):
+        agents = state["agents"]
+        self._topology = state["topology"]
+        self._agents_position = dict(zip(agents, [
+            self._topology.get_vertex_by_id(ID)
+            for ID in state["positions"].tolist()]))
+        self._agents_id = dict(zip(agents, state["ids"].tolist()))
+        self._id_to_agent = dict(zip(state["ids"].tolist(), agents))
+        self._agents_latency = dict(zip(agents, state["latencies"].tolist()))
+        self._agents_port_back = dict(zip(agents, state["ports_back"]))
+        self._agents_last_move = dict(
+            zip(agents, state["last_moves"].tolist()))
+
+        self._pos_to_agents_list = dict()
+        self._agents_index = dict()
+        for agent, position in self._agents_position.items():
+            self._add_to_position(agent, position)
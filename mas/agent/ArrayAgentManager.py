@@ -0,0 +1,449 @@
+from .IDAllocator import IDAllocator
+import numpy as np
+from mas.graph.graph_memory import arrays_size, container_size, sampled_size
+
+
+class ArrayAgentManager:
+    """
+    Used for managing all the data about agents during a simulation, stored
+    as numpy columns.
+    """
+
+    def __init__(self, agents_list, topology, possible_latencies=[1],
+                 rng=None, id_space=None):
+        """An agent manager with the interface of
+        :class:`mas.agent.AgentManager.AgentManager`. Every agent is given an
+        integer slot (its index in agents_list) and each piece of data is
+        stored in a numpy array indexed by slots: the identifier of the
+        position of the agent in the topology, its identifier, its latency,
+        its last move and its port back (-1 if it did not move).
+
+        Queries about one agent are array reads, and queries about the whole
+        population (see :meth:`positions`) return read-only views of the
+        columns, without any copy. The number of agents of every occupied
+        vertex is stored in a dictionary keyed by vertex identifiers, and the
+        slots of its agents in a list, both updated in constant time per
+        moving agent (the lists are only built once :meth:`agents_at` is
+        called), so that memory only grows with the number of agents, even on
+        huge implicit or lazy topologies.
+
+        :param agents_list: List of agents to manage.
+        :type agents_list: list.
+
+        :param topology: Topology on which the simulation is run
+        :type topology: :class:`mas.graph.Graph.Graph`
+
+        :param possible_latencies: If agents_list is set to None, every agent
+            is generated with a latency randomly picked in this list.
+            Default to [1].
+        :type possible_latencies: list of int, optional
+
+        :param rng: Random generator drawing identifiers, latencies and
+            positions.
+            Default to None (a generator seeded from fresh entropy).
+        :type rng: numpy.random.Generator, optional
+
+        :param id_space: Number of possible identifiers of agents (see
+            :class:`mas.agent.IDAllocator.IDAllocator`).
+            Default to None (at least 50000, and twice the number of agents).
+        :type id_space: int, optional
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+
+        self._topology = topology
+        self._agents = list(agents_list)
+        self._slots = {agent: slot for slot, agent in enumerate(self._agents)}
+
+        number = len(self._agents)
+        self._positions = np.empty(number, np.int64)
+        self._init_positions(rng)
+
+        self._init_ids(rng, id_space)
+
+        self._latencies = np.empty(number, np.int64)
+        self._init_latencies(possible_latencies, rng)
+
+        IDs, counts = np.unique(self._positions, return_counts=True)
+        self._counts = dict(zip(IDs.tolist(), counts.tolist()))
+        self._occupants = None
+        self._occupant_index = None
+
+        self._ports_back = np.full(number, -1, np.int64)
+        self._last_moves = np.zeros(number, np.int64)
+
+    def _init_ids(self, rng, id_space):
+        allocator = IDAllocator(id_space, rng)
+        self._ids = allocator.allocate(
+            [agent.desired_id() for agent in self._agents])
+        self._id_to_slot = {ID: slot
+                            for slot, ID in enumerate(self._ids.tolist())}
+
+    def _init_latencies(self, possible_latencies, rng):
+        # Latencies are only drawn for the agents without a desired one.
+        desired = [agent.desired_latency() for agent in self._agents]
+        missing = np.array([latency is None for latency in desired], bool)
+        if missing.any():
+            self._latencies[missing] = rng.choice(possible_latencies,
+                                                  int(missing.sum()))
+        self._latencies[~missing] = [latency for latency in desired
+                                     if latency is not None]
+
+    def _init_positions(self, rng):
+        for slot, agent in enumerate(self._agents):
+            pos = agent.desired_initial_position()
+            if pos is None:
+                pos = self._topology.random_vertex(rng)
+            self._positions[slot] = self._topology.get_vertex_id(pos)
+
+    def agent_moved(self, agent, step):
+        """Specify that an agent moved at current step.
+
+        :param agent: A mobile agent.
+        :type agent: class:`mas.agent.Agent.Agent`
+
+        :param step: Execution step of a simulation.
+        :type step: int
+        """
+        self._last_moves[self._slots[agent]] = step
+
+    def agents_at(self, vertex):
+        """Get the agents located on a vertex.
+
+        :param vertex: A vertex of the topology.
+        :type vertex: :class:`mas.graph.Vertex.Vertex`
+
+        :returns: The agents on the vertex, in no particular order.
+        :rtype: list
+        """
+        occupants = self._occupants_lists()
+        slots = occupants.get(self._topology.get_vertex_id(vertex), ())
+        return [self._agents[slot] for slot in slots]
+
+    def agents(self):
+        """Get the managed agents, ordered by slots.
+
+        :returns: The agents, the one of slot i being at index i.
+        :rtype: list of class:`mas.agent.Agent.Agent`
+        """
+        return list(self._agents)
+
+    def contains_mate(self):
+        """Get whether the position of every agent contains a mate.
+
+        :returns: An array indexed by slots.
+        :rtype: numpy.array of bool
+        """
+        _, inverse, counts = np.unique(self._positions, return_inverse=True,
+                                       return_counts=True)
+        return counts[inverse.reshape(-1)] > 1
+
+    def count_at(self, vertex):
+        """Get the number of agents located on a vertex.
+
+        :param vertex: A vertex of the topology.
+        :type vertex: :class:`mas.graph.Vertex.Vertex`
+
+        :returns: A number of agents.
+        :rtype: int
+        """
+        return self._counts.get(self._topology.get_vertex_id(vertex), 0)
+
+    def get_agent_by_id(self, ID):
+        """Get an agent given its identifier.
+
+        :param ID: An identifier.
+        :type ID: int
+
+        :returns: The agent with this identifier if it exists, None
+            otherwise.
+        :rtype: class:`mas.agent.Agent.Agent`
+        """
+        slot = self._id_to_slot.get(ID)
+        return None if slot is None else self._agents[slot]
+
+    def get_agent_last_move(self, agent):
+        """Get the last step the agent moved.
+
+        :param agent: A mobile agent.
+        :type agent: class:`mas.agent.Agent.Agent`
+
+        :returns: A step.
+        :rtype: int
+        """
+        return int(self._last_moves[self._slots[agent]])
+
+    def get_agent_id(self, agent):
+        """Get the unique identifier of the agent.
+
+        :param agent: A mobile agent.
+        :type agent: class:`mas.agent.Agent.Agent`
+
+        :returns: The unique identifier of the agent.
+        :rtype: int
+        """
+        return int(self._ids[self._slots[agent]])
+
+    def get_agent_latency(self, agent):
+        """Get the latency of the agent.
+
+        :param agent: A mobile agent.
+        :type agent: class:`mas.agent.Agent.Agent`
+
+        :returns: The latency of the agent.
+        :rtype: int
+        """
+        return int(self._latencies[self._slots[agent]])
+
+    def get_agent_port_back(self, agent):
+        """Get the port number of the edge the agent comes from.
+
+        :param agent: A mobile agent.
+        :type agent: class:`mas.agent.Agent.Agent`
+
+        :returns: The port for the agent to get back to the previous position.
+            If the agent did not perform any move, returns None.
+        :rtype: int
+        """
+        port_back = int(self._ports_back[self._slots[agent]])
+        return None if port_back < 0 else port_back
+
+    def get_agent_position(self, agent):
+        """Get the position of an agent.
+
+        :param agent: A mobile agent.
+        :type agent: class:`mas.agent.Agent.Agent`
+
+        :returns: The current position of the agent.
+        :rtype: :class:`mas.graph.Vertex.Vertex`
+        """
+        return self._topology.get_vertex_by_id(
+            int(self._positions[self._slots[agent]]))
+
+    def get_agent_position_contains_mate(self, agent):
+        """Get a boolean according to whether current position of the agent
+        contains one or several agents.
+
+        :returns: True if the current position of the agent contains an other
+            agent, False otherwise.
+        :rtype: boolean
+        """
+        ID = int(self._positions[self._slots[agent]])
+        return self._counts[ID] > 1
+
+    def get_agent_slot(self, agent):
+        """Get the slot of an agent, that is its index in the columns.
+
+        :param agent: A mobile agent.
+        :type agent: class:`mas.agent.Agent.Agent`
+
+        :returns: The slot of the agent.
+        :rtype: int
+        """
+        return self._slots[agent]
+
+    def get_occupied_positions(self):
+        """Get the list of every vertex of the topology containing at least one
+        agent.
+
+        :return: A list of vertices.
+        :rtype: list
+        """
+        return [self._topology.get_vertex_by_id(ID)
+                for ID in sorted(self._counts)]
+
+    def ids(self):
+        """Get the identifiers of all the agents.
+
+        :returns: A read-only view indexed by slots.
+        :rtype: numpy.array of int
+        """
+        return self._read_only(self._ids)
+
+    def last_moves(self):
+        """Get the last step every agent moved.
+
+        :returns: A read-only view indexed by slots.
+        :rtype: numpy.array of int
+        """
+        return self._read_only(self._last_moves)
+
+    def latencies(self):
+        """Get the latencies of all the agents.
+
+        :returns: A read-only view indexed by slots.
+        :rtype: numpy.array of int
+        """
+        return self._read_only(self._latencies)
+
+    def memory_usage(self):
+        """Get the memory used by the data about agents, broken down by
+        column (see :mod:`mas.graph.graph_memory`); agents and vertices
+        themselves are not counted.
+
+        :returns: Numbers of bytes keyed by component: "slots" (the
+            dictionaries and list mapping agents and identifiers to slots),
+            "positions", "ids", "latencies", "ports_back", "last_moves",
+            "occupancy" (numbers and lists of agents of the vertices), and
+            "total".
+        :rtype: dict
+        """
+        report = {
+            "slots": container_size(self._slots) +
+            container_size(self._agents) + container_size(self._id_to_slot),
+            "positions": arrays_size([self._positions]),
+            "ids": arrays_size([self._ids]),
+            "latencies": arrays_size([self._latencies]),
+            "ports_back": arrays_size([self._ports_back]),
+            "last_moves": arrays_size([self._last_moves]),
+            "occupancy": container_size(self._counts) +
+            sampled_size(self._counts.values()) +
+            (0 if self._occupants is None else
+             container_size(self._occupants) +
+             sampled_size(self._occupants.values()) +
+             container_size(self._occupant_index)),
+        }
+        report["total"] = sum(report.values())
+        return report
+
+    def move_agent(self, agent, port):
+        """Modify the position of an agent. Only the numbers and lists of
+        agents of its previous and new positions are updated, in constant
+        time.
+
+        :param agent: A mobile agent.
+        :type agent: class:`mas.agent.Agent.Agent`
+
+        :param port: Port of the edge for the agent to traverse.
+        :type port: int
+        """
+        self._move_slot(self._slots[agent], port)
+
+    def move_multiple_agents(self, agents_with_ports):
+        """Move multiple agents along given edges.
+
+          :param agents_with_ports: Vectors of the form (agent, port)
+          :type agents_with_ports: list of tuples
+            (class:`mas.agent.Agent.Agent`, int)
+        """
+        for (agent, port) in agents_with_ports:
+            self._move_slot(self._slots[agent], port)
+
+    def move_slots(self, slots, positions, ports_back, step):
+        """Move several agents at once, given as slots. Only the numbers
+        and lists of agents of the vertices they leave and reach are updated.
+
+        :param slots: Slots of the agents to move.
+        :type slots: numpy.array of int
+
+        :param positions: Identifiers of the new positions of these agents.
+        :type positions: numpy.array of int
+
+        :param ports_back: Ports of the new positions leading back to the
+            previous ones.
+        :type ports_back: numpy.array of int
+
+        :param step: Execution step of the simulation, recorded as the last
+            move of these agents.
+        :type step: int
+        """
+        slots = np.asarray(slots, np.int64)
+        positions = np.asarray(positions, np.int64)
+        sources = self._positions[slots]
+        self._positions[slots] = positions
+        self._ports_back[slots] = ports_back
+        self._last_moves[slots] = step
+
+        if self._occupants is None:
+            self._update_counts(sources, -1)
+            self._update_counts(positions, 1)
+            return
+        for slot, source, target in zip(slots.tolist(), sources.tolist(),
+                                        positions.tolist()):
+            self._remove_from_position(slot, source)
+            self._add_to_position(slot, target)
+
+    def ports_back(self):
+        """Get the ports back of all the agents.
+
+        :returns: A read-only view indexed by slots (-1 for agents that did
+            not move).
+        :rtype: numpy.array of int
+        """
+        return self._read_only(self._ports_back)
+
+    def positions(self):
+        """Get the identifiers of the positions of all the agents (see
+        :meth:`mas.graph.Graph.Graph.get_vertex_id`).
+
+        :returns: A read-only view indexed by slots.
+        :rtype: numpy.array of int
+        """
+        return self._read_only(self._positions)
+
+    def _add_to_position(self, slot, ID):
+        self._counts[ID] = self._counts.get(ID, 0) + 1
+        if self._occupants is not None:
+            slots = self._occupants.setdefault(ID, [])
+            self._occupant_index[slot] = len(slots)
+            slots.append(slot)
+
+    def _move_slot(self, slot, port):
+        oldID = int(self._positions[slot])
+        oldpos = self._topology.get_vertex_by_id(oldID)
+        newpos = oldpos.get_neighbor_by_port(port)
+        newID = self._topology.get_vertex_id(newpos)
+        self._positions[slot] = newID
+
+        port_back = newpos.get_port_by_neighbor(oldpos)
+        self._ports_back[slot] = -1 if port_back is None else port_back
+
+        self._remove_from_position(slot, oldID)
+        self._add_to_position(slot, newID)
+
+    def _occupants_lists(self):
+        # Slots of the agents of every occupied vertex, and index of every
+        # slot in the list of its vertex.
+        if self._occupants is None:
+            self._occupants = dict()
+            self._occupant_index = [0] * len(self._agents)
+            for slot, ID in enumerate(self._positions.tolist()):
+                slots = self._occupants.setdefault(ID, [])
+                self._occupant_index[slot] = len(slots)
+                slots.append(slot)
+        return self._occupants
+
+    def _remove_from_position(self, slot, ID):
+        # Swap-remove: the last slot of the list takes the place of the
+        # removed one.
+        if self._counts[ID] == 1:
+            del self._counts[ID]
+        else:
+            self._counts[ID] -= 1
+        if self._occupants is None:
+            return
+        slots = self._occupants[ID]
+        index = self._occupant_index[slot]
+        last = slots.pop()
+        if last != slot:
+            slots[index] = last
+            self._occupant_index[last] = index
+        if len(slots) == 0:
+            del self._occupants[ID]
+
+    def _update_counts(self, IDs, sign):
+        # Add sign times the number of occurrences of every vertex of IDs to
+        # its counter, only visiting these vertices.
+        IDs, numbers = np.unique(IDs, return_counts=True)
+        for ID, number in zip(IDs.tolist(), numbers.tolist()):
+            count = self._counts.get(ID, 0) + sign * number
+            if count == 0:
+                del self._counts[ID]
+            else:
+                self._counts[ID] = count
+
+    @staticmethod
+    def _read_only(column):
+        view = column.view()
+        view.flags.writeable = False
+        return view
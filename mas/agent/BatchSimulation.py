@@ -0,0 +1,201 @@
+from .ArrayAgentManager import ArrayAgentManager
+from .Simulation import Simulation
+from .encounters import crossings, meetings
+import numpy as np
+
+
+class BatchSimulation(Simulation):
+    """
+    A synchronous simulation whose agents all apply one batched policy,
+    executed on numpy arrays instead of once per agent.
+    """
+
+    def __init__(self,
+                 topology,
+                 policy,
+                 agents_list=None,
+                 agents_number=1,
+                 possible_latencies=[1],
+                 state=None,
+                 anonymous_topology=False,
+                 verbose=False,
+                 check_connectivity=False,
+                 seed=None,
+                 detect_encounters=False,
+                 id_space=None):
+        """A synchronous simulation in which agents data is stored by a
+        :class:`mas.agent.ArrayAgentManager.ArrayAgentManager`, and the
+        algorithm is a batched policy of the form::
+
+            policy(step, positions, widths, ports_back, mates, state)
+
+        called once per step with arrays indexed by agents slots (see
+        :meth:`mas.agent.ArrayAgentManager.ArrayAgentManager.get_agent_slot`):
+        the identifiers of their positions (None if the topology is
+        anonymous), the widths of the rows of these positions in the port
+        table (their largest port plus one), their ports back (-1 if they did
+        not move yet) and whether their positions contain a mate. ``state``
+        is the dictionary of per-agent arrays given to the constructor; the
+        policy may modify it in place. It returns an array with the port
+        chosen by each agent, -1 for agents that wait.
+
+        A width is the degree of the vertex, unless edges were removed from
+        it: the ports of removed edges are then holes of the row, leading to
+        -1 in the port table. Like :meth:`mas.agent.Agent.Agent.move_along`
+        with a port that does not exist, choosing a hole is an illegal move.
+
+        Moves are checked (existing port, latency) and performed at once with
+        the port table of the topology (see
+        :meth:`mas.graph.Graph.Graph.port_table`), so that a policy makes
+        exactly the moves of the per-agent algorithm choosing the same ports
+        in a synchronous :class:`mas.agent.Simulation.Simulation`.
+
+          :param topology: Topology on which the simulation is run.
+          :type topology: :class:`mas.graph.Graph.Graph`
+
+          :param policy: A batched policy.
+          :type policy: function
+
+          :param agents_list: List of agents to add to the simulation.
+            Default to None.
+          :type agents_list: list of :class:`mas.agent.Agent.Agent`,
+            optional
+
+          :param agents_number: Number of agents to add to the simulation. Not
+            taken into account if agents_list is not None.
+            Default to 1.
+          :type agents_number: int, optional
+
+          :param possible_latencies: If agents_list is set to None, every agent
+            is generated with a latency randomly picked in this list.
+            Default to [1].
+          :type possible_latencies: list of int, optional
+
+          :param state: Per-agent arrays indexed by slots, passed to the
+            policy at every step.
+            Default to None (an empty dictionary).
+          :type state: dict of numpy.array, optional
+
+          :param anonymous_topology: Anonymity of the vertices.
+            Default to False.
+          :type anonymous_topology: boolean, optional
+
+          :param verbose: Print the number of illegal moves of each step.
+            Default to False.
+          :type verbose: boolean, optional
+
+          :param check_connectivity: If set to True, refuse topologies that are
+            not connected (see :meth:`mas.graph.Graph.Graph.is_connected`).
+            Default to False.
+          :type check_connectivity: boolean, optional
+
+          :param seed: Seed of the random generator of the simulation (see
+            :meth:`mas.agent.Simulation.Simulation.rng`).
+            Default to None (fresh entropy).
+          :type seed: int, numpy.random.SeedSequence or
+            numpy.random.Generator, optional
+
+          :param detect_encounters: If set to True, the meetings and edge
+            crossings of every step are detected (see
+            :meth:`mas.agent.Simulation.Simulation.encounters`).
+            Default to False.
+          :type detect_encounters: boolean, optional
+
+          :param id_space: Number of possible identifiers of agents (see
+            :class:`mas.agent.IDAllocator.IDAllocator`).
+            Default to None (at least 50000, and twice the number of agents).
+          :type id_space: int, optional
+
+          :raises ValueError: If the topology is weighted or has no port
+            table, or if ``check_connectivity`` is True and the topology is
+            not connected.
+        """
+        if not hasattr(topology, "port_table"):
+            raise ValueError("batched policies need a topology with a port "
+                             "table.")
+        if topology.is_weighted():
+            raise ValueError("batched policies do not support weighted "
+                             "topologies.")
+
+        super().__init__(topology,
+                         agents_list=agents_list,
+                         agents_number=agents_number,
+                         possible_latencies=possible_latencies,
+                         anonymous_topology=anonymous_topology,
+                         verbose=verbose,
+                         check_connectivity=check_connectivity,
+                         agents_manager_class=ArrayAgentManager,
+                         seed=seed,
+                         detect_encounters=detect_encounters,
+                         id_space=id_space)
+
+        self._policy = policy
+        self._state = dict() if state is None else state
+        self._moves_nb = np.zeros(len(self._agents_list), np.int64)
+
+    def get_state(self):
+        """Get the per-agent arrays passed to the policy.
+
+        :returns: Arrays indexed by slots, keyed by name.
+        :rtype: dict of numpy.array
+        """
+        return self._state
+
+    def moves_numbers(self):
+        """Get the number of moves of every agent. The counters of the agent
+        objects (see :meth:`mas.agent.Agent.Agent.get_moves_nb`) are not
+        updated by batched steps.
+
+        :returns: An array indexed by slots.
+        :rtype: numpy.array of int
+        """
+        return self._moves_nb
+
+    def _synchronous_step(self):
+        # Apply the policy to all the agents once and move the agents whose
+        # ports are legal.
+        offsets, targets, back_ports = self._topology.port_table()
+        manager = self._agents_manager
+        positions = manager.positions()
+        starts = offsets[positions]
+        widths = offsets[positions + 1] - starts
+
+        ports = np.asarray(self._policy(
+            self._step,
+            None if self._anonymous_topology else positions,
+            widths,
+            manager.ports_back(),
+            manager.contains_mate(),
+            self._state), np.int64)
+
+        legal = (ports >= 0) & (ports < widths)
+        legal &= self._step % manager.latencies() == 0
+        movers = np.flatnonzero(legal)
+        slots = starts[movers] + ports[movers]
+        reached = targets[slots] >= 0
+        movers, slots = movers[reached], slots[reached]
+
+        illegal = int(np.count_nonzero(ports >= 0)) - movers.size
+        if illegal != 0:
+            self._print_error(f"warning: {illegal} agents were prevented "
+                              f"from moving this round.")
+
+        sources = positions[movers]
+        manager.move_slots(movers, targets[slots], back_ports[slots],
+                           self._step)
+        if self._detect_encounters:
+            self._encounters = self._batch_encounters(movers, sources,
+                                                      targets[slots])
+        self._moves_nb[movers] += 1
+        self._moves_number += movers.size
+
+        self._step += 1
+
+    def _batch_encounters(self, movers, sources, reached):
+        positions = self._agents_manager.positions()
+        occupants = np.flatnonzero(np.isin(positions, reached))
+        moved = np.zeros(positions.size, bool)
+        moved[movers] = True
+        return np.concatenate((
+            meetings(occupants, positions[occupants], moved[occupants]),
+            crossings(movers, sources, reached)))
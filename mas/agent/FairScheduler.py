@@ -0,0 +1,18 @@
+from .Scheduler import Scheduler
+
+
+class FairScheduler(Scheduler):
+    """A scheduler activating every agent once per step."""
+
+    def activations(self, simulation):
+        """Activate all the agents, in a uniformly random order drawn with
+        the random generator of the simulation.
+
+        :param simulation: An asynchronous simulation.
+        :type simulation: :class:`mas.agent.Simulation.Simulation`
+
+        :returns: A permutation of the indices of the agents.
+        :rtype: list of int
+        """
+        number = len(simulation.get_all_agents())
+        return simulation.rng().permutation(number).tolist()
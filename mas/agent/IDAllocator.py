@@ -0,0 +1,94 @@
+import numpy as np
+
+
+class IDAllocator:
+    """Allocator of unique identifiers for agents."""
+
+    DEFAULT_SPACE = 50000
+
+    def __init__(self, id_space=None, rng=None):
+        """An allocator drawing identifiers uniformly at random in
+        ``[0, id_space)``. Desired identifiers are reserved first (the first
+        agent asking for an identifier gets it), then the other identifiers
+        are drawn in batches, rejecting the ones already reserved. If many
+        of the free identifiers are needed, they are drawn from an explicit
+        list of the free identifiers instead.
+
+        :param id_space: Number of possible identifiers.
+            Default to None (the largest of ``DEFAULT_SPACE`` and twice the
+            number of agents).
+        :type id_space: int, optional
+
+        :param rng: Random generator.
+            Default to None (a generator seeded from fresh entropy).
+        :type rng: numpy.random.Generator, optional
+        """
+        self._id_space = id_space
+        self._rng = np.random.default_rng() if rng is None else rng
+
+    def allocate(self, desired_ids):
+        """Allocate one identifier per agent.
+
+        :param desired_ids: The desired identifier of every agent, or None.
+        :type desired_ids: list
+
+        :returns: Pairwise distinct identifiers, in the order of
+            ``desired_ids``.
+        :rtype: numpy.array of int
+
+        :raises ValueError: If the identifier space is too small.
+        """
+        number = len(desired_ids)
+        space = self.id_space(number)
+
+        ids = np.zeros(number, np.int64)
+        is_missing = np.ones(number, bool)
+        used = set()
+        for i, ID in enumerate(desired_ids):
+            if ID is not None and ID not in used:
+                ids[i] = ID
+                is_missing[i] = False
+                used.add(ID)
+
+        missing = np.flatnonzero(is_missing)
+        reserved = np.fromiter(used, np.int64, len(used))
+        reserved_inside = reserved[(reserved >= 0) & (reserved < space)]
+        free = space - reserved_inside.size
+        if free < missing.size:
+            raise ValueError(f"{missing.size} identifiers are needed but only "
+                             f"{free} are free in [0, {space}).")
+
+        if 8 * missing.size > free:
+            is_free = np.ones(space, bool)
+            is_free[reserved_inside] = False
+            ids[missing] = self._rng.choice(np.flatnonzero(is_free),
+                                            missing.size, replace=False)
+        else:
+            ids[missing] = self._draw(missing.size, space, reserved)
+        return ids
+
+    def id_space(self, number):
+        """Get the number of possible identifiers for a number of agents.
+
+        :param number: A number of agents.
+        :type number: int
+
+        :returns: The size of the identifier space.
+        :rtype: int
+        """
+        if self._id_space is not None:
+            return self._id_space
+        return max(self.DEFAULT_SPACE, 2 * number)
+
+    def _draw(self, number, space, reserved):
+        # Rejection sampling by batches: at most one eighth of the free
+        # identifiers are drawn, so that few batches are needed.
+        drawn = np.empty(0, np.int64)
+        while drawn.size < number:
+            missing = number - drawn.size
+            candidates = np.concatenate((drawn, self._rng.integers(
+                0, space, missing + missing // 4 + 16)))
+            _, first = np.unique(candidates, return_index=True)
+            candidates = candidates[np.sort(first)]
+            drawn = candidates[~np.isin(candidates, reserved)][:number]
+        return drawn
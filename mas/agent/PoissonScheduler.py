@@ -0,0 +1,75 @@
+from .Scheduler import Scheduler
+import heapq
+import numpy as np
+
+
+class PoissonScheduler(Scheduler):
+    """A scheduler in which every agent has an independent Poisson clock."""
+
+    def __init__(self, rates=1.0):
+        """A scheduler in continuous time: the agent of index i is activated
+        at the rings of a Poisson clock of rate ``rates[i]``, and step s
+        covers the time interval [s - 1, s) of the first step of the
+        scheduler. The next rings of all the clocks are kept in a priority
+        queue, so that a step only visits the agents it activates. An agent
+        whose clock rings several times during a step is activated several
+        times.
+
+        :param rates: Rate of the clock of every agent, or a single rate for
+            all of them.
+            Default to 1.0.
+        :type rates: float or list of float, optional
+        """
+        self._rates = rates
+        self._time = 0.0
+        self._clocks = []
+        self._clocks_number = 0
+
+    def activations(self, simulation):
+        """Activate the agents whose clocks ring during the next unit of
+        time.
+
+        :param simulation: An asynchronous simulation.
+        :type simulation: :class:`mas.agent.Simulation.Simulation`
+
+        :returns: Indices of agents, in order of rings.
+        :rtype: list of int
+        """
+        rng = simulation.rng()
+        number = len(simulation.get_all_agents())
+        if number > self._clocks_number:
+            self._add_clocks(number, rng)
+
+        end = self._time + 1
+        activated = []
+        while len(self._clocks) != 0 and self._clocks[0][0] < end:
+            time, index = self._clocks[0]
+            # Clocks of indices beyond the agents list keep running, but do
+            # not activate anyone.
+            if index < number:
+                activated.append(index)
+            heapq.heapreplace(self._clocks, (
+                time + rng.exponential(1 / self.rate(index)), index))
+        self._time = end
+        return activated
+
+    def rate(self, index):
+        """Get the rate of the clock of an agent.
+
+        :param index: Index of an agent in the agents list.
+        :type index: int
+
+        :returns: A rate.
+        :rtype: float
+        """
+        if np.isscalar(self._rates):
+            return self._rates
+        return self._rates[index]
+
+    def _add_clocks(self, number, rng):
+        indices = np.arange(self._clocks_number, number)
+        rates = np.array([self.rate(i) for i in indices.tolist()])
+        rings = self._time + rng.exponential(1 / rates)
+        for ring, index in zip(rings.tolist(), indices.tolist()):
+            heapq.heappush(self._clocks, (ring, index))
+        self._clocks_number = number
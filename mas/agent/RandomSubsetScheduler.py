@@ -0,0 +1,41 @@
+from .Scheduler import Scheduler
+
+
+class RandomSubsetScheduler(Scheduler):
+    """A scheduler activating every agent with a given probability."""
+
+    def __init__(self, probability=0.7):
+        """A scheduler activating, at each step, every agent independently
+        with probability ``probability``, in a random order. The number of
+        activated agents is drawn first, then the agents themselves, so that
+        the cost of a step does not depend on the agents that are not
+        activated.
+
+        :param probability: Probability of activation of each agent.
+            Default to 0.7.
+        :type probability: float, optional
+        """
+        self._probability = probability
+
+    def activations(self, simulation):
+        """Draw the activated agents with the random generator of the
+        simulation.
+
+        :param simulation: An asynchronous simulation.
+        :type simulation: :class:`mas.agent.Simulation.Simulation`
+
+        :returns: Indices of distinct agents, in a random order.
+        :rtype: list of int
+        """
+        rng = simulation.rng()
+        number = len(simulation.get_all_agents())
+        activated = rng.binomial(number, self._probability)
+        return rng.choice(number, activated, replace=False).tolist()
+
+    def probability(self):
+        """Get the probability of activation of each agent.
+
+        :returns: A probability.
+        :rtype: float
+        """
+        return self._probability
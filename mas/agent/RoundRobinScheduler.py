@@ -0,0 +1,35 @@
+from .Scheduler import Scheduler
+
+
+class RoundRobinScheduler(Scheduler):
+    """A scheduler activating the agents in a fixed cyclic order."""
+
+    def __init__(self, activations_number=None):
+        """A scheduler going through the agents list cyclically: each step
+        activates the ``activations_number`` agents following the last
+        activated one.
+
+        :param activations_number: Number of agents activated per step.
+            Default to None (all the agents).
+        :type activations_number: int, optional
+        """
+        self._activations_number = activations_number
+        self._next = 0
+
+    def activations(self, simulation):
+        """Activate the next agents of the cycle.
+
+        :param simulation: An asynchronous simulation.
+        :type simulation: :class:`mas.agent.Simulation.Simulation`
+
+        :returns: Consecutive indices of agents (modulo their number).
+        :rtype: list of int
+        """
+        number = len(simulation.get_all_agents())
+        if number == 0:
+            return []
+        activated = number if self._activations_number is None else \
+            self._activations_number
+        start = self._next % number
+        self._next = (start + activated) % number
+        return [(start + i) % number for i in range(activated)]
@@ -0,0 +1,18 @@
+class Scheduler:
+    """Base class of the schedulers (or daemons) of asynchronous
+    simulations."""
+
+    def activations(self, simulation):
+        """Choose the agents applying their algorithm during the current
+        step of an asynchronous simulation, and their order.
+
+        :param simulation: An asynchronous simulation.
+        :type simulation: :class:`mas.agent.Simulation.Simulation`
+
+        :returns: Indices of the activated agents in the agents list of the
+            simulation (see
+            :meth:`mas.agent.Simulation.Simulation.get_all_agents`), in order
+            of activation.
+        :rtype: list of int
+        """
+        raise NotImplementedError
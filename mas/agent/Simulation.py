@@ -1,7 +1,13 @@
 from .Agent import Agent
 from .agent_algorithms import *
 from .AgentManager import AgentManager
-import random
+from .encounters import crossings, encounter_flags, meetings
+from .RandomSubsetScheduler import RandomSubsetScheduler
+from mas.graph.graph_memory import container_size, sampled_size
+import heapq
+import math
+import numpy as np
+import time
 from collections import defaultdict
 
 
@@ -21,7 +27,14 @@ class Simulation:
                  anonymous=False,
                  synchronous=True,
                  anonymous_topology=False,
-                 verbose=False):
+                 verbose=False,
+                 check_connectivity=False,
+                 agents_manager_class=AgentManager,
+                 seed=None,
+                 observe_every_round=False,
+                 scheduler=None,
+                 detect_encounters=False,
+                 id_space=None):
         """A Simulation specifying a model and a topology, executing the
         agents's algorithms, and sending requests to an AgentManager.
 
@@ -64,8 +77,65 @@ class Simulation:
             model) methods or when the simulation prevents an agent from moving.
             Default to False.
           :type verbose: boolean, optional
+
+          :param check_connectivity: If set to True, refuse topologies that are
+            not connected (see :meth:`mas.graph.Graph.Graph.is_connected`).
+            Default to False.
+          :type check_connectivity: boolean, optional
+
+          :param agents_manager_class: Class of the agent manager, built as
+            ``agents_manager_class(agents_list, topology,
+            possible_latencies, rng=rng, id_space=id_space)``. Use
+            :class:`mas.agent.ArrayAgentManager.ArrayAgentManager` to store
+            agents data as numpy columns.
+            Default to :class:`mas.agent.AgentManager.AgentManager`.
+          :type agents_manager_class: type, optional
+
+          :param seed: Seed of the random generator of the simulation (see
+            :meth:`rng`), which draws the identifiers, latencies and positions
+            of agents, and the activations of asynchronous steps. Independent
+            seeds for parallel runs are obtained with
+            :meth:`numpy.random.SeedSequence.spawn`.
+            Default to None (fresh entropy).
+          :type seed: int, numpy.random.SeedSequence or
+            numpy.random.Generator, optional
+
+          :param observe_every_round: In the synchronous model, an agent with
+            latency L may only move at steps multiple of L, and its algorithm
+            is only applied at these steps. If set to True, the algorithm of
+            every agent is applied at every step instead (e.g., for
+            algorithms counting rounds).
+            Default to False.
+          :type observe_every_round: boolean, optional
+
+          :param scheduler: Scheduler choosing the agents activated at each
+            step of the asynchronous model (see
+            :class:`mas.agent.Scheduler.Scheduler`).
+            Default to None (a
+            :class:`mas.agent.RandomSubsetScheduler.RandomSubsetScheduler`
+            activating each agent with probability 0.7).
+          :type scheduler: :class:`mas.agent.Scheduler.Scheduler`, optional
+
+          :param detect_encounters: If set to True, the meetings and edge
+            crossings of every synchronous step are detected (see
+            :meth:`encounters`).
+            Default to False.
+          :type detect_encounters: boolean, optional
+
+          :param id_space: Number of possible identifiers of agents (see
+            :class:`mas.agent.IDAllocator.IDAllocator`).
+            Default to None (at least 50000, and twice the number of agents).
+          :type id_space: int, optional
+
+          :raises ValueError: If ``check_connectivity`` is True and the
+            topology is not connected.
         """
+        if check_connectivity and not topology.is_connected():
+            raise ValueError(f"topology is not connected (it has "
+                             f"{topology.components_number()} components).")
+
         self._topology = topology
+        self._weighted = topology.is_weighted()
         self._anonymous = anonymous
         self._anonymous_topology = anonymous_topology
         self._synchronous = synchronous
@@ -73,17 +143,34 @@ class Simulation:
         self._possible_latencies = possible_latencies
 
         self._verbose = verbose
+        self._rng = np.random.default_rng(seed)
 
         self._step = 1
+        self._moves_number = 0
 
         self._agents_list = []
         self._init_agents_list(agents_list, agents_number)
 
-        self._agents_manager = AgentManager(
-            self._agents_list, topology, possible_latencies)
+        self._agents_manager = agents_manager_class(
+            self._agents_list, topology, possible_latencies, rng=self._rng,
+            id_space=id_space)
 
         self._agents_to_move = []
 
+        self._transits = []
+        self._transits_number = 0
+        self._in_transit = set()
+
+        self._observe_every_round = observe_every_round
+        self._scheduler = RandomSubsetScheduler(0.7) if scheduler is None \
+            else scheduler
+
+        self._detect_encounters = detect_encounters
+        self._agents_index = {agent: index
+                              for index, agent in enumerate(self._agents_list)}
+        self._encounters = np.empty((0, 5), np.int64)
+        self._init_latency_wheel()
+
     def _init_agents_list(self, agents_list, agents_number):
         if agents_list is None:
             for _ in range(agents_number):
@@ -93,6 +180,18 @@ class Simulation:
         else:
             self._agents_list = agents_list
 
+    def agents_at(self, vertex):
+        """Get the agents located on a vertex (see
+        :meth:`mas.agent.AgentManager.AgentManager.agents_at`).
+
+        :param vertex: A vertex of the topology.
+        :type vertex: :class:`mas.graph.Vertex.Vertex`
+
+        :returns: The agents on the vertex.
+        :rtype: list
+        """
+        return self._agents_manager.agents_at(vertex)
+
     def anonymous(self):
         """Get the anonymity status of the simulation.
 
@@ -151,6 +250,13 @@ class Simulation:
         If the simulation is synchronous and the move is possible, then the
         agent is added to a list of moves to perform at the end of the step.
 
+        If the edge has a weight w greater than 1 (see
+        :meth:`mas.graph.Graph.Graph.set_edge_weight`), then the agent is in
+        transit during ceil(w) steps: it stays on its position, does not
+        apply its algorithm, and reaches the neighbor at the end of the last
+        of these steps. Weights are only taken into account if the topology
+        was weighted when the simulation was created.
+
         :param agent: A mobile agent.
         :type agent: class:`mas.agent.Agent.Agent`
 
@@ -163,8 +269,12 @@ class Simulation:
         is_moving_legal = self._is_moving_legal(agent, port)
 
         if is_moving_legal:
+            self._moves_number += 1
             self._agents_manager.agent_moved(agent, self._step)
-            if not self.synchronous():
+            duration = self._traversal_duration(agent, port)
+            if duration > 1:
+                self._start_transit(agent, port, duration)
+            elif not self.synchronous():
                 self._agents_manager.move_agent(agent, port)
             else:
                 self._add_to_agents_to_move(agent, port)
@@ -217,6 +327,42 @@ class Simulation:
 
         return self.get_step()
 
+    def count_at(self, vertex):
+        """Get the number of agents located on a vertex.
+
+        :param vertex: A vertex of the topology.
+        :type vertex: :class:`mas.graph.Vertex.Vertex`
+
+        :returns: A number of agents.
+        :rtype: int
+        """
+        return self._agents_manager.count_at(vertex)
+
+    def encounter_flags(self):
+        """Get which agents met another agent during the last step (see
+        :meth:`encounters`).
+
+        :returns: An array indexed like the agents list.
+        :rtype: numpy.array of bool
+        """
+        return encounter_flags(self._encounters, len(self._agents_list))
+
+    def encounters(self):
+        """Get the encounters of the last step, if the simulation was built
+        with ``detect_encounters`` set to True: the pairs of agents sharing a
+        vertex at the end of the step (at least one of them having moved),
+        and the pairs of agents that traversed the same edge in opposite
+        directions. Encounters are only detected in the synchronous model.
+
+        :returns: One row ``(kind, a, b, u, v)`` per encounter, where a and b
+            are indices in the agents list, kind is
+            :data:`mas.agent.encounters.MEETING` (a and b are on u = v) or
+            :data:`mas.agent.encounters.CROSSING` (a went from u to v and b
+            from v to u), see :mod:`mas.agent.encounters`.
+        :rtype: numpy.array of int of shape (k, 5)
+        """
+        return self._encounters
+
     def get_agent(self, id):
         """Get an agent given an identifier.
 
@@ -226,9 +372,7 @@ class Simulation:
         :returns: The agent identified by id if it exists, None otherwise.
         :rtype: class:`mas.agent.Agent.Agent`
         """
-        if id < len(self._agents_list):
-            return self._agents_list[id]
-        return None
+        return self._agents_manager.get_agent_by_id(id)
 
     def get_agents_manager(self):
         """Get the agent manager of this simulation.
@@ -246,6 +390,14 @@ class Simulation:
         """
         return self._agents_list
 
+    def get_scheduler(self):
+        """Get the scheduler of the asynchronous model.
+
+        :returns: The scheduler of the simulation.
+        :rtype: :class:`mas.agent.Scheduler.Scheduler`
+        """
+        return self._scheduler
+
     def get_step(self):
         """Get the current step number.
 
@@ -254,6 +406,41 @@ class Simulation:
         """
         return self._step
 
+    def in_transit(self, agent):
+        """Test whether an agent is traversing a weighted edge.
+
+        :param agent: A mobile agent.
+        :type agent: class:`mas.agent.Agent.Agent`
+
+        :returns: True if the agent is in transit, False otherwise.
+        :rtype: boolean
+        """
+        return agent in self._in_transit
+
+    def memory_usage(self):
+        """Get the memory used by the simulation, broken down by component.
+        The topology, which may be shared by several simulations, is not
+        counted (see :meth:`mas.graph.Graph.Graph.memory_usage`).
+
+        :returns: Numbers of bytes keyed by component: "agents" (agent
+            objects), "agents_list", "agents_to_move", "transits",
+            "agents_manager" (total of
+            :meth:`mas.agent.AgentManager.AgentManager.memory_usage`), and
+            "total".
+        :rtype: dict
+        """
+        report = {
+            "agents": sampled_size(self._agents_list),
+            "agents_list": container_size(self._agents_list),
+            "agents_to_move": container_size(self._agents_to_move) +
+            sampled_size(self._agents_to_move),
+            "transits": container_size(self._transits) +
+            sampled_size(self._transits) + container_size(self._in_transit),
+            "agents_manager": self._agents_manager.memory_usage()["total"],
+        }
+        report["total"] = sum(report.values())
+        return report
+
     def model(self):
         """Get all the informations about the model of the simulation.
 
@@ -281,32 +468,80 @@ class Simulation:
         """
         return self._agents_manager.get_agent_position_contains_mate(agent)
 
-    def step_algo(self):
-        """Run the algorithm of every agent once, according to the model of
-        the simulation. Also increases the step number.
+    def rng(self):
+        """Get the random generator of the simulation. Code drawing random
+        numbers from it keeps runs reproducible from the seed of the
+        simulation.
+
+        :returns: The random generator of the simulation.
+        :rtype: numpy.random.Generator
         """
+        return self._rng
 
-        if self.synchronous():
-            self._init_synchronous_step_algo()
+    def run(self, steps=None, until=None, time_budget=None):
+        """Run the simulation without any display, step after step, until
+        one of the given budgets is exhausted.
 
-        if not self.synchronous():
-            random.shuffle(self._agents_list)
+        :param steps: Maximum number of steps to execute.
+            Default to None (no limit).
+        :type steps: int, optional
 
-        for agent in self._agents_list:
-            if not self.synchronous():
-                if not (random.random() <= 0.7):
-                    id = self._agents_manager.get_agent_id(agent)
-                    self._print_error(f"asynchrony prevented agent "
-                                      f"{id} to apply its "
-                                      f"algorithm this round.")
-                    continue
+        :param until: A predicate of the form ``until(simulation)``, tested
+            after every step; the run stops as soon as it returns True.
+            Default to None.
+        :type until: function, optional
 
-            self._algorithm(agent)
+        :param time_budget: Maximum duration of the run, in seconds. It is
+            checked after every step, so the last step may exceed it.
+            Default to None (no limit).
+        :type time_budget: float, optional
 
-        if self.synchronous():
-            self._agents_manager.move_multiple_agents(self._agents_to_move)
+        :returns: A summary of the run: "steps" (number of executed steps),
+            "moves" (number of moves performed by the agents), "time"
+            (duration in seconds), and "reason" ("steps", "until" or
+            "time_budget").
+        :rtype: dict
 
-        self._step += 1
+        :raises ValueError: If no budget is given.
+        """
+        if steps is None and until is None and time_budget is None:
+            raise ValueError("run needs steps, until or time_budget.")
+
+        if self._synchronous:
+            step = self._synchronous_step
+        else:
+            step = self._asynchronous_step
+        start = time.perf_counter()
+        deadline = None if time_budget is None else start + time_budget
+        moves = self._moves_number
+        done = 0
+        reason = "steps"
+
+        while steps is None or done < steps:
+            step()
+            done += 1
+            if until is not None and until(self):
+                reason = "until"
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                reason = "time_budget"
+                break
+
+        return {
+            "steps": done,
+            "moves": self._moves_number - moves,
+            "time": time.perf_counter() - start,
+            "reason": reason,
+        }
+
+    def step_algo(self):
+        """Run the algorithm of every agent once, according to the model of
+        the simulation. Also increases the step number.
+        """
+        if self._synchronous:
+            self._synchronous_step()
+        else:
+            self._asynchronous_step()
 
     def synchronous(self):
         """Get the synchronicity status of the simulation.
@@ -327,15 +562,68 @@ class Simulation:
     def _add_to_agents_to_move(self, agent, port):
         self._agents_to_move.append((agent, port))
 
-    def _init_synchronous_step_algo(self):
-        self._agents_to_move = []
+    def _asynchronous_step(self):
+        for i in self._scheduler.activations(self):
+            agent = self._agents_list[i]
+            if agent not in self._in_transit:
+                self._algorithm(agent)
+
+        arrivals = self._end_transits()
+        if len(arrivals) != 0:
+            self._agents_manager.move_multiple_agents(arrivals)
+
+        self._step += 1
+
+    def _eligible_agents(self):
+        # Pop from the latency wheel the latencies allowing moves at the
+        # current step, and reschedule them at their next multiple.
+        groups = []
+        while len(self._latency_wheel) != 0 and \
+                self._latency_wheel[0][0] <= self._step:
+            step, latency = heapq.heappop(self._latency_wheel)
+            if step == self._step:
+                groups.append(self._latency_groups[latency])
+            heapq.heappush(self._latency_wheel,
+                           ((self._step // latency + 1) * latency, latency))
+
+        if len(groups) == 0:
+            return []
+        indices = groups[0] if len(groups) == 1 else \
+            np.sort(np.concatenate(groups))
+        return [self._agents_list[i] for i in indices.tolist()]
+
+    def _end_transits(self):
+        # Transits are kept in a heap ordered by arrival steps, so that only
+        # the agents arriving at the current step are visited.
+        arrivals = []
+        while len(self._transits) != 0 and self._transits[0][0] <= self._step:
+            _, _, agent, port = heapq.heappop(self._transits)
+            self._in_transit.discard(agent)
+            arrivals.append((agent, port))
+        return arrivals
+
+    def _init_latency_wheel(self):
+        # Indices of the agents in the agents list, grouped by latency, and a
+        # heap of (next step at which the latency allows moves, latency).
+        groups = defaultdict(list)
+        for index, agent in enumerate(self._agents_list):
+            groups[self._agents_manager.get_agent_latency(agent)].append(index)
+        self._latency_groups = {latency: np.array(indices, np.int64)
+                                for latency, indices in groups.items()}
+        self._latency_wheel = [(-(-self._step // latency) * latency, latency)
+                               for latency in self._latency_groups]
+        heapq.heapify(self._latency_wheel)
 
     def _is_moving_legal(self, agent, port):
         legal = True
 
         agent_position = self._agents_manager.get_agent_position(agent)
         id = self._agents_manager.get_agent_id(agent)
-        if agent_position.get_neighbor_by_port(port) is None:
+        if agent in self._in_transit:
+            legal = False
+            self._print_error(f"warning: agent {id} is in transit.")
+
+        elif agent_position.get_neighbor_by_port(port) is None:
             legal = False
             self._print_error(f"warning: agent {id} is "
                               f"trying to move through non existing port "
@@ -356,6 +644,70 @@ class Simulation:
 
         return legal
 
+    def _move_records(self, moves):
+        # Indices of the moving agents, and identifiers of the vertices they
+        # leave and reach.
+        agents, sources, targets = [], [], []
+        for agent, port in moves:
+            position = self._agents_manager.get_agent_position(agent)
+            agents.append(self._agents_index[agent])
+            sources.append(self._topology.get_vertex_id(position))
+            targets.append(self._topology.get_vertex_id(
+                position.get_neighbor_by_port(port)))
+        return (np.array(agents, np.int64), np.array(sources, np.int64),
+                np.array(targets, np.int64))
+
     def _print_error(self, error_message):
         if self._verbose:
             print(error_message)
+
+    def _round_encounters(self, agents, sources, targets):
+        # Meetings can only happen on the vertices reached during the round.
+        occupants, positions = [], []
+        for ID in np.unique(targets).tolist():
+            vertex = self._topology.get_vertex_by_id(ID)
+            for agent in self._agents_manager.agents_at(vertex):
+                occupants.append(self._agents_index[agent])
+                positions.append(ID)
+        moved = np.isin(occupants, agents)
+        return np.concatenate((meetings(occupants, positions, moved),
+                               crossings(agents, sources, targets)))
+
+    def _start_transit(self, agent, port, duration):
+        self._in_transit.add(agent)
+        heapq.heappush(self._transits, (self._step + duration - 1,
+                                        self._transits_number, agent, port))
+        self._transits_number += 1
+
+    def _synchronous_step(self):
+        self._agents_to_move = []
+
+        if self._observe_every_round:
+            agents = self._agents_list
+        else:
+            agents = self._eligible_agents()
+
+        algorithm = self._algorithm
+        in_transit = self._in_transit
+        for agent in agents:
+            if agent not in in_transit:
+                algorithm(agent)
+
+        moves = self._agents_to_move + self._end_transits()
+        if self._detect_encounters:
+            records = self._move_records(moves)
+            self._agents_manager.move_multiple_agents(moves)
+            self._encounters = self._round_encounters(*records)
+        else:
+            self._agents_manager.move_multiple_agents(moves)
+
+        self._step += 1
+
+    def _traversal_duration(self, agent, port):
+        # Unweighted topologies do not pay for the lookup of the weight.
+        if not self._weighted:
+            return 1
+        position = self._agents_manager.get_agent_position(agent)
+        neighbor = position.get_neighbor_by_port(port)
+        weight = self._topology.edge_weight(position, neighbor)
+        return max(1, math.ceil(weight))
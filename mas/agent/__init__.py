@@ -8,6 +8,15 @@ Module classes
 
     * :class:`mas.agent.Agent.Agent`
     * :class:`mas.agent.AgentManager.AgentManager`
+    * :class:`mas.agent.ArrayAgentManager.ArrayAgentManager`
+    * :class:`mas.agent.BatchSimulation.BatchSimulation`
+    * :class:`mas.agent.IDAllocator.IDAllocator`
+    * :class:`mas.agent.Scheduler.Scheduler`
+    * :class:`mas.agent.FairScheduler.FairScheduler`
+    * :class:`mas.agent.RandomSubsetScheduler.RandomSubsetScheduler`
+    * :class:`mas.agent.RoundRobinScheduler.RoundRobinScheduler`
+    * :class:`mas.agent.AdversarialScheduler.AdversarialScheduler`
+    * :class:`mas.agent.PoissonScheduler.PoissonScheduler`
     * :class:`mas.agent.Simulation.Simulation`
 
 Module content
@@ -26,6 +35,45 @@ Module content
     :members:
     :special-members: __init__
 
+.. autoclass:: mas.agent.ArrayAgentManager.ArrayAgentManager
+    :members:
+    :special-members: __init__
+
+.. autoclass:: mas.agent.BatchSimulation.BatchSimulation
+    :members:
+    :special-members: __init__
+
+.. autoclass:: mas.agent.IDAllocator.IDAllocator
+    :members:
+    :special-members: __init__
+
+.. autoclass:: mas.agent.Scheduler.Scheduler
+    :members:
+
+.. autoclass:: mas.agent.FairScheduler.FairScheduler
+    :members:
+
+.. autoclass:: mas.agent.RandomSubsetScheduler.RandomSubsetScheduler
+    :members:
+    :special-members: __init__
+
+.. autoclass:: mas.agent.RoundRobinScheduler.RoundRobinScheduler
+    :members:
+    :special-members: __init__
+
+.. autoclass:: mas.agent.AdversarialScheduler.AdversarialScheduler
+    :members:
+    :special-members: __init__
+
+.. autoclass:: mas.agent.PoissonScheduler.PoissonScheduler
+    :members:
+    :special-members: __init__
+
+.. automodule:: mas.agent.sweep
+    :members:
+
+.. automodule:: mas.agent.encounters
+    :members:
 """
 
 __author__ = 'Sébastien Ratel'
@@ -34,4 +82,15 @@ __all__ = [
     "Agent",
     "Simulation",
     "AgentManager",
+    "ArrayAgentManager",
+    "BatchSimulation",
+    "IDAllocator",
+    "Scheduler",
+    "FairScheduler",
+    "RandomSubsetScheduler",
+    "RoundRobinScheduler",
+    "AdversarialScheduler",
+    "PoissonScheduler",
+    "sweep",
+    "encounters",
 ]
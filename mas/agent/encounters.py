@@ -0,0 +1,148 @@
+"""Bulk detection of the encounters of a round.
+
+The functions of this module work on the moves of a synchronous round, given
+as arrays: the indices of the moving agents (in the agents list of the
+simulation) and the identifiers of the vertices they leave and reach. They
+return *events*: arrays with one row per pair of agents and five columns,
+``(kind, a, b, u, v)``, where kind is :data:`MEETING` or :data:`CROSSING`.
+
+* A meeting means that agents a and b are on the same vertex u = v at the end
+  of the round, and that at least one of them moved during the round.
+
+* A crossing means that agent a went from u to v while agent b went from v to
+  u, through the same edge, so that they met without sharing a vertex.
+
+Records are sorted, so that the cost of a round is O(m log m) for m records,
+plus the number of reported pairs.
+"""
+
+import numpy as np
+
+MEETING = 0
+CROSSING = 1
+
+
+def crossings(agents, sources, targets):
+    """Find the pairs of agents traversing the same edge in opposite
+    directions.
+
+    :param agents: Indices of the moving agents.
+    :type agents: numpy.array of int
+
+    :param sources: Identifiers of the vertices the agents leave.
+    :type sources: numpy.array of int
+
+    :param targets: Identifiers of the vertices the agents reach.
+    :type targets: numpy.array of int
+
+    :returns: Events ``(CROSSING, a, b, u, v)``, a going from u to v, with
+        u < v.
+    :rtype: numpy.array of int of shape (k, 5)
+    """
+    agents = np.asarray(agents, np.int64)
+    sources = np.asarray(sources, np.int64)
+    targets = np.asarray(targets, np.int64)
+    if agents.size == 0:
+        return _events(CROSSING, agents, agents, agents, agents)
+
+    low = np.minimum(sources, targets)
+    high = np.maximum(sources, targets)
+    backward = (sources > targets).astype(np.int64)
+
+    # Records sorted by edge, then direction: each edge is a group whose
+    # forward moves precede the backward ones.
+    order = np.lexsort((agents, backward, high, low))
+    low, high, backward = low[order], high[order], backward[order]
+    agents = agents[order]
+
+    edge_starts = _group_starts(low, high)
+    edge_ends = np.append(edge_starts[1:], low.size)
+    forward_counts = np.add.reduceat(1 - backward, edge_starts)
+    backward_starts = edge_starts + forward_counts
+    backward_counts = edge_ends - backward_starts
+
+    a, b = _pairs_between(edge_starts, forward_counts,
+                          backward_starts, backward_counts)
+    return _events(CROSSING, agents[a], agents[b], low[a], high[a])
+
+
+def encounter_flags(events, agents_number):
+    """Get which agents take part in at least one event.
+
+    :param events: Events (see :func:`meetings` and :func:`crossings`).
+    :type events: numpy.array of int of shape (k, 5)
+
+    :param agents_number: Number of agents of the simulation.
+    :type agents_number: int
+
+    :returns: An array indexed by agents indices.
+    :rtype: numpy.array of bool
+    """
+    flags = np.zeros(agents_number, bool)
+    flags[events[:, 1]] = True
+    flags[events[:, 2]] = True
+    return flags
+
+
+def meetings(agents, positions, moved):
+    """Find the pairs of agents sharing a vertex, at least one of which
+    moved.
+
+    :param agents: Indices of the agents to consider (e.g., the agents
+        located on the vertices reached during the round).
+    :type agents: numpy.array of int
+
+    :param positions: Identifiers of the positions of these agents.
+    :type positions: numpy.array of int
+
+    :param moved: Whether each of these agents moved during the round.
+    :type moved: numpy.array of bool
+
+    :returns: Events ``(MEETING, a, b, u, u)``, with a < b.
+    :rtype: numpy.array of int of shape (k, 5)
+    """
+    agents = np.asarray(agents, np.int64)
+    positions = np.asarray(positions, np.int64)
+    moved = np.asarray(moved, bool)
+    order = np.lexsort((agents, positions))
+    agents, positions, moved = agents[order], positions[order], moved[order]
+
+    starts = _group_starts(positions)
+    counts = np.diff(np.append(starts, positions.size))
+    a, b = _pairs_between(starts, counts, starts, counts)
+    keep = (a < b) & (moved[a] | moved[b])
+    a, b = a[keep], b[keep]
+    return _events(MEETING, agents[a], agents[b], positions[a], positions[a])
+
+
+def _events(kind, a, b, u, v):
+    events = np.empty((a.size, 5), np.int64)
+    events[:, 0] = kind
+    events[:, 1] = a
+    events[:, 2] = b
+    events[:, 3] = u
+    events[:, 4] = v
+    return events
+
+
+def _group_starts(*keys):
+    # Starts of the runs of equal keys in sorted arrays.
+    if keys[0].size == 0:
+        return np.empty(0, np.int64)
+    change = np.zeros(keys[0].size, bool)
+    change[0] = True
+    for key in keys:
+        change[1:] |= key[1:] != key[:-1]
+    return np.flatnonzero(change)
+
+
+def _pairs_between(starts_a, counts_a, starts_b, counts_b):
+    # For every group g, all the pairs (i, j) with i in
+    # [starts_a[g], starts_a[g] + counts_a[g]) and j in
+    # [starts_b[g], starts_b[g] + counts_b[g]).
+    sizes = counts_a * counts_b
+    groups = np.repeat(np.arange(sizes.size), sizes)
+    ranks = np.arange(groups.size) - np.repeat(np.cumsum(sizes) - sizes,
+                                               sizes)
+    width = counts_b[groups]
+    return starts_a[groups] + ranks // width, starts_b[groups] + ranks % width
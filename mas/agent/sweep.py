@@ -0,0 +1,262 @@
+"""Parallel sweeps over simulation parameters.
+
+A sweep runs one simulation per configuration of a *parameter grid*, i.e., of
+a dictionary associating lists of values to parameter names. Configurations
+are spread across a pool of processes, and the results are streamed back as
+soon as runs finish. Every result is a dictionary with keys "index" (rank of
+the configuration in :func:`expand_grid`), "configuration", "summary" (see
+:meth:`mas.agent.Simulation.Simulation.run`, None if the run failed) and
+"error" (None, or a description of the failure).
+
+Functions given to a sweep (topology factory, algorithms, predicates) are
+sent to the workers, so they must be defined at the top level of a module.
+"""
+
+from .Simulation import Simulation
+from collections import deque
+import itertools
+import multiprocessing
+from multiprocessing.connection import wait
+import numpy as np
+import os
+import random
+import time
+import traceback
+
+# Topologies built by the current worker, keyed by topology keys.
+_topologies = dict()
+
+
+def expand_grid(grid):
+    """List all the configurations of a parameter grid.
+
+    :param grid: Lists of values keyed by parameter names.
+    :type grid: dict
+
+    :returns: One dictionary per element of the cartesian product of the
+        lists, in lexicographic order (the first parameter varies the
+        slowest).
+    :rtype: list of dict
+    """
+    names = list(grid)
+    return [dict(zip(names, values))
+            for values in itertools.product(*(grid[name] for name in names))]
+
+
+def sweep(grid,
+          topology_factory,
+          steps=None,
+          until=None,
+          timeout=None,
+          processes=None,
+          chunksize=1,
+          simulation_class=Simulation,
+          seed=None):
+    """Run a simulation for every configuration of a parameter grid, on a
+    pool of processes.
+
+    The grid must contain a "topology" parameter, whose values are hashable
+    keys passed to ``topology_factory``; each worker builds every topology
+    once and reuses it for all its runs. Every run gets its own random
+    generator: the seed of the simulation is the value of the optional
+    "seed" parameter if any, and otherwise an independent child of
+    ``numpy.random.SeedSequence(seed)`` (see
+    :meth:`mas.agent.Simulation.Simulation.rng`); the :mod:`random` module
+    is also seeded from it, for algorithms using it. Every other parameter
+    (``agents_number``, ``possible_latencies``, ``synchronous``,
+    ``anonymous``, ``algorithm``, ...) is passed to the simulation class.
+
+    Workers stream back the result of every run as soon as it finishes. A
+    run raising an exception only produces an error result. If a worker
+    process dies, only the run it was executing is lost: the worker is
+    replaced, and the next runs of its chunk are sent again to the pool.
+
+    :param grid: Lists of values keyed by parameter names.
+    :type grid: dict
+
+    :param topology_factory: A function of the form ``factory(key)``
+        returning a topology.
+    :type topology_factory: function
+
+    :param steps: Maximum number of steps of each run (see
+        :meth:`mas.agent.Simulation.Simulation.run`).
+        Default to None.
+    :type steps: int, optional
+
+    :param until: A predicate of the form ``until(simulation)`` stopping
+        each run.
+        Default to None.
+    :type until: function, optional
+
+    :param timeout: Maximum duration of each run, in seconds. It is
+        checked between steps, stopping the run with a summary (see
+        :meth:`mas.agent.Simulation.Simulation.run`); a run still busy twice
+        this duration after its start (e.g., stuck in one step or in the
+        topology factory) is killed with its worker and produces an error
+        result.
+        Default to None.
+    :type timeout: float, optional
+
+    :param processes: Number of worker processes.
+        Default to None (the number of processors).
+    :type processes: int, optional
+
+    :param chunksize: Number of runs sent to a worker at once.
+        Default to 1.
+    :type chunksize: int, optional
+
+    :param simulation_class: Class of the simulations.
+        Default to :class:`mas.agent.Simulation.Simulation`.
+    :type simulation_class: type, optional
+
+    :param seed: Entropy of the root seed sequence of the sweep.
+        Default to None (fresh entropy).
+    :type seed: int, optional
+
+    :returns: The results, in order of completion.
+    :rtype: generator of dict
+    """
+    configurations = expand_grid(grid)
+    sequences = np.random.SeedSequence(seed).spawn(len(configurations))
+    runs = [(index, configuration, sequences[index])
+            for index, configuration in enumerate(configurations)]
+    chunks = deque(runs[i:i + chunksize]
+                   for i in range(0, len(runs), chunksize))
+    arguments = (topology_factory, simulation_class, steps, until, timeout)
+    if processes is None:
+        processes = os.cpu_count()
+    kill_after = None if timeout is None else 2 * timeout
+
+    workers = [_start_worker(arguments)
+               for _ in range(min(processes, len(chunks)))]
+    try:
+        while True:
+            for worker in workers:
+                if not worker["runs"] and chunks:
+                    worker["runs"] = deque(chunks.popleft())
+                    worker["started"] = time.perf_counter()
+                    worker["connection"].send(list(worker["runs"]))
+            busy = [worker for worker in workers if worker["runs"]]
+            if not busy:
+                break
+
+            delay = None
+            if kill_after is not None:
+                deadline = min(worker["started"] for worker in busy) + \
+                    kill_after
+                delay = max(0, deadline - time.perf_counter())
+            wait([worker["connection"] for worker in busy] +
+                 [worker["process"].sentinel for worker in busy], delay)
+            for i, worker in enumerate(workers):
+                if not worker["runs"]:
+                    continue
+                if (yield from _receive(worker)):
+                    error = "worker process died"
+                elif (kill_after is not None and worker["runs"] and
+                      time.perf_counter() - worker["started"] > kill_after):
+                    error = f"run killed after {kill_after} seconds"
+                else:
+                    continue
+                yield _result(worker["runs"].popleft(), None, error)
+                workers[i] = _replace_worker(worker, chunks, arguments)
+    finally:
+        for worker in workers:
+            _stop_worker(worker)
+
+
+def _receive(worker):
+    # Yield the results sent by a busy worker, and return True if it died
+    # before finishing its chunk. Liveness is checked first, so that all
+    # the results sent by a dead worker are received.
+    alive = worker["process"].is_alive()
+    try:
+        while worker["runs"] and worker["connection"].poll():
+            result = worker["connection"].recv()
+            worker["runs"].popleft()
+            worker["started"] = time.perf_counter()
+            yield result
+    except EOFError:
+        return True
+    return bool(worker["runs"]) and not alive
+
+
+def _replace_worker(worker, chunks, arguments):
+    # Kill the worker, send the runs left in its chunk again to the pool,
+    # and start a new worker.
+    worker["process"].kill()
+    worker["process"].join()
+    worker["connection"].close()
+    if worker["runs"]:
+        chunks.appendleft(list(worker["runs"]))
+    return _start_worker(arguments)
+
+
+def _result(run, summary, error):
+    index, configuration, _ = run
+    return {
+        "index": index,
+        "configuration": configuration,
+        "summary": summary,
+        "error": error,
+    }
+
+
+def _run_one(configuration, sequence, topology_factory, simulation_class,
+             steps, until, timeout):
+    parameters = dict(configuration)
+    key = parameters.pop("topology")
+    if key not in _topologies:
+        _topologies[key] = topology_factory(key)
+
+    if "seed" in parameters:
+        sequence = np.random.SeedSequence(parameters.pop("seed"))
+    random.seed(int(sequence.generate_state(1)[0]))
+
+    simulation = simulation_class(_topologies[key], seed=sequence,
+                                  **parameters)
+    return simulation.run(steps=steps, until=until, time_budget=timeout)
+
+
+def _run_safely(run, topology_factory, simulation_class, steps, until,
+                timeout):
+    try:
+        summary = _run_one(run[1], run[2], topology_factory,
+                           simulation_class, steps, until, timeout)
+        return _result(run, summary, None)
+    except Exception:
+        return _result(run, None, traceback.format_exc())
+
+
+def _start_worker(arguments):
+    connection, child_connection = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=_work,
+                                      args=(child_connection, arguments),
+                                      daemon=True)
+    process.start()
+    child_connection.close()
+    return {"process": process, "connection": connection, "runs": deque(),
+            "started": None}
+
+
+def _stop_worker(worker):
+    if worker["process"].is_alive():
+        try:
+            worker["connection"].send(None)
+        except OSError:
+            pass
+        worker["process"].join(1)
+        if worker["process"].is_alive():
+            worker["process"].kill()
+            worker["process"].join()
+    worker["connection"].close()
+
+
+def _work(connection, arguments):
+    # Loop of a worker process: run the chunks received until None, sending
+    # back the result of every run as soon as it finishes.
+    while True:
+        chunk = connection.recv()
+        if chunk is None:
+            return
+        for run in chunk:
+            connection.send(_run_safely(run, *arguments))
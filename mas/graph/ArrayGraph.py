@@ -0,0 +1,97 @@
+from .ReadOnlyGraph import ReadOnlyGraph
+from .graph_algorithms import expand
+import numpy as np
+
+
+class ArrayGraph(ReadOnlyGraph):
+    """Read-only topology stored as a port table."""
+
+    def __init__(self, offsets, targets, back_ports, slot_mask=None,
+                 names=None):
+        """A read-only graph whose adjacency is given by a port table (see
+        :meth:`mas.graph.Graph.Graph.port_table`). The arrays are never
+        copied.
+
+        :param offsets: Offsets of the port table.
+        :type offsets: numpy.array of int
+
+        :param targets: Targets of the port table.
+        :type targets: numpy.array of int
+
+        :param back_ports: Back ports of the port table.
+        :type back_ports: numpy.array of int
+
+        :param slot_mask: If not None, only the slots whose value is True in
+            this mask are used.
+            Default to None.
+        :type slot_mask: numpy.array of bool, optional
+
+        :param names: Names of the vertices, indexed by identifiers.
+            Default to None (vertices are named by their identifiers).
+        :type names: numpy.array, optional
+        """
+        ReadOnlyGraph.__init__(self, names=names)
+
+        self._offsets = offsets
+        self._targets = targets
+        self._back_ports = back_ports
+        self._slot_mask = slot_mask
+
+    def order(self):
+        """Get the number of vertices of the graph.
+
+        :returns: The number of vertices of the graph.
+        :rtype: int
+        """
+        return len(self._offsets) - 1
+
+    def size(self):
+        """Get the number of edges of the graph.
+
+        :returns: The number of edges of the graph.
+        :rtype: int
+        """
+        owners = np.repeat(np.arange(len(self._offsets) - 1),
+                           np.diff(self._offsets))
+        used = self._targets >= 0
+        if self._slot_mask is not None:
+            used &= self._slot_mask
+        first = (owners < self._targets) | (self._back_ports < 0)
+        return int(np.count_nonzero(used & first))
+
+    def _frontier_neighbors(self, frontier):
+        slots = expand(self._offsets, frontier)
+        if self._slot_mask is not None:
+            slots = slots[self._slot_mask[slots]]
+        neighbors = self._targets[slots]
+        return neighbors[neighbors >= 0]
+
+    def _ids_number(self):
+        return len(self._offsets) - 1
+
+    def _neighbor_id(self, ID, port):
+        slot = self._offsets[ID] + port
+        if port < 0 or slot >= self._offsets[ID + 1]:
+            return -1
+        if self._slot_mask is not None and not self._slot_mask[slot]:
+            return -1
+        return int(self._targets[slot])
+
+    def _port_to(self, ID, neighbor_ID):
+        start = self._offsets[ID]
+        end = self._offsets[ID + 1]
+        match = self._targets[start:end] == neighbor_ID
+        if self._slot_mask is not None:
+            match &= self._slot_mask[start:end]
+        ports = np.flatnonzero(match)
+        if ports.size == 0:
+            return None
+        return int(ports[0])
+
+    def _ports(self, ID):
+        start = self._offsets[ID]
+        end = self._offsets[ID + 1]
+        used = self._targets[start:end] >= 0
+        if self._slot_mask is not None:
+            used &= self._slot_mask[start:end]
+        return np.flatnonzero(used).tolist()
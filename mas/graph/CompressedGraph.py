@@ -0,0 +1,251 @@
+from .ReadOnlyGraph import ReadOnlyGraph
+from .graph_algorithms import ranges
+import numpy as np
+
+
+class CompressedGraph(ReadOnlyGraph):
+    """Read-only topology with a delta-compressed adjacency."""
+
+    # Header of the binary format: magic number, version, order, number of
+    # edges, number of bytes of the adjacency, size of offsets (4 or 8),
+    # kind of names (1: integers, 2: strings), number of characters of string
+    # names.
+    _MAGIC = 0x4753414d
+    _VERSION = 1
+    _HEADER_LENGTH = 8
+
+    def __init__(self, offsets, data, size, names=None):
+        """A read-only graph whose adjacency is stored as a byte string.
+        For every vertex, the bytes ``offsets[u]`` to ``offsets[u+1] - 1`` of
+        ``data`` contain, encoded as varints (7 bits per byte), its degree,
+        the gaps between its sorted neighbors (the first one relatively to
+        the identifier of the vertex), and the port leading to each of these
+        neighbors. Neighbors are decoded on demand, which costs a little CPU
+        but divides the memory needed by the adjacency by five or more
+        compared to :meth:`mas.graph.Graph.Graph.port_table`.
+        Use :meth:`mas.graph.Graph.Graph.compress` or :meth:`load` to build a
+        compressed graph.
+
+        :param offsets: Offsets of the adjacency of every vertex in ``data``.
+        :type offsets: numpy.array of int
+
+        :param data: Encoded adjacency.
+        :type data: numpy.array of uint8
+
+        :param size: Number of edges.
+        :type size: int
+
+        :param names: Names of the vertices, indexed by identifiers.
+            Default to None (vertices are named by their identifiers).
+        :type names: numpy.array, optional
+        """
+        ReadOnlyGraph.__init__(self, names=names)
+
+        self._offsets = offsets
+        self._data = data
+        self._size = size
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Compress a graph. See :meth:`mas.graph.Graph.Graph.compress`.
+
+        :param graph: The graph to compress.
+        :type graph: :class:`mas.graph.Graph.Graph`
+
+        :returns: The compressed graph.
+        :rtype: :class:`mas.graph.CompressedGraph.CompressedGraph`
+        """
+        port_offsets, targets, _ = graph.port_table()
+        order = graph.order()
+
+        owners = np.repeat(np.arange(order), np.diff(port_offsets))
+        ports = np.arange(len(targets)) - port_offsets[owners]
+        used = targets >= 0
+        owners, neighbors, ports = owners[used], targets[used], ports[used]
+        sort = np.lexsort((ports, neighbors, owners))
+        owners, neighbors, ports = owners[sort], neighbors[sort], ports[sort]
+
+        degrees = np.bincount(owners, minlength=order)
+        firsts = np.cumsum(degrees) - degrees
+        gaps = np.diff(neighbors, prepend=0)
+        heads = firsts[degrees > 0]
+        first_gaps = neighbors[heads] - owners[heads]
+        gaps[heads] = (first_gaps << 1) ^ (first_gaps >> 63)
+
+        counts = 1 + 2 * degrees
+        starts = np.cumsum(counts) - counts
+        ranks = np.arange(len(owners)) - firsts[owners]
+        values = np.empty(counts.sum(), np.int64)
+        values[starts] = degrees
+        values[starts[owners] + 1 + ranks] = gaps
+        values[starts[owners] + 1 + degrees[owners] + ranks] = ports
+
+        data, lengths = _encode_varints(values)
+        bounds = np.concatenate(([0], np.cumsum(lengths)))
+        offsets = bounds[np.concatenate(([0], np.cumsum(counts)))]
+        if offsets[-1] < 2**32:
+            offsets = offsets.astype(np.uint32)
+
+        names, _, _ = cls._names_array(
+            [graph.get_vertex_by_id(ID).name() for ID in range(order)])
+        return cls(offsets, data, graph.size(), names=names)
+
+    @classmethod
+    def load(cls, filename):
+        """Load a compressed graph from a file written by :meth:`save`. The
+        file is memory mapped, so that only the parts of the graph actually
+        visited are read from the disk.
+
+        :param filename: Name of the file to open.
+        :type filename: string
+
+        :returns: The compressed graph.
+        :rtype: :class:`mas.graph.CompressedGraph.CompressedGraph`
+
+        :raises ValueError: If the file is not a compressed graph.
+        """
+        header = np.fromfile(filename, np.int64, cls._HEADER_LENGTH)
+        if (len(header) != cls._HEADER_LENGTH or
+                header[0] != cls._MAGIC or header[1] != cls._VERSION):
+            raise ValueError(f"{filename} is not a compressed graph.")
+        _, _, order, size, nbytes, offsets_size, names_kind, names_length = \
+            header.tolist()
+
+        position = header.nbytes
+        offsets_dtype = np.uint32 if offsets_size == 4 else np.int64
+        offsets = np.memmap(filename, offsets_dtype, "r", position,
+                            (order + 1,))
+        position += offsets.nbytes
+        names_dtype = np.int64 if names_kind == 1 else f"<U{names_length}"
+        names = np.memmap(filename, names_dtype, "r", position, (order,))
+        position += names.nbytes
+        data = np.memmap(filename, np.uint8, "r", position, (nbytes,)) \
+            if nbytes != 0 else np.empty(0, np.uint8)
+
+        return cls(offsets, data, size, names=names)
+
+    def nbytes(self):
+        """Get the memory used by the adjacency of the graph.
+
+        :returns: A number of bytes.
+        :rtype: int
+        """
+        return self._offsets.nbytes + self._data.nbytes
+
+    def order(self):
+        """Get the number of vertices of the graph.
+
+        :returns: The number of vertices of the graph.
+        :rtype: int
+        """
+        return len(self._offsets) - 1
+
+    def save(self, filename):
+        """Write the graph in a binary file, which can be memory mapped by
+        :meth:`load`.
+
+        :param filename: Name of the output file.
+        :type filename: string
+        """
+        names = self._names
+        if names is None:
+            names = np.arange(self.order(), dtype=np.int64)
+        names_kind = 1 if names.dtype == np.int64 else 2
+        header = np.array([
+            self._MAGIC, self._VERSION, self.order(), self._size,
+            len(self._data), self._offsets.dtype.itemsize, names_kind,
+            names.dtype.itemsize // 4 if names_kind == 2 else 0
+        ], np.int64)
+
+        with open(filename, "wb") as f:
+            for array in (header, self._offsets, names, self._data):
+                f.write(np.ascontiguousarray(array).tobytes())
+
+    def size(self):
+        """Get the number of edges of the graph.
+
+        :returns: The number of edges of the graph.
+        :rtype: int
+        """
+        return self._size
+
+    def _decode(self, frontier):
+        # Decode the adjacency of several vertices: returns, for all their
+        # neighbors, the vertex they are adjacent to, their identifier and
+        # the port leading to them.
+        starts = self._offsets[frontier].astype(np.int64)
+        lengths = self._offsets[frontier + 1].astype(np.int64) - starts
+        data = self._data[ranges(starts, lengths)]
+        values = _decode_varints(data)
+
+        ends = data < 0x80
+        vertices = np.repeat(np.arange(len(frontier)), lengths)
+        counts = np.bincount(vertices[ends], minlength=len(frontier))
+        value_starts = np.cumsum(counts) - counts
+
+        degrees = values[value_starts]
+        gaps = values[ranges(value_starts + 1, degrees)]
+        ports = values[ranges(value_starts + 1 + degrees, degrees)]
+        owners = np.repeat(frontier, degrees)
+
+        firsts = (np.cumsum(degrees) - degrees)[degrees > 0]
+        gaps[firsts] = (gaps[firsts] >> 1) ^ -(gaps[firsts] & 1)
+        sums = np.cumsum(gaps)
+        bases = np.repeat((sums[firsts] - gaps[firsts]), degrees[degrees > 0])
+        neighbors = sums - bases + owners
+
+        return owners, neighbors, ports
+
+    def _frontier_neighbors(self, frontier):
+        _, neighbors, _ = self._decode(frontier)
+        return neighbors
+
+    def _neighbor_id(self, ID, port):
+        _, neighbors, ports = self._decode(np.array([ID]))
+        match = np.flatnonzero(ports == port)
+        if match.size == 0:
+            return -1
+        return int(neighbors[match[0]])
+
+    def _port_to(self, ID, neighbor_ID):
+        _, neighbors, ports = self._decode(np.array([ID]))
+        match = np.flatnonzero(neighbors == neighbor_ID)
+        if match.size == 0:
+            return None
+        return int(ports[match].min())
+
+    def _ports(self, ID):
+        _, _, ports = self._decode(np.array([ID]))
+        return sorted(ports.tolist())
+
+
+def _encode_varints(values):
+    # Encode non-negative integers with 7 bits per byte, the highest bit of a
+    # byte being set if the integer continues on the next byte. Returns the
+    # bytes and the number of bytes of every integer.
+    lengths = np.ones(len(values), np.int64)
+    rest = values >> 7
+    while rest.any():
+        lengths += rest > 0
+        rest >>= 7
+
+    repeated = np.repeat(values, lengths)
+    shifts = 7 * (np.arange(lengths.sum()) -
+                  np.repeat(np.cumsum(lengths) - lengths, lengths))
+    last = np.zeros(lengths.sum(), bool)
+    last[np.cumsum(lengths) - 1] = True
+    data = ((repeated >> shifts) & 0x7f) | np.where(last, 0, 0x80)
+    return data.astype(np.uint8), lengths
+
+
+def _decode_varints(data):
+    # Decode a byte string produced by _encode_varints.
+    ends = np.flatnonzero(data < 0x80)
+    starts = np.concatenate(([0], ends[:-1] + 1)) if len(ends) != 0 \
+        else np.empty(0, np.int64)
+    lengths = ends - starts + 1
+    shifts = 7 * (np.arange(len(data)) - np.repeat(starts, lengths))
+    chunks = (data & 0x7f).astype(np.int64) << shifts
+    if len(chunks) == 0:
+        return np.empty(0, np.int64)
+    return np.add.reduceat(chunks, starts)
@@ -0,0 +1,134 @@
+from .ArrayGraph import ArrayGraph
+from multiprocessing import shared_memory
+import numpy as np
+
+
+class FrozenGraph(ArrayGraph):
+    """Immutable graph stored in shared memory."""
+
+    # Header: order, number of slots, kind of names (0: none, 1: integers,
+    # 2: strings), number of characters of string names.
+    _HEADER_LENGTH = 4
+
+    def __init__(self, shm):
+        """A read-only graph whose port table (see
+        :meth:`mas.graph.Graph.Graph.port_table`) and vertex names live in a
+        shared memory block. Every process attached to the block reads the
+        same memory, without any copy or deserialization.
+        Use :meth:`mas.graph.Graph.Graph.freeze` to create a frozen graph, and
+        :meth:`attach` (or pickling, which only transmits the name of the
+        block) to use it from other processes.
+
+        :param shm: The shared memory block containing the graph.
+        :type shm: multiprocessing.shared_memory.SharedMemory
+        """
+        self._shm = shm
+
+        header = self._array(np.int64, self._HEADER_LENGTH, 0)
+        order, slots, names_kind, names_length = header.tolist()
+        position = header.nbytes
+
+        offsets = self._array(np.int64, order + 1, position)
+        position += offsets.nbytes
+        targets = self._array(np.int64, slots, position)
+        position += targets.nbytes
+        back_ports = self._array(np.int64, slots, position)
+        position += back_ports.nbytes
+
+        names = None
+        if names_kind == 1:
+            names = self._array(np.int64, order, position)
+        elif names_kind == 2:
+            names = self._array(f"<U{names_length}", order, position)
+
+        ArrayGraph.__init__(self, offsets, targets, back_ports, names=names)
+
+    @classmethod
+    def attach(cls, name):
+        """Attach to a frozen graph created by an other process.
+
+        :param name: Name of the shared memory block of the graph (see
+            :meth:`name`).
+        :type name: string
+
+        :returns: The frozen graph.
+        :rtype: :class:`mas.graph.FrozenGraph.FrozenGraph`
+        """
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:  # pragma: no cover (Python < 3.13)
+            shm = shared_memory.SharedMemory(name=name)
+        return cls(shm)
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Copy a graph into a new shared memory block.
+        See :meth:`mas.graph.Graph.Graph.freeze`.
+
+        :param graph: The graph to freeze.
+        :type graph: :class:`mas.graph.Graph.Graph`
+
+        :returns: The frozen graph.
+        :rtype: :class:`mas.graph.FrozenGraph.FrozenGraph`
+        """
+        offsets, targets, back_ports = graph.port_table()
+        order = graph.order()
+        names, names_kind, names_length = cls._names_array(
+            [graph.get_vertex_by_id(ID).name() for ID in range(order)])
+
+        header = np.array([order, len(targets), names_kind, names_length],
+                          np.int64)
+        arrays = [header, offsets, targets, back_ports, names]
+        size = sum(array.nbytes for array in arrays)
+
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        position = 0
+        for array in arrays:
+            view = np.ndarray(array.shape, array.dtype, shm.buf, position)
+            view[...] = array
+            position += array.nbytes
+        del view
+
+        return cls(shm)
+
+    def close(self):
+        """Detach the current process from the graph, which must not be
+        used afterwards. The shared memory block still exists until
+        :meth:`unlink` is called.
+        """
+        self._offsets = None
+        self._targets = None
+        self._back_ports = None
+        self._names = None
+        self._shm.close()
+
+    def name(self):
+        """Get the name of the shared memory block of the graph.
+
+        :returns: A name to pass to :meth:`attach`.
+        :rtype: string
+        """
+        return self._shm.name
+
+    def nbytes(self):
+        """Get the size of the shared memory block of the graph.
+
+        :returns: A number of bytes.
+        :rtype: int
+        """
+        return self._shm.size
+
+    def unlink(self):
+        """Free the shared memory block of the graph. This must be called
+        once, by the process which froze the graph, when no process needs it
+        anymore.
+        """
+        self._shm.unlink()
+
+    def _array(self, dtype, length, position):
+        array = np.ndarray(length, dtype, self._shm.buf, position)
+        array.flags.writeable = False
+        return array
+
+    def __reduce__(self):
+        return (FrozenGraph.attach, (self.name(),))
@@ -1,6 +1,13 @@
 from .Vertex import Vertex
+from .CompressedGraph import CompressedGraph
+from .FrozenGraph import FrozenGraph
+from .graph_algorithms import (ball, bfs, components, dijkstra,
+                               locality_ordering, port_labeling)
+from .graph_memory import arrays_size, container_size, sampled_size
+import hashlib
 import numpy as np
 import networkx as nx
+import random
 
 
 class Graph:
@@ -22,7 +29,28 @@ class Graph:
         self._adjacency_matrix = np.empty(0, int)
         self._is_planar = False
 
+        self._port_table_computed = False
+        self._port_offsets = np.zeros(1, np.int64)
+        self._port_targets = np.empty(0, np.int64)
+        self._port_back = np.empty(0, np.int64)
+        self._port_edge_ids = np.empty(0, np.int64)
+        self._edge_array = np.empty((0, 2), np.int64)
+
+        self._routing_tables = dict()
+        self._distance_rows = dict()
+        self._balls = dict()
+
+        self._components_computed = True
+        self._components_number = 0
+        self._component_parent = dict()
+        self._component_size = dict()
+
+        self._fingerprint = None
+        self._cache = None
+
         self._edges = set()
+        self._edge_weights = dict()
+        self._edge_weight_array = np.empty(0, float)
 
         self._diameter = 0
         self._order = 0
@@ -57,6 +85,8 @@ class Graph:
         if success:
             self._edges.add((u, v))
             self._untoggle_computed()
+            if self._components_computed:
+                self._union(u, v)
 
         return success
 
@@ -78,6 +108,10 @@ class Graph:
 
             self._order += 1
             self._untoggle_computed()
+            if self._components_computed:
+                self._component_parent[vertex] = vertex
+                self._component_size[vertex] = 1
+                self._components_number += 1
             return True
         return False
 
@@ -92,10 +126,87 @@ class Graph:
         self._compute_adjacency_matrix()
         return self._adjacency_matrix
 
+    def ball(self, vertex, radius):
+        """Get the vertices at distance at most ``radius`` from a vertex.
+        Balls are computed by a bounded breadth first search and kept until
+        the graph is modified.
+
+        :param vertex: Any vertex of the graph.
+        :type vertex: :class:`mas.graph.Vertex.Vertex`
+
+        :param radius: Radius of the ball.
+        :type radius: int
+
+        :returns: The identifiers of the vertices of the ball, sorted by
+            distance to ``vertex``, then by identifier. The array is shared
+            with the internal caches of the graph and is read-only.
+        :rtype: numpy.array of int
+        """
+        return self._ball(self._vertexToID[vertex], radius, None)
+
+    def balls(self, vertices, radius):
+        """Get the balls of a given radius around several vertices at once,
+        e.g., the positions of all the agents of a simulation. Searches share
+        a single visited array, and every ball is computed only once.
+
+        :param vertices: Vertices of the graph.
+        :type vertices: list of :class:`mas.graph.Vertex.Vertex`
+
+        :param radius: Radius of the balls.
+        :type radius: int
+
+        :returns: The balls around every vertex of ``vertices``, as in
+            :meth:`ball`.
+        :rtype: list of numpy.array
+        """
+        visited = np.zeros(self.order(), bool)
+        return [self._ball(self._vertexToID[vertex], radius, visited)
+                for vertex in vertices]
+
+    def component_labels(self):
+        """Get the connected component of every vertex.
+
+        :returns: An array indexed by vertex identifiers, containing labels
+            between 0 and ``components_number() - 1``. Two vertices have the
+            same label if and only if they belong to the same connected
+            component.
+        :rtype: numpy.array of int
+        """
+        self._compute_components()
+        labels = np.empty(self.order(), np.int64)
+        roots = dict()
+        for vertex, ID in self._vertexToID.items():
+            labels[ID] = roots.setdefault(self._find(vertex), len(roots))
+        return labels
+
+    def components_number(self):
+        """Get the number of connected components of the graph.
+
+        :returns: The number of connected components.
+        :rtype: int
+        """
+        self._compute_components()
+        return self._components_number
+
+    def compress(self):
+        """Build an immutable snapshot of the graph whose adjacency is
+        delta-compressed (see
+        :class:`mas.graph.CompressedGraph.CompressedGraph`), for topologies
+        too large to be held as objects or port tables. The
+        snapshot can be written to disk and memory mapped back with
+        :meth:`mas.graph.CompressedGraph.CompressedGraph.save` and
+        :meth:`mas.graph.CompressedGraph.CompressedGraph.load`.
+
+        :returns: The compressed graph.
+        :rtype: :class:`mas.graph.CompressedGraph.CompressedGraph`
+        """
+        return CompressedGraph.from_graph(self)
+
     def diameter(self):
         """Get the maximum distance between two vertices.
 
-        :returns: The diameter of the graph.
+        :returns: The diameter of the graph (``INFTY`` if the graph is not
+            connected, see :meth:`is_connected`).
         :rtype: int
         """
         if (not self._distance_matrix_computed):
@@ -130,6 +241,94 @@ class Graph:
         self._compute_distance_matrix()
         return self._distance_matrix
 
+    def distances(self, sources, targets):
+        """Get the distances between several pairs of vertices at once.
+        The distance matrix is used if it is already computed, otherwise the
+        rows needed are computed by breadth first searches and kept until the
+        graph is modified (the graph is assumed to be undirected).
+
+        :param sources: Identifiers of vertices of the graph.
+        :type sources: numpy.array of int
+
+        :param targets: Identifiers of vertices of the graph, broadcastable
+            against ``sources``.
+        :type targets: numpy.array of int
+
+        :returns: The distances between ``sources[i]`` and ``targets[i]``,
+            for every i.
+        :rtype: numpy.array of float
+        """
+        sources, targets = np.broadcast_arrays(
+            np.asarray(sources, np.int64), np.asarray(targets, np.int64))
+        if self._distance_matrix_computed:
+            return self._distance_matrix[sources, targets]
+
+        sources_ids, sources_inverse = np.unique(sources, return_inverse=True)
+        targets_ids, targets_inverse = np.unique(targets, return_inverse=True)
+        if len(targets_ids) < len(sources_ids):
+            sources, targets = targets, sources
+            sources_ids, sources_inverse = targets_ids, targets_inverse
+
+        rows = self._distance_rows_stack(sources_ids)
+        return rows[sources_inverse.reshape(sources.shape), targets]
+
+    def distances_from(self, source):
+        """Get the distances from a vertex to every vertex of the graph.
+
+        :param source: Identifier of a vertex of the graph.
+        :type source: int
+
+        :returns: An array indexed by vertex identifiers. It is shared with
+            the internal caches of the graph and must not be modified.
+        :rtype: numpy.array of float
+        """
+        if self._distance_matrix_computed:
+            return self._distance_matrix[source]
+        if source not in self._distance_rows:
+            self._bfs(source)
+        return self._distance_rows[source]
+
+    def edge_array(self):
+        """Get all the edges of the graph as an array of vertex identifiers.
+        The index of an edge in this array is its identifier, e.g., in the
+        edge masks of :class:`mas.graph.GraphView.GraphView`. Edges are sorted
+        by their extremities, so identifiers only change when the graph does.
+
+        :returns: An array of shape (number of edges, 2) whose rows are the
+            identifiers (lowest first) of the extremities of every edge.
+        :rtype: numpy.array of int
+        """
+        self._compute_port_table()
+        return self._edge_array
+
+    def edge_weight(self, u, v):
+        """Get the weight of an edge (1 unless set by
+        :meth:`set_edge_weight`).
+
+        :param u: First extremity of the edge.
+        :type u: :class:`mas.graph.Vertex.Vertex`
+
+        :param v: Second extremity of the edge.
+        :type v: :class:`mas.graph.Vertex.Vertex`
+
+        :returns: The weight of the edge, None if u and v are not adjacent.
+        :rtype: float
+        """
+        if v not in u.get_neighbors():
+            return None
+        return self._edge_weights.get(frozenset((u, v)), 1)
+
+    def edge_weights(self):
+        """Get the weights of all the edges of the graph, as an array
+        aligned with :meth:`edge_array`.
+
+        :returns: An array whose i-th entry is the weight of the edge of
+            identifier i.
+        :rtype: numpy.array of float
+        """
+        self._compute_port_table()
+        return self._edge_weight_array
+
     def edges(self):
         """Get all the edges of the graph.
 
@@ -138,6 +337,44 @@ class Graph:
         """
         return self._edges
 
+    def fingerprint(self):
+        """Get a structural fingerprint of the graph: a hash of its edges
+        and of its port table (see :meth:`port_table`). Two graphs have the
+        same fingerprint if and only if (up to hash collisions) they have the
+        same vertex identifiers, edges and ports, whatever the names of their
+        vertices. Note that ports changed directly on vertices (e.g., with
+        :meth:`mas.graph.Vertex.Vertex.reset_port_associations`) after the
+        fingerprint was computed are not taken into account.
+
+        :returns: A hexadecimal SHA-256 digest.
+        :rtype: string
+        """
+        if self._fingerprint is None:
+            self._compute_port_table()
+            digest = hashlib.sha256()
+            for array in (self._edge_array,
+                          self._port_offsets,
+                          self._port_targets):
+                array = np.ascontiguousarray(array, np.int64)
+                digest.update(np.int64(array.size).tobytes())
+                digest.update(array.tobytes())
+            if self.is_weighted():
+                digest.update(self._edge_weight_array.tobytes())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def freeze(self):
+        """Copy the graph into shared memory, as an immutable array-backed
+        snapshot. Worker processes can then attach to it without copying it
+        (see :class:`mas.graph.FrozenGraph.FrozenGraph`), so that N processes
+        use a single topology in RAM.
+
+        :returns: The frozen graph. The caller is responsible for calling its
+            :meth:`mas.graph.FrozenGraph.FrozenGraph.unlink` method.
+        :rtype: :class:`mas.graph.FrozenGraph.FrozenGraph`
+        """
+        return FrozenGraph.from_graph(self)
+
     def get_vertex_by_id(self, ID):
         """Get the vertex uniquely associated to an identifier.
 
@@ -273,6 +510,28 @@ class Graph:
             u = self.get_vertex_by_name(nameU)
             v = self.get_vertex_by_name(nameV)
             self.add_edge(u, v)
+            weight = graph.edge_weight(edge[0], edge[1])
+            if weight != 1:
+                self.set_edge_weight(u, v, weight)
+
+    def is_connected(self):
+        """Connectivity test of the graph.
+
+        :returns: True if the graph has at most one connected component, False
+            otherwise.
+        :rtype: boolean
+        """
+        return self.components_number() <= 1
+
+    def is_weighted(self):
+        """Test whether some edges of the graph have a weight different
+        from 1. Distances, shortest paths and routing tables take weights
+        into account, balls do not.
+
+        :returns: True if the graph is weighted, False otherwise.
+        :rtype: boolean
+        """
+        return len(self._edge_weights) != 0
 
     def is_planar(self):
         """ Planarity test of the graph.
@@ -283,6 +542,64 @@ class Graph:
         self._compute_is_planar()
         return self._is_planar
 
+    def memory_usage(self):
+        """Get the memory used by the graph, broken down by component.
+        Arrays are measured exactly, and collections of objects are
+        estimated from samples (see :mod:`mas.graph.graph_memory`).
+
+        :returns: Numbers of bytes keyed by component: "vertices" (vertex
+            objects and their adjacency lists), "vertex_to_id",
+            "id_to_vertex", "name_to_vertex", "edges", "edge_weights",
+            "adjacency_matrix", "distance_matrix", "port_table",
+            "distance_rows", "routing_tables", "balls", "components", and
+            "total".
+        :rtype: dict
+        """
+        report = {
+            "vertices": sampled_size(self._vertexToID),
+            "vertex_to_id": container_size(self._vertexToID),
+            "id_to_vertex": container_size(self._IDToVertex),
+            "name_to_vertex": container_size(self._nameToVertex) +
+            sampled_size(self._nameToVertex),
+            "edges": container_size(self._edges) + sampled_size(self._edges),
+            "edge_weights": container_size(self._edge_weights) +
+            sampled_size(self._edge_weights),
+            "adjacency_matrix": arrays_size([self._adjacency_matrix]),
+            "distance_matrix": arrays_size([self._distance_matrix]),
+            "port_table": arrays_size([
+                self._port_offsets, self._port_targets, self._port_back,
+                self._port_edge_ids, self._edge_array,
+                self._edge_weight_array]),
+            "distance_rows": arrays_size(self._distance_rows.values()),
+            "routing_tables": arrays_size(self._routing_tables.values()),
+            "balls": arrays_size(self._balls.values()),
+            "components": container_size(self._component_parent) +
+            container_size(self._component_size),
+        }
+        report["total"] = sum(report.values())
+        return report
+
+    def next_port(self, u, target):
+        """Get a port leading one step closer to a target vertex along a
+        shortest path. The routing table towards ``target`` is built on the
+        first call (see :meth:`routing_table`), further calls are O(1).
+
+        :param u: Any vertex of the graph.
+        :type u: :class:`mas.graph.Vertex.Vertex`
+
+        :param target: Any vertex of the graph.
+        :type target: :class:`mas.graph.Vertex.Vertex`
+
+        :returns: A port of u leading to a neighbor of u closer to target.
+            None if u is target or if target cannot be reached from u.
+        :rtype: int
+        """
+        table = self.routing_table(target)
+        port = table[self._vertexToID[u]]
+        if port == np.iinfo(table.dtype).max:
+            return None
+        return int(port)
+
     def order(self):
         """Get the number of vertices of the graph.
 
@@ -291,6 +608,94 @@ class Graph:
         """
         return self._order
 
+    def pairwise_distances(self, IDs):
+        """Get the distances between every two vertices of a set, e.g., the
+        positions of all the agents of a simulation.
+
+        :param IDs: Identifiers of vertices of the graph.
+        :type IDs: numpy.array of int
+
+        :returns: The matrix whose entry (i, j) is the distance between
+            ``IDs[i]`` and ``IDs[j]``.
+        :rtype: numpy.array of float
+        """
+        IDs = np.asarray(IDs, np.int64)
+        if self._distance_matrix_computed:
+            return self._distance_matrix[np.ix_(IDs, IDs)]
+
+        unique_ids, inverse = np.unique(IDs, return_inverse=True)
+        rows = self._distance_rows_stack(unique_ids)
+        return rows[inverse][:, IDs]
+
+    def port_edge_ids(self):
+        """Get the edge behind every slot of the port table (see
+        :meth:`port_table`).
+
+        :returns: An array aligned with the ``targets`` of the port table,
+            containing the identifier of the edge of every slot (see
+            :meth:`edge_array`), -1 for unused ports. It is shared with the
+            internal caches of the graph and must not be modified.
+        :rtype: numpy.array of int
+        """
+        self._compute_port_table()
+        return self._port_edge_ids
+
+    def port_table(self):
+        """Compute (if needed) and get the port table of the graph, that is
+        the adjacency of the graph stored as flat arrays indexed by vertex
+        identifiers and ports. For every vertex identifier ``u`` and every
+        port ``p`` of the corresponding vertex, the slot ``offsets[u] + p`` of
+        ``targets`` contains the identifier of the neighbor reached through
+        ``p``, and the same slot of ``back_ports`` contains the port of this
+        neighbor leading back to ``u``. Unused ports lead to -1.
+
+        :returns: The arrays ``offsets`` (of length ``order() + 1``),
+            ``targets`` and ``back_ports``.
+        :rtype: tuple of numpy.array
+        """
+        self._compute_port_table()
+        return self._port_offsets, self._port_targets, self._port_back
+
+    def random_vertex(self, rng=None):
+        """Pick a vertex of the graph uniformly at random, without listing
+        all of them.
+
+        :param rng: Random generator.
+            Default to None (the :mod:`random` module is used).
+        :type rng: numpy.random.Generator, optional
+
+        :returns: A vertex of the graph.
+        :rtype: :class:`mas.graph.Vertex.Vertex`
+        """
+        if rng is None:
+            return self._IDToVertex[random.randrange(self._order)]
+        return self._IDToVertex[int(rng.integers(self._order))]
+
+    def relabel_ports(self, method="random", rng=None):
+        """Draw new port numbers for all the vertices at once, e.g., to
+        sample labelings for anonymous graph algorithms. Every vertex of
+        degree d gets the ports 0 to d - 1. See
+        :func:`mas.graph.graph_algorithms.port_labeling`.
+
+        :param method: "random", "sorted" or "rotation".
+            Default to "random".
+        :type method: string, optional
+
+        :param rng: Random generator.
+            Default to None (a new generator is created).
+        :type rng: numpy.random.Generator, optional
+
+        :returns: The new labeling, i.e., the offsets and targets of the new
+            port table (see :meth:`port_table`). It can be applied again
+            later with :meth:`set_port_labeling`.
+        :rtype: tuple of numpy.array
+        """
+        self._compute_port_table()
+        offsets, targets = port_labeling(
+            self._port_offsets, self._port_targets, method, rng)
+        self._apply_port_labeling(offsets, targets)
+        return offsets, targets
+
     def remove_edge(self, u, v):
         """Remove an edge from the graph.
 
@@ -322,7 +727,9 @@ class Graph:
                 self._edges.remove((u, v))
             else:
                 self._edges.remove((v, u))
+            self._edge_weights.pop(frozenset((u, v)), None)
             self._untoggle_computed()
+            self._components_computed = False
 
         return success
 
@@ -347,11 +754,94 @@ class Graph:
 
             for u in vertex.get_neighbors():
                 u.remove_neighbor(vertex)
+                self._edge_weights.pop(frozenset((u, vertex)), None)
 
             self._untoggle_computed()
+            self._components_computed = False
             return True
         return False
 
+    def reorder(self, method="rcm"):
+        """Renumber the vertices so that neighbors get close identifiers,
+        which improves the memory locality of every array indexed by vertex
+        identifiers (port table, matrices, distance rows, agents positions,
+        ...). Names and ports are not modified. This is meant to be called
+        once, right after loading or generating a topology.
+
+        :param method: Ordering method: "rcm" (Reverse Cuthill-McKee), "bfs"
+            or "degree". See
+            :func:`mas.graph.graph_algorithms.locality_ordering`.
+            Default to "rcm".
+        :type method: string, optional
+
+        :returns: The permutation applied: the vertex of new identifier i had
+            identifier ``perm[i]`` before the call.
+        :rtype: numpy.array of int
+        """
+        self._compute_port_table()
+        perm = locality_ordering(
+            self._port_offsets, self._port_targets, method)
+        inverse = np.empty_like(perm)
+        inverse[perm] = np.arange(len(perm))
+
+        vertices = {ID: vertex for vertex, ID in self._vertexToID.items()}
+        self._vertexToID = dict()
+        self._IDToVertex = dict()
+        for ID, oldID in enumerate(perm.tolist()):
+            self._vertexToID[vertices[oldID]] = ID
+            self._IDToVertex[ID] = vertices[oldID]
+
+        if self._adjacency_matrix_computed:
+            self._adjacency_matrix = self._adjacency_matrix[np.ix_(perm, perm)]
+        if self._distance_matrix_computed:
+            self._distance_matrix = self._distance_matrix[np.ix_(perm, perm)]
+        self._routing_tables = {inverse[ID]: table[perm]
+                                for ID, table in self._routing_tables.items()}
+        self._distance_rows = {inverse[ID]: row[perm]
+                               for ID, row in self._distance_rows.items()}
+        self._balls = dict()
+        self._port_table_computed = False
+        self._fingerprint = None
+
+        return perm
+
+    def routing_table(self, target):
+        """Compute (if needed) and get the routing table towards a vertex.
+        It is built by a single breadth first search from ``target`` and kept
+        until the graph is modified.
+
+        :param target: Any vertex of the graph.
+        :type target: :class:`mas.graph.Vertex.Vertex`
+
+        :returns: An array indexed by vertex identifiers, containing for each
+            vertex a port leading one step closer to ``target``. Its dtype is
+            the smallest unsigned integer type fitting every port of the graph
+            (uint8 or uint16, in general), and its maximum value stands for
+            "no port" (``target`` itself and unreachable vertices).
+        :rtype: numpy.array
+        """
+        ID = self._vertexToID[target]
+        if ID not in self._routing_tables:
+            self._compute_routing_table(ID)
+        return self._routing_tables[ID]
+
+    def same_component(self, u, v):
+        """Test whether two vertices belong to the same connected component.
+        Components are maintained incrementally when edges are added, and
+        recomputed from scratch only after a removal.
+
+        :param u: Any vertex of the graph.
+        :type u: :class:`mas.graph.Vertex.Vertex`
+
+        :param v: Any vertex of the graph.
+        :type v: :class:`mas.graph.Vertex.Vertex`
+
+        :returns: True if there is a path between u and v, False otherwise.
+        :rtype: boolean
+        """
+        self._compute_components()
+        return self._find(u) is self._find(v)
+
     def save(self, filename, ids="graph"):
         """Exports the graph to a txt file.
 
@@ -388,6 +878,87 @@ class Graph:
         with open(filename, "w") as f:
             f.write(str)
 
+    def set_cache(self, cache):
+        """Use an on-disk cache for the adjacency matrix, the distance
+        matrix, the diameter and the planarity of the graph: they are loaded
+        from the cache when available, and stored in it once computed. Since
+        the ``init_from_*`` methods reset the graph, the cache must be set
+        after them.
+
+        :param cache: The cache to use, or None to stop using one.
+        :type cache: :class:`mas.graph.GraphCache.GraphCache`
+        """
+        self._cache = cache
+
+    def set_edge_weight(self, u, v, weight):
+        """Set the weight of an edge, e.g., the number of rounds an agent
+        needs to traverse it (see :class:`mas.agent.Simulation.Simulation`).
+
+        :param u: First extremity of the edge.
+        :type u: :class:`mas.graph.Vertex.Vertex`
+
+        :param v: Second extremity of the edge.
+        :type v: :class:`mas.graph.Vertex.Vertex`
+
+        :param weight: The new weight of the edge.
+        :type weight: float
+
+        :returns: True if the weight was set (if u and v are adjacent), False
+            otherwise.
+        :rtype: boolean
+
+        :raises ValueError: If ``weight`` is not positive.
+        """
+        if weight <= 0:
+            raise ValueError(f"edge weights must be positive (got {weight}).")
+        if v not in u.get_neighbors() or u not in self._vertexToID:
+            return False
+
+        if weight == 1:
+            self._edge_weights.pop(frozenset((u, v)), None)
+        else:
+            self._edge_weights[frozenset((u, v))] = weight
+        self._untoggle_computed()
+        return True
+
+    def set_port_labeling(self, offsets, targets):
+        """Set the ports of all the vertices at once, from a labeling
+        given as a port table (see :meth:`port_table`), e.g., saved after a
+        call to :meth:`relabel_ports`.
+
+        :param offsets: Offsets of the port table.
+        :type offsets: numpy.array of int
+
+        :param targets: Targets of the port table.
+        :type targets: numpy.array of int
+
+        :returns: False if the labeling does not match the neighbors of the
+            vertices of the graph (the graph is then left unchanged), True
+            otherwise.
+        :rtype: boolean
+        """
+        offsets = np.asarray(offsets, np.int64)
+        targets = np.asarray(targets, np.int64)
+        if len(offsets) != self.order() + 1 or offsets[-1] != len(targets):
+            return False
+
+        self._compute_port_table()
+        arcs = []
+        for table_offsets, table_targets in (
+                (offsets, targets), (self._port_offsets, self._port_targets)):
+            owners = np.repeat(np.arange(self.order()),
+                               np.diff(table_offsets))
+            used = table_targets >= 0
+            owners, neighbors = owners[used], table_targets[used]
+            sort = np.lexsort((neighbors, owners))
+            arcs.append((owners[sort], neighbors[sort]))
+        if not (np.array_equal(arcs[0][0], arcs[1][0]) and
+                np.array_equal(arcs[0][1], arcs[1][1])):
+            return False
+
+        self._apply_port_labeling(offsets, targets)
+        return True
+
     def size(self):
         """Get the number of edges of the graph.
 
@@ -409,6 +980,12 @@ class Graph:
         if self._adjacency_matrix_computed:
             return
 
+        cached = self._load_from_cache("adjacency_matrix")
+        if cached is not None:
+            self._adjacency_matrix = cached
+            self._adjacency_matrix_computed = True
+            return
+
         size = self.order()
         self._adjacency_matrix = np.zeros((size, size), int)
 
@@ -419,11 +996,50 @@ class Graph:
                 self._adjacency_matrix[i, k] = 1
 
         self._adjacency_matrix_computed = True
+        self._store_in_cache("adjacency_matrix", self._adjacency_matrix)
+
+    def _compute_components(self):
+        if self._components_computed:
+            return
+
+        self._compute_port_table()
+        number, labels = components(self._port_offsets, self._port_targets)
+
+        roots = [None] * number
+        self._component_parent = dict()
+        self._component_size = dict()
+        for vertex, ID in self._vertexToID.items():
+            label = labels[ID]
+            if roots[label] is None:
+                roots[label] = vertex
+                self._component_size[vertex] = 0
+            self._component_parent[vertex] = roots[label]
+            self._component_size[roots[label]] += 1
+
+        self._components_number = number
+        self._components_computed = True
 
     def _compute_distance_matrix(self):
         if self._distance_matrix_computed:
             return
 
+        cached = self._load_from_cache("distance_matrix")
+        diameter = self._load_from_cache("diameter")
+        if cached is not None and diameter is not None:
+            self._distance_matrix = cached
+            self._diameter = diameter[()]
+            self._distance_matrix_computed = True
+            return
+
+        if self.is_weighted():
+            self._distance_matrix = self._distance_rows_stack(
+                np.arange(self.order()))
+            self._diameter = self._distance_matrix.max(initial=0)
+            self._distance_matrix_computed = True
+            self._store_in_cache("distance_matrix", self._distance_matrix)
+            self._store_in_cache("diameter", np.array(self._diameter))
+            return
+
         self._compute_adjacency_matrix()
 
         self._diameter = 0
@@ -444,13 +1060,142 @@ class Graph:
                         self._diameter = m
 
         self._distance_matrix_computed = True
+        self._store_in_cache("distance_matrix", self._distance_matrix)
+        self._store_in_cache("diameter", np.array(self._diameter))
+
+    def _apply_port_labeling(self, offsets, targets):
+        vertices = [self._IDToVertex[ID] for ID in range(self.order())]
+        targets = targets.tolist()
+        offsets = offsets.tolist()
+        for ID, vertex in enumerate(vertices):
+            segment = targets[offsets[ID]:offsets[ID + 1]]
+            vertex._portToNeighbor = {port: vertices[neighbor]
+                                      for port, neighbor in enumerate(segment)
+                                      if neighbor >= 0}
+            vertex._next_port = len(segment)
+            vertex._unused_ports = [port for port, neighbor
+                                    in enumerate(segment) if neighbor < 0]
+        self._untoggle_computed()
+
+    def _ball(self, ID, radius, visited):
+        if (ID, radius) not in self._balls:
+            self._compute_port_table()
+            vertices = ball(self._port_offsets, self._port_targets, ID,
+                            radius, visited)
+            vertices.setflags(write=False)
+            self._balls[(ID, radius)] = vertices
+        return self._balls[(ID, radius)]
+
+    def _bfs(self, ID):
+        self._compute_port_table()
+        if self.is_weighted():
+            weights = self._edge_weight_array[self._port_edge_ids]
+            distances, parents = dijkstra(self._port_offsets,
+                                          self._port_targets, weights, ID)
+            row = distances.copy()
+            row[np.isinf(distances)] = self.INFTY
+            self._distance_rows[ID] = row
+            return distances, parents
+
+        distances, parents = bfs(self._port_offsets, self._port_targets, ID)
+
+        row = distances.astype(float)
+        row[distances < 0] = self.INFTY
+        self._distance_rows[ID] = row
+
+        return distances, parents
 
     def _compute_is_planar(self):
         if not self._is_planar_computed:
-            G = nx.from_numpy_array(self.adjacency_matrix())
-            self._is_planar = nx.check_planarity(G)[0]
+            cached = self._load_from_cache("is_planar")
+            if cached is not None:
+                self._is_planar = bool(cached)
+            else:
+                G = nx.from_numpy_array(self.adjacency_matrix())
+                self._is_planar = nx.check_planarity(G)[0]
+                self._store_in_cache("is_planar", np.array(self._is_planar))
+            self._is_planar_computed = True
         return self._is_planar
 
+    def _compute_port_table(self):
+        if self._port_table_computed:
+            return
+
+        order = self.order()
+        widths = np.zeros(order, np.int64)
+        for vertex, ID in self._vertexToID.items():
+            ports = vertex.get_port_associations()
+            if len(ports) != 0:
+                widths[ID] = max(ports) + 1
+
+        offsets = np.zeros(order + 1, np.int64)
+        np.cumsum(widths, out=offsets[1:])
+        targets = np.full(offsets[-1], -1, np.int64)
+        back_ports = np.full(offsets[-1], -1, np.int64)
+
+        arcs = dict()
+        for vertex, ID in self._vertexToID.items():
+            for port, neighbor in vertex.get_port_associations().items():
+                if neighbor in self._vertexToID:
+                    k = self._vertexToID[neighbor]
+                    targets[offsets[ID] + port] = k
+                    arcs[(ID, k)] = port
+
+        for (ID, k), port in arcs.items():
+            back_ports[offsets[ID] + port] = arcs.get((k, ID), -1)
+
+        owners = np.repeat(np.arange(order), widths)
+        used = targets >= 0
+        low = np.minimum(owners, targets)[used]
+        high = np.maximum(owners, targets)[used]
+        keys, edge_ids = np.unique(low * order + high, return_inverse=True)
+        self._port_edge_ids = np.full(len(targets), -1, np.int64)
+        self._port_edge_ids[used] = edge_ids
+        self._edge_array = np.stack([keys // order, keys % order], axis=1)
+
+        self._edge_weight_array = np.ones(len(keys), float)
+        if len(self._edge_weights) != 0:
+            ends = np.array([[self._vertexToID[u] for u in edge]
+                             for edge in self._edge_weights], np.int64)
+            weights = np.array(list(self._edge_weights.values()), float)
+            key = ends.min(axis=1) * order + ends.max(axis=1)
+            self._edge_weight_array[np.searchsorted(keys, key)] = weights
+
+        self._port_offsets = offsets
+        self._port_targets = targets
+        self._port_back = back_ports
+        self._port_table_computed = True
+
+    def _compute_routing_table(self, ID):
+        _, parents = self._bfs(ID)
+
+        width = np.diff(self._port_offsets).max(initial=0)
+        for dtype in (np.uint8, np.uint16, np.uint32, np.uint64):
+            if width < np.iinfo(dtype).max:
+                break
+
+        table = np.full(self.order(), np.iinfo(dtype).max, dtype)
+        reached = parents >= 0
+        ports = self._port_back[parents[reached]]
+        valid = ports >= 0
+        table[np.flatnonzero(reached)[valid]] = ports[valid]
+        self._routing_tables[ID] = table
+
+    def _distance_rows_stack(self, IDs):
+        rows = np.empty((len(IDs), self.order()), float)
+        for i, ID in enumerate(IDs):
+            rows[i] = self.distances_from(ID)
+        return rows
+
+    def _find(self, vertex):
+        parent = self._component_parent
+        root = vertex
+        while parent[root] is not root:
+            root = parent[root]
+        while parent[vertex] is not root:
+            parent[vertex], vertex = root, parent[vertex]
+        return root
+
     def _init_distMat(self):
         size = self._order
         self._distance_matrix = np.zeros((size, size), float)
@@ -466,6 +1211,92 @@ class Graph:
 
         return size
 
+    def __getstate__(self):
+        # The graph is pickled as flat arrays of vertex identifiers, and the
+        # vertices as plain states without their adjacency, so that pickling
+        # never recurses along paths of the graph.
+        state = self.__dict__.copy()
+        for key in ("_vertexToID", "_IDToVertex", "_nameToVertex", "_edges",
+                    "_edge_weights", "_component_parent", "_component_size"):
+            del state[key]
+        state["_components_computed"] = False
+
+        vertices = [None] * self._order
+        for vertex, ID in self._vertexToID.items():
+            vertices[ID] = vertex
+        IDs = self._vertexToID
+
+        ports_numbers = [0] * self._order
+        ports = []
+        neighbors_numbers = [0] * self._order
+        neighbors = []
+        for ID, vertex in enumerate(vertices):
+            for port, neighbor in vertex.get_port_associations().items():
+                if neighbor in IDs:
+                    ports.append((port, IDs[neighbor]))
+                    ports_numbers[ID] += 1
+            for neighbor in vertex.get_neighbors():
+                if neighbor in IDs:
+                    neighbors.append(IDs[neighbor])
+                    neighbors_numbers[ID] += 1
+        edges = [(IDs[u], IDs[v]) for (u, v) in self._edges
+                 if u in IDs and v in IDs]
+
+        state["_pickled_vertices"] = [
+            (type(vertex), {key: value
+                            for key, value in vertex.__dict__.items()
+                            if key not in ("_neighbors", "_portToNeighbor")})
+            for vertex in vertices]
+        state["_pickled_ports_numbers"] = np.array(ports_numbers, np.int64)
+        state["_pickled_ports"] = np.array(ports, np.int64).reshape(-1, 2)
+        state["_pickled_neighbors_numbers"] = np.array(neighbors_numbers,
+                                                       np.int64)
+        state["_pickled_neighbors"] = np.array(neighbors, np.int64)
+        state["_pickled_edges"] = np.array(edges, np.int64).reshape(-1, 2)
+        state["_pickled_weights"] = [
+            (*(IDs[u] for u in edge), weight)
+            for edge, weight in self._edge_weights.items()]
+        return state
+
+    def __setstate__(self, state):
+        vertices = []
+        for vertex_class, vertex_state in state.pop("_pickled_vertices"):
+            vertex = vertex_class.__new__(vertex_class)
+            vertex.__dict__.update(vertex_state)
+            vertices.append(vertex)
+        ports_numbers = state.pop("_pickled_ports_numbers")
+        ports = state.pop("_pickled_ports")
+        neighbors_numbers = state.pop("_pickled_neighbors_numbers")
+        neighbors = state.pop("_pickled_neighbors")
+        edges = state.pop("_pickled_edges")
+        weights = state.pop("_pickled_weights")
+        self.__dict__.update(state)
+
+        self._vertexToID = {vertex: ID for ID, vertex in enumerate(vertices)}
+        self._IDToVertex = dict(enumerate(vertices))
+        self._nameToVertex = {vertex.name(): vertex for vertex in vertices}
+        self._component_parent = dict()
+        self._component_size = dict()
+
+        ports_targets = [vertices[ID] for ID in ports[:, 1].tolist()]
+        ports = ports[:, 0].tolist()
+        neighbors = [vertices[ID] for ID in neighbors.tolist()]
+        ports_end = np.cumsum(ports_numbers).tolist()
+        neighbors_end = np.cumsum(neighbors_numbers).tolist()
+        ports_start = 0
+        neighbors_start = 0
+        for ID, vertex in enumerate(vertices):
+            vertex._portToNeighbor = dict(zip(
+                ports[ports_start:ports_end[ID]],
+                ports_targets[ports_start:ports_end[ID]]))
+            vertex._neighbors = neighbors[neighbors_start:neighbors_end[ID]]
+            ports_start = ports_end[ID]
+            neighbors_start = neighbors_end[ID]
+
+        self._edges = {(vertices[i], vertices[k]) for i, k in edges.tolist()}
+        self._edge_weights = {frozenset((vertices[i], vertices[k])): weight
+                              for i, k, weight in weights}
+
     def __str__(self):
         str = "Graph{\n"
         order = len(self._vertexToID)
@@ -480,15 +1311,44 @@ class Graph:
         str += "\n}\n"
         return str
 
+    def _load_from_cache(self, name):
+        if self._cache is None:
+            return None
+        return self._cache.load(self.fingerprint(), name)
+
+    def _store_in_cache(self, name, array):
+        if self._cache is not None:
+            self._cache.store(self.fingerprint(), name, array)
+
     def _swap_vertices_ids(self, u, v):
         IDu = self._vertexToID[u]
-        self._vertexToID[u] = self._vertexToID[v]
+        IDv = self._vertexToID[v]
+        self._vertexToID[u] = IDv
         self._vertexToID[v] = IDu
+        self._IDToVertex[IDu] = v
+        self._IDToVertex[IDv] = u
+
+    def _union(self, u, v):
+        root_u = self._find(u)
+        root_v = self._find(v)
+        if root_u is root_v:
+            return
+
+        if self._component_size[root_u] < self._component_size[root_v]:
+            root_u, root_v = root_v, root_u
+        self._component_parent[root_v] = root_u
+        self._component_size[root_u] += self._component_size.pop(root_v)
+        self._components_number -= 1
 
     def _untoggle_computed(self):
         self._adjacency_matrix_computed = False
         self._distance_matrix_computed = False
         self._is_planar_computed = False
+        self._port_table_computed = False
+        self._routing_tables = dict()
+        self._distance_rows = dict()
+        self._balls = dict()
+        self._fingerprint = None
 
 
 def min(a, b):
@@ -0,0 +1,123 @@
+import numpy as np
+import os
+
+
+class GraphCache:
+    """On-disk cache of data derived from graphs."""
+
+    def __init__(self, directory, max_bytes=2**30):
+        """A directory storing arrays derived from graphs (distance matrices,
+        layouts, ...), keyed by the fingerprint of the graph they were
+        computed from (see :meth:`mas.graph.Graph.Graph.fingerprint`) and by
+        the name of the property. Every entry is a ``.npy`` file, memory
+        mapped when loaded, so that many processes can share the same
+        entries. When the directory grows larger than ``max_bytes``, the
+        least recently used entries are removed.
+
+        :param directory: Path of the cache directory. It is created if
+            needed.
+        :type directory: string
+
+        :param max_bytes: Maximum total size of the entries, in bytes.
+            Default to 2**30 (1 GiB).
+        :type max_bytes: int, optional
+        """
+        self._directory = directory
+        self._max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def clear(self):
+        """Remove every entry of the cache."""
+        for filename in self._entries():
+            self._remove(filename)
+
+    def directory(self):
+        """Get the path of the cache directory.
+
+        :returns: The path of the cache directory.
+        :rtype: string
+        """
+        return self._directory
+
+    def load(self, fingerprint, name):
+        """Get an entry of the cache, and mark it as recently used.
+
+        :param fingerprint: Fingerprint of a graph.
+        :type fingerprint: string
+
+        :param name: Name of a property of the graph.
+        :type name: string
+
+        :returns: The stored array, memory mapped in read-only mode (0-d
+            arrays are loaded in memory). None if there is no such entry.
+        :rtype: numpy.array
+        """
+        filename = self._filename(fingerprint, name)
+        try:
+            array = np.load(filename, mmap_mode="r")
+            os.utime(filename)
+        except (FileNotFoundError, ValueError):
+            return None
+        if array.ndim == 0:
+            return np.array(array)
+        return array
+
+    def size(self):
+        """Get the total size of the entries of the cache.
+
+        :returns: A number of bytes.
+        :rtype: int
+        """
+        return sum(os.path.getsize(filename) for filename in self._entries())
+
+    def store(self, fingerprint, name, array):
+        """Add (or replace) an entry of the cache, then evict the least
+        recently used entries if the cache is too large. The entry is written
+        in a temporary file first, so that concurrent processes never read a
+        partial entry.
+
+        :param fingerprint: Fingerprint of a graph.
+        :type fingerprint: string
+
+        :param name: Name of a property of the graph.
+        :type name: string
+
+        :param array: The data to store.
+        :type array: numpy.array
+        """
+        filename = self._filename(fingerprint, name)
+        tmp_filename = f"{filename}.{os.getpid()}.tmp"
+        with open(tmp_filename, "wb") as f:
+            np.save(f, np.asarray(array))
+        os.replace(tmp_filename, filename)
+        self._evict()
+
+    def _entries(self):
+        return [os.path.join(self._directory, name)
+                for name in os.listdir(self._directory)
+                if name.endswith(".npy")]
+
+    def _evict(self):
+        entries = []
+        for filename in self._entries():
+            try:
+                stat = os.stat(filename)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, filename))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, filename in sorted(entries):
+            if total <= self._max_bytes:
+                break
+            self._remove(filename)
+            total -= size
+
+    def _filename(self, fingerprint, name):
+        return os.path.join(self._directory, f"{fingerprint}-{name}.npy")
+
+    def _remove(self, filename):
+        try:
+            os.remove(filename)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,126 @@
+from .ArrayGraph import ArrayGraph
+import numpy as np
+
+
+class GraphView(ArrayGraph):
+    """Read-only filtered view of a graph."""
+
+    def __init__(self, graph, vertex_mask=None, edge_mask=None):
+        """A subgraph of a graph, defined by masks over its vertices and
+        edges. Nothing is copied: the view reads the port table of ``graph``
+        (see :meth:`mas.graph.Graph.Graph.port_table`) and only keeps one
+        boolean per slot. Vertices keep their identifiers and ports, so that
+        the ports leading to masked vertices or along masked edges simply
+        disappear. The view must not be used after ``graph`` is modified.
+
+        :param graph: The underlying graph.
+        :type graph: :class:`mas.graph.Graph.Graph`
+
+        :param vertex_mask: Array indexed by vertex identifiers, True for the
+            vertices kept in the view.
+            Default to None (every vertex is kept).
+        :type vertex_mask: numpy.array of bool, optional
+
+        :param edge_mask: Array indexed by edge identifiers (see
+            :meth:`mas.graph.Graph.Graph.edge_array`), True for the edges kept
+            in the view.
+            Default to None (every edge between kept vertices is kept).
+        :type edge_mask: numpy.array of bool, optional
+        """
+        self._graph = graph
+        offsets, targets, back_ports = graph.port_table()
+
+        if vertex_mask is None:
+            vertex_mask = np.ones(graph.order(), bool)
+        if edge_mask is None:
+            edge_mask = np.ones(len(graph.edge_array()), bool)
+        self._vertex_mask = np.asarray(vertex_mask, bool)
+        self._edge_mask = np.asarray(edge_mask, bool)
+
+        owners = np.repeat(np.arange(graph.order()), np.diff(offsets))
+        slot_mask = self._vertex_mask[owners] & (targets >= 0)
+        used = np.flatnonzero(slot_mask)
+        slot_mask[used] = (self._vertex_mask[targets[used]] &
+                           self._edge_mask[graph.port_edge_ids()[used]])
+
+        ArrayGraph.__init__(self, offsets, targets, back_ports,
+                            slot_mask=slot_mask)
+
+    @classmethod
+    def around(cls, graph, vertex, radius):
+        """Get the view of the ball of a given radius around a vertex, i.e.,
+        of the subgraph induced by the vertices at distance at most
+        ``radius`` from ``vertex``. As in :meth:`mas.graph.Graph.Graph.ball`,
+        distances are numbers of hops, even if the graph is weighted.
+
+        :param graph: The underlying graph.
+        :type graph: :class:`mas.graph.Graph.Graph`
+
+        :param vertex: The center of the ball.
+        :type vertex: :class:`mas.graph.Vertex.Vertex`
+
+        :param radius: The radius of the ball.
+        :type radius: int
+
+        :returns: A view of ``graph``.
+        :rtype: :class:`mas.graph.GraphView.GraphView`
+        """
+        vertex_mask = np.zeros(graph.order(), bool)
+        vertex_mask[graph.ball(vertex, radius)] = True
+        return cls(graph, vertex_mask=vertex_mask)
+
+    def edge_mask(self):
+        """Get the edge mask of the view.
+
+        :returns: An array indexed by edge identifiers of the underlying
+            graph.
+        :rtype: numpy.array of bool
+        """
+        return self._edge_mask
+
+    def get_vertex_by_name(self, name):
+        """Get a vertex of the view given its name.
+
+        :param name: The name of a vertex of the underlying graph.
+        :type name: string
+
+        :returns: The vertex of the view with the given name, as in
+            :meth:`mas.graph.Graph.Graph.get_vertex_by_name`. None if no such
+            vertex belongs to the view.
+        :rtype: :class:`mas.graph.VertexHandle.VertexHandle`
+        """
+        vertex = self._graph.get_vertex_by_name(name)
+        if vertex is None:
+            return None
+        return self.get_vertex_by_id(self._graph.get_vertex_id(vertex))
+
+    def graph(self):
+        """Get the underlying graph.
+
+        :returns: The graph this view filters.
+        :rtype: :class:`mas.graph.Graph.Graph`
+        """
+        return self._graph
+
+    def order(self):
+        """Get the number of vertices of the view.
+
+        :returns: The number of vertices of the view.
+        :rtype: int
+        """
+        return int(self._vertex_mask.sum())
+
+    def vertex_mask(self):
+        """Get the vertex mask of the view.
+
+        :returns: An array indexed by vertex identifiers of the underlying
+            graph.
+        :rtype: numpy.array of bool
+        """
+        return self._vertex_mask
+
+    def _has_vertex(self, ID):
+        return self._vertex_mask[ID]
+
+    def _vertex_name(self, ID):
+        return self._graph.get_vertex_by_id(ID).name()
@@ -0,0 +1,33 @@
+from .ImplicitGraph import ImplicitGraph
+import numpy as np
+
+
+class ImplicitBinaryTree(ImplicitGraph):
+    """Complete binary tree whose adjacency is computed."""
+
+    def __init__(self, height):
+        """A complete binary tree with the same identifiers, names and ports
+        as the one generated by :func:`mas.graph.graph_generator.binary_tree`,
+        without any stored adjacency. The children of the vertex i are
+        2i+1 and 2i+2. Port 0 leads to the parent (except for the root), and
+        the next ports lead to the children.
+
+        :param height: Height of the tree.
+        :type height: int
+        """
+        ImplicitGraph.__init__(self, 2**height - 1, 3)
+
+    def size(self):
+        """Get the number of edges of the graph.
+
+        :returns: The number of edges of the graph.
+        :rtype: int
+        """
+        return max(self._order - 1, 0)
+
+    def _neighbor_ids(self, IDs, port):
+        child_rank = port - (IDs > 0)
+        child = 2 * IDs + 1 + child_rank
+        return np.where(child_rank < 0, (IDs - 1) // 2,
+                        np.where((child_rank <= 1) & (child < self._order),
+                                 child, -1))
@@ -0,0 +1,33 @@
+from .ImplicitPath import ImplicitPath
+
+
+class ImplicitCycle(ImplicitPath):
+    """Cycle whose adjacency is computed."""
+
+    def __init__(self, length):
+        """A cycle with the same identifiers, names and ports as the one
+        generated by :func:`mas.graph.graph_generator.cycle`, without any
+        stored adjacency: following port 0 leads to a counterclockwise
+        traversal of the cycle, and port 1 to a clockwise one.
+
+        :param length: Number of vertices in the cycle (at least 3).
+        :type length: int
+
+        :raises ValueError: If the length is lower than 3.
+        """
+        if length < 3:
+            raise ValueError("A cycle must have at least 3 vertices.")
+        ImplicitPath.__init__(self, length)
+
+    def size(self):
+        """Get the number of edges of the graph.
+
+        :returns: The number of edges of the graph.
+        :rtype: int
+        """
+        return self._order
+
+    def _neighbor_ids(self, IDs, port):
+        if port == 0:
+            return (IDs - 1) % self._order
+        return (IDs + 1) % self._order
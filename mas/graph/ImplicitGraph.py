@@ -0,0 +1,80 @@
+from .ReadOnlyGraph import ReadOnlyGraph
+import numpy as np
+
+
+class ImplicitGraph(ReadOnlyGraph):
+    """Base class of the topologies whose adjacency is computed."""
+
+    def __init__(self, order, max_degree):
+        """A read-only graph whose neighbors are computed from the
+        identifiers of the vertices, so that it stores no adjacency at all:
+        its memory footprint does not depend on its order. Subclasses
+        implement :meth:`size` and the private method ``_neighbor_ids``,
+        giving the neighbors reached through a port from arrays of
+        identifiers.
+
+        :param order: Number of vertices.
+        :type order: int
+
+        :param max_degree: Maximum degree of the vertices. Ports range
+            from 0 to ``max_degree - 1``.
+        :type max_degree: int
+        """
+        ReadOnlyGraph.__init__(self)
+
+        self._order = order
+        self._max_degree = max_degree
+
+    def get_vertex_by_name(self, name):
+        """Get a vertex of the graph given its name.
+
+        :param name: The name of a vertex of the graph.
+        :type name: string
+
+        :returns: The vertex named ``name``. None if no such vertex belongs
+            to the graph.
+        :rtype: :class:`mas.graph.VertexHandle.VertexHandle`
+        """
+        ID = self._name_to_id(name)
+        if ID is None:
+            return None
+        return self.get_vertex_by_id(ID)
+
+    def order(self):
+        """Get the number of vertices of the graph.
+
+        :returns: The number of vertices of the graph.
+        :rtype: int
+        """
+        return self._order
+
+    def _frontier_neighbors(self, frontier):
+        neighbors = np.concatenate([self._neighbor_ids(frontier, port)
+                                    for port in range(self._max_degree)])
+        return neighbors[neighbors >= 0]
+
+    def _name_to_id(self, name):
+        # Identifier of the vertex named name, or None.
+        if isinstance(name, (int, np.integer)) and 0 <= name < self._order:
+            return int(name)
+        return None
+
+    def _neighbor_id(self, ID, port):
+        if not (0 <= port < self._max_degree):
+            return -1
+        return int(self._neighbor_ids(ID, port))
+
+    def _neighbor_ids(self, IDs, port):
+        # Identifiers of the neighbors reached through port from IDs (an int
+        # or an array), -1 where the port does not exist.
+        raise NotImplementedError
+
+    def _port_to(self, ID, neighbor_ID):
+        for port in range(self._max_degree):
+            if self._neighbor_id(ID, port) == neighbor_ID:
+                return port
+        return None
+
+    def _ports(self, ID):
+        return [port for port in range(self._max_degree)
+                if self._neighbor_id(ID, port) >= 0]
@@ -0,0 +1,62 @@
+from .ImplicitGraph import ImplicitGraph
+import numpy as np
+
+
+class ImplicitGrid(ImplicitGraph):
+    """Grid whose adjacency is computed."""
+
+    def __init__(self, width, height):
+        """A grid with the same identifiers, names (``"(i,j)"``) and ports as
+        the one generated by :func:`mas.graph.graph_generator.grid`, without
+        any stored adjacency. The vertex (i,j) has identifier
+        ``i * height + j``, and its ports lead, in this order, to the
+        existing vertices among (i,j-1), (i-1,j), (i,j+1) and (i+1,j).
+
+        :param width: Width of the grid.
+        :type width: int
+
+        :param height: Height of the grid.
+        :type height: int
+        """
+        ImplicitGraph.__init__(self, width * height, 4)
+
+        self._width = width
+        self._height = height
+
+    def size(self):
+        """Get the number of edges of the graph.
+
+        :returns: The number of edges of the graph.
+        :rtype: int
+        """
+        return (self._width * (self._height - 1) +
+                self._height * (self._width - 1))
+
+    def _name_to_id(self, name):
+        if not (isinstance(name, str) and name.startswith("(") and
+                name.endswith(")")):
+            return None
+        try:
+            i, j = (int(x) for x in name[1:-1].split(","))
+        except ValueError:
+            return None
+        if not (0 <= i < self._width and 0 <= j < self._height):
+            return None
+        return i * self._height + j
+
+    def _neighbor_ids(self, IDs, port):
+        i, j = IDs // self._height, IDs % self._height
+        exists = (j > 0, i > 0, j < self._height - 1, i < self._width - 1)
+        steps = (-1, -self._height, 1, self._height)
+
+        # The port leads to the (port + 1)-th existing direction.
+        neighbors = -1
+        rank = 0
+        for direction in range(4):
+            rank = rank + exists[direction]
+            chosen = exists[direction] & (rank == port + 1)
+            neighbors = np.where(chosen, IDs + steps[direction], neighbors)
+        return neighbors
+
+    def _vertex_name(self, ID):
+        return f"({ID // self._height},{ID % self._height})"
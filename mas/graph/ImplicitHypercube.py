@@ -0,0 +1,29 @@
+from .ImplicitGraph import ImplicitGraph
+
+
+class ImplicitHypercube(ImplicitGraph):
+    """Hypercube whose adjacency is computed."""
+
+    def __init__(self, dimension):
+        """A hypercube without any stored adjacency. Vertices are named by
+        their identifiers, between 0 and ``2**dimension - 1``, and the
+        port k of a vertex leads to the vertex whose identifier differs on
+        the k-th bit.
+
+        :param dimension: Dimension of the hypercube (at most 62).
+        :type dimension: int
+        """
+        ImplicitGraph.__init__(self, 2**dimension, dimension)
+
+        self._dimension = dimension
+
+    def size(self):
+        """Get the number of edges of the graph.
+
+        :returns: The number of edges of the graph.
+        :rtype: int
+        """
+        return self._dimension * self._order // 2
+
+    def _neighbor_ids(self, IDs, port):
+        return IDs ^ (1 << port)
@@ -0,0 +1,33 @@
+from .ImplicitGraph import ImplicitGraph
+import numpy as np
+
+
+class ImplicitPath(ImplicitGraph):
+    """Path whose adjacency is computed."""
+
+    def __init__(self, length):
+        """A path with the same identifiers, names and ports as the one
+        generated by :func:`mas.graph.graph_generator.path`, without any
+        stored adjacency: port 0 leads to the previous vertex and port 1 to
+        the next one, except for the first vertex, whose only port is 0.
+
+        :param length: Number of vertices in the path.
+        :type length: int
+        """
+        ImplicitGraph.__init__(self, length, 2)
+
+    def size(self):
+        """Get the number of edges of the graph.
+
+        :returns: The number of edges of the graph.
+        :rtype: int
+        """
+        return max(self._order - 1, 0)
+
+    def _neighbor_ids(self, IDs, port):
+        has_previous = IDs > 0
+        has_next = IDs < self._order - 1
+        if port == 0:
+            return np.where(has_previous, IDs - 1,
+                            np.where(has_next, IDs + 1, -1))
+        return np.where(has_previous & has_next, IDs + 1, -1)
@@ -0,0 +1,43 @@
+from .ImplicitGrid import ImplicitGrid
+
+
+class ImplicitTorus(ImplicitGrid):
+    """Torus whose adjacency is computed."""
+
+    def __init__(self, width, height):
+        """A grid whose borders wrap around, without any stored adjacency.
+        Identifiers and names are the ones of
+        :class:`mas.graph.ImplicitGrid.ImplicitGrid`. Every vertex (i,j) has
+        four ports, leading respectively to (i,j-1), (i-1,j), (i,j+1) and
+        (i+1,j), coordinates being taken modulo the width and the height.
+
+        :param width: Width of the torus (at least 3).
+        :type width: int
+
+        :param height: Height of the torus (at least 3).
+        :type height: int
+
+        :raises ValueError: If the width or the height is lower than 3.
+        """
+        if width < 3 or height < 3:
+            raise ValueError("The width and the height of a torus must be at "
+                             "least 3.")
+        ImplicitGrid.__init__(self, width, height)
+
+    def size(self):
+        """Get the number of edges of the graph.
+
+        :returns: The number of edges of the graph.
+        :rtype: int
+        """
+        return 2 * self._order
+
+    def _neighbor_ids(self, IDs, port):
+        i, j = IDs // self._height, IDs % self._height
+        if port == 0:
+            return i * self._height + (j - 1) % self._height
+        if port == 1:
+            return (i - 1) % self._width * self._height + j
+        if port == 2:
+            return i * self._height + (j + 1) % self._height
+        return (i + 1) % self._width * self._height + j
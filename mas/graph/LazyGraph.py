@@ -0,0 +1,101 @@
+from .ReadOnlyGraph import ReadOnlyGraph
+from collections import OrderedDict
+import numpy as np
+
+_MASK = 2**64 - 1
+
+
+class LazyGraph(ReadOnlyGraph):
+    """Base class of the topologies generated on first visit."""
+
+    def __init__(self, seed=0, cache_size=None):
+        """A read-only graph whose adjacency is generated, deterministically
+        from a seed and the identifier of the vertex, the first time the
+        vertex is reached. Only the adjacency of visited vertices is kept in
+        memory, so that simulations on huge random topologies only cost
+        memory proportional to the explored area. Subclasses implement the
+        private method ``_generate``, which must be consistent: u is a
+        neighbor of v if and only if v is a neighbor of u.
+
+        :param seed: Seed of the topology. Two graphs with the same
+            parameters and seed are identical.
+            Default to 0.
+        :type seed: int, optional
+
+        :param cache_size: If not None, at most this number of adjacencies
+            are kept (the least recently used ones are dropped, and generated
+            again if they are visited again).
+            Default to None.
+        :type cache_size: int, optional
+        """
+        ReadOnlyGraph.__init__(self)
+
+        self._seed = seed
+        self._cache_size = cache_size
+        self._adjacency = OrderedDict()
+
+    def materialized_number(self):
+        """Get the number of vertices whose adjacency is currently held in
+        memory.
+
+        :returns: A number of vertices.
+        :rtype: int
+        """
+        return len(self._adjacency)
+
+    def seed(self):
+        """Get the seed of the topology.
+
+        :returns: The seed.
+        :rtype: int
+        """
+        return self._seed
+
+    def _adjacency_of(self, ID):
+        # Neighbors of the vertex, indexed by ports.
+        adjacency = self._adjacency.get(ID)
+        if adjacency is None:
+            adjacency = self._generate(ID)
+            self._adjacency[ID] = adjacency
+            if (self._cache_size is not None and
+                    len(self._adjacency) > self._cache_size):
+                self._adjacency.popitem(last=False)
+        elif self._cache_size is not None:
+            self._adjacency.move_to_end(ID)
+        return adjacency
+
+    def _frontier_neighbors(self, frontier):
+        return np.array([neighbor
+                         for ID in frontier.tolist()
+                         for neighbor in self._adjacency_of(ID)], np.int64)
+
+    def _generate(self, ID):
+        # Tuple of the identifiers of the neighbors of the vertex, indexed by
+        # ports.
+        raise NotImplementedError
+
+    def _hash(self, *values):
+        # Deterministic 64 bits hash of the seed and the given integers
+        # (splitmix64 finalizer).
+        h = self._seed & _MASK
+        for value in values:
+            h = (h ^ (value & _MASK)) + 0x9e3779b97f4a7c15 & _MASK
+            h = (h ^ (h >> 30)) * 0xbf58476d1ce4e5b9 & _MASK
+            h = (h ^ (h >> 27)) * 0x94d049bb133111eb & _MASK
+            h ^= h >> 31
+        return h
+
+    def _neighbor_id(self, ID, port):
+        adjacency = self._adjacency_of(ID)
+        if not (0 <= port < len(adjacency)):
+            return -1
+        return adjacency[port]
+
+    def _port_to(self, ID, neighbor_ID):
+        adjacency = self._adjacency_of(ID)
+        if neighbor_ID not in adjacency:
+            return None
+        return adjacency.index(neighbor_ID)
+
+    def _ports(self, ID):
+        return list(range(len(self._adjacency_of(ID))))
@@ -0,0 +1,84 @@
+from .LazyGraph import LazyGraph
+
+
+class LazyRandomRegularGraph(LazyGraph):
+    """Random regular graph generated on first visit."""
+
+    _ROUNDS = 4
+
+    def __init__(self, order, degree, seed=0, cache_size=None):
+        """A random regular graph, made of the union of ``degree / 2``
+        pseudo-random permutations of the vertices: for every permutation
+        p_k, the vertex u is adjacent to p_k(u) through port 2k and to the
+        inverse of p_k at u through port 2k+1. Permutations are Feistel
+        networks keyed by the seed, so that the adjacency of every vertex is
+        computed on its own. As in the configuration model, the graph may
+        have a few loops and multiple edges.
+        See :class:`mas.graph.LazyGraph.LazyGraph`.
+
+        :param order: Number of vertices.
+        :type order: int
+
+        :param degree: Degree of the vertices (even).
+        :type degree: int
+
+        :param seed: Seed of the graph.
+            Default to 0.
+        :type seed: int, optional
+
+        :param cache_size: Maximum number of adjacencies held in memory.
+            Default to None (no limit).
+        :type cache_size: int, optional
+
+        :raises ValueError: If ``degree`` is odd.
+        """
+        if degree % 2 != 0:
+            raise ValueError("The degree of the graph must be even.")
+        LazyGraph.__init__(self, seed=seed, cache_size=cache_size)
+
+        self._order = order
+        self._degree = degree
+        self._half_bits = max(1, ((order - 1).bit_length() + 1) // 2)
+        self._half_mask = (1 << self._half_bits) - 1
+
+    def order(self):
+        """Get the number of vertices of the graph.
+
+        :returns: The number of vertices of the graph.
+        :rtype: int
+        """
+        return self._order
+
+    def size(self):
+        """Get the number of edges of the graph (loops and multiple edges
+        included).
+
+        :returns: The number of edges of the graph.
+        :rtype: int
+        """
+        return self._order * self._degree // 2
+
+    def _feistel(self, permutation, x, inverse):
+        # Permutation of [0, 4**half_bits), then cycle walking to stay in
+        # [0, order).
+        while True:
+            left, right = x >> self._half_bits, x & self._half_mask
+            if not inverse:
+                for r in range(self._ROUNDS):
+                    left, right = right, left ^ (
+                        self._hash(permutation, r, right) & self._half_mask)
+            else:
+                for r in reversed(range(self._ROUNDS)):
+                    left, right = right ^ (
+                        self._hash(permutation, r, left) & self._half_mask), \
+                        left
+            x = (left << self._half_bits) | right
+            if x < self._order:
+                return x
+
+    def _generate(self, ID):
+        adjacency = []
+        for permutation in range(self._degree // 2):
+            adjacency.append(self._feistel(permutation, ID, False))
+            adjacency.append(self._feistel(permutation, ID, True))
+        return tuple(adjacency)
@@ -0,0 +1,153 @@
+from .LazyGraph import LazyGraph
+from .VertexHandle import VertexHandle
+import numpy as np
+import random
+
+
+class LazyRandomTree(LazyGraph):
+    """Random tree generated on first visit."""
+
+    def __init__(self, branching, depth, seed=0, cache_size=None):
+        """A random rooted tree whose leaves all are at the given depth, and
+        whose internal vertices have between 1 and ``branching`` children.
+        The root has identifier 0, and the children of the vertex v have
+        consecutive identifiers from ``branching * v + 1``. Port 0 leads to
+        the parent (except for the root), and the next ports lead to the
+        children. Since the numbers of children are random, the order of the
+        tree is counted by :meth:`order`, in time proportional to the order.
+        See :class:`mas.graph.LazyGraph.LazyGraph`.
+
+        :param branching: Maximum number of children of a vertex (at least
+            2).
+        :type branching: int
+
+        :param depth: Depth of the leaves.
+        :type depth: int
+
+        :param seed: Seed of the tree.
+            Default to 0.
+        :type seed: int, optional
+
+        :param cache_size: Maximum number of adjacencies held in memory.
+            Default to None (no limit).
+        :type cache_size: int, optional
+
+        :raises ValueError: If ``branching`` is lower than 2.
+        """
+        if branching < 2:
+            raise ValueError("The branching of a tree must be at least 2.")
+        LazyGraph.__init__(self, seed=seed, cache_size=cache_size)
+
+        self._branching = branching
+        self._depth = depth
+        self._order = None
+
+    def depth(self):
+        """Get the depth of the leaves of the tree.
+
+        :returns: The depth of the tree.
+        :rtype: int
+        """
+        return self._depth
+
+    def order(self):
+        """Get the number of vertices of the tree. It is counted level by
+        level the first time, without generating any adjacency, then kept.
+        The count takes time proportional to the order, and memory
+        proportional to the largest level.
+
+        :returns: The number of vertices of the tree.
+        :rtype: int
+        """
+        if self._order is None:
+            order = 0
+            level = np.zeros(1, np.uint64)
+            for depth in range(self._depth + 1):
+                order += level.size
+                if depth == self._depth:
+                    break
+                counts = self._children_numbers(level)
+                firsts = np.repeat(self._branching * level + 1, counts)
+                ranks = np.arange(firsts.size) - np.repeat(
+                    np.cumsum(counts) - counts, counts)
+                level = firsts + ranks.astype(np.uint64)
+            self._order = order
+        return self._order
+
+    def random_vertex(self, rng=None):
+        """Pick a vertex of the tree at random, by descending from the root
+        to a uniformly random depth. Note that the distribution is not
+        uniform over the vertices.
+
+        :param rng: Random generator.
+            Default to None (the :mod:`random` module is used).
+        :type rng: numpy.random.Generator, optional
+
+        :returns: A vertex of the tree.
+        :rtype: :class:`mas.graph.VertexHandle.VertexHandle`
+        """
+        randrange = random.randrange
+        if rng is not None:
+            def randrange(stop):
+                return int(rng.integers(stop))
+
+        ID = 0
+        for depth in range(randrange(self._depth + 1)):
+            rank = randrange(self._children_number(ID, depth))
+            ID = self._branching * ID + 1 + rank
+        return VertexHandle(self, ID)
+
+    def size(self):
+        """Get the number of edges of the tree (see :meth:`order`).
+
+        :returns: The number of edges of the tree.
+        :rtype: int
+        """
+        return self.order() - 1
+
+    def _children_number(self, ID, depth):
+        if depth >= self._depth:
+            return 0
+        return 1 + self._hash(ID) % self._branching
+
+    def _children_numbers(self, IDs):
+        # Vectorized _children_number of internal vertices: the splitmix64
+        # finalizer of _hash, on uint64 arrays wrapping around like _MASK.
+        h = np.uint64(self._seed & 2**64 - 1) ^ IDs
+        h = h + np.uint64(0x9e3779b97f4a7c15)
+        h = (h ^ (h >> np.uint64(30))) * np.uint64(0xbf58476d1ce4e5b9)
+        h = (h ^ (h >> np.uint64(27))) * np.uint64(0x94d049bb133111eb)
+        h ^= h >> np.uint64(31)
+        return (1 + h % np.uint64(self._branching)).astype(np.int64)
+
+    def _depth_of(self, ID):
+        depth = 0
+        while ID > 0:
+            ID = (ID - 1) // self._branching
+            depth += 1
+        return depth
+
+    def _generate(self, ID):
+        depth = self._depth_of(ID)
+        first_child = self._branching * ID + 1
+        children = range(first_child,
+                         first_child + self._children_number(ID, depth))
+        if ID == 0:
+            return tuple(children)
+        return ((ID - 1) // self._branching,) + tuple(children)
+
+    def _has_vertex(self, ID):
+        depth = self._depth_of(ID)
+        if depth > self._depth:
+            return False
+        while ID > 0:
+            parent, rank = divmod(ID - 1, self._branching)
+            depth -= 1
+            if rank >= self._children_number(parent, depth):
+                return False
+            ID = parent
+        return True
+
+    def _ids_number(self):
+        return (self._branching**(self._depth + 1) - 1) // \
+            (self._branching - 1)
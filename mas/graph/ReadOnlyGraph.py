@@ -0,0 +1,227 @@
+from .VertexHandle import VertexHandle
+import numpy as np
+import random
+
+
+class ReadOnlyGraph:
+    """Base class of the read-only topologies whose vertices are handles."""
+
+    INFTY = 9999
+
+    def __init__(self, names=None):
+        """A read-only graph whose vertices are
+        :class:`mas.graph.VertexHandle.VertexHandle` objects, created on
+        demand. Subclasses only define how the adjacency is stored, by
+        implementing :meth:`order`, :meth:`size` and the private methods
+        giving the neighbors and the ports of vertices from their
+        identifiers.
+
+        :param names: Names of the vertices, indexed by identifiers.
+            Default to None (vertices are named by their identifiers).
+        :type names: numpy.array, optional
+        """
+        self._names = names
+        self._nameToID = None
+
+        self._distance_rows = dict()
+
+    def distance(self, u, v):
+        """Get the distance between two vertices.
+
+        :param u: Any vertex of the graph.
+        :type u: :class:`mas.graph.VertexHandle.VertexHandle`
+
+        :param v: Any vertex of the graph.
+        :type v: :class:`mas.graph.VertexHandle.VertexHandle`
+
+        :returns: The distance between the u and v (``INFTY`` if v cannot be
+            reached from u).
+        :rtype: float
+        """
+        return self.distances_from(u.id())[v.id()]
+
+    def distances_from(self, source):
+        """Get the distances from a vertex to every vertex of the graph. They
+        are computed by a breadth first search and kept in memory.
+
+        :param source: Identifier of a vertex of the graph.
+        :type source: int
+
+        :returns: An array indexed by vertex identifiers (``INFTY`` for the
+            vertices that cannot be reached). It is shared with the internal
+            caches of the graph and must not be modified.
+        :rtype: numpy.array of float
+        """
+        if source in self._distance_rows:
+            return self._distance_rows[source]
+
+        distances = np.full(self._ids_number(), -1, np.int64)
+        distances[source] = 0
+        frontier = np.array([source], np.int64)
+        depth = 0
+        while frontier.size != 0:
+            neighbors = self._frontier_neighbors(frontier)
+            frontier = np.unique(neighbors[distances[neighbors] < 0])
+            depth += 1
+            distances[frontier] = depth
+
+        row = distances.astype(float)
+        row[distances < 0] = self.INFTY
+        self._distance_rows[source] = row
+        return row
+
+    def edge_weight(self, u, v):
+        """Get the weight of an edge. Read-only graphs are unweighted.
+
+        :param u: First extremity of the edge.
+        :type u: :class:`mas.graph.VertexHandle.VertexHandle`
+
+        :param v: Second extremity of the edge.
+        :type v: :class:`mas.graph.VertexHandle.VertexHandle`
+
+        :returns: 1, None if u and v are not adjacent.
+        :rtype: float
+        """
+        if u.get_port_by_neighbor(v) is None:
+            return None
+        return 1
+
+    def get_vertex_by_id(self, ID):
+        """Get the vertex uniquely associated to an identifier.
+
+        :param ID: An identifier.
+        :type ID: int
+
+        :returns: The unique vertex associated to ID if it exists, None
+            otherwise.
+        :rtype: :class:`mas.graph.VertexHandle.VertexHandle`
+        """
+        if not (0 <= ID < self._ids_number()) or not self._has_vertex(ID):
+            return None
+        return VertexHandle(self, ID)
+
+    def get_vertex_by_name(self, name):
+        """Get a vertex of the graph given its name.
+
+        :param name: The name of a vertex of the graph.
+        :type name: string
+
+        :returns: The vertex with the largest identifier among those named
+            ``name``. None if no such vertex belongs to the graph.
+        :rtype: :class:`mas.graph.VertexHandle.VertexHandle`
+        """
+        if self._names is None:
+            if isinstance(name, (int, np.integer)):
+                return self.get_vertex_by_id(int(name))
+            return None
+        if self._nameToID is None:
+            self._nameToID = {name: ID
+                              for ID, name in enumerate(self._names.tolist())}
+        if name not in self._nameToID:
+            return None
+        return self.get_vertex_by_id(self._nameToID[name])
+
+    def get_vertex_id(self, vertex):
+        """Get the unique identifier of a vertex.
+
+        :param vertex: A vertex of the graph.
+        :type vertex: :class:`mas.graph.VertexHandle.VertexHandle`
+
+        :returns: The unique identifier of the vertex.
+        :rtype: int
+        """
+        return vertex.id()
+
+    def is_weighted(self):
+        """Test whether some edges of the graph have a weight different
+        from 1. Read-only graphs are unweighted.
+
+        :returns: False.
+        :rtype: boolean
+        """
+        return False
+
+    def order(self):
+        """Get the number of vertices of the graph.
+
+        :returns: The number of vertices of the graph.
+        :rtype: int
+        """
+        raise NotImplementedError
+
+    def random_vertex(self, rng=None):
+        """Pick a vertex of the graph uniformly at random, without listing
+        all of them.
+
+        :param rng: Random generator.
+            Default to None (the :mod:`random` module is used).
+        :type rng: numpy.random.Generator, optional
+
+        :returns: A vertex of the graph.
+        :rtype: :class:`mas.graph.VertexHandle.VertexHandle`
+        """
+        while True:
+            if rng is None:
+                ID = random.randrange(self._ids_number())
+            else:
+                ID = int(rng.integers(self._ids_number()))
+            if self._has_vertex(ID):
+                return VertexHandle(self, ID)
+
+    def size(self):
+        """Get the number of edges of the graph.
+
+        :returns: The number of edges of the graph.
+        :rtype: int
+        """
+        raise NotImplementedError
+
+    def vertices(self):
+        """Get all the vertices of the graph.
+
+        :returns: The vertices of the graph, associated to their unique
+            identifier.
+        :rtype: dict
+        """
+        return {VertexHandle(self, ID): ID
+                for ID in range(self._ids_number())
+                if self._has_vertex(ID)}
+
+    def _frontier_neighbors(self, frontier):
+        # Identifiers of all the neighbors of the vertices of frontier.
+        raise NotImplementedError
+
+    def _has_vertex(self, ID):
+        return True
+
+    def _ids_number(self):
+        return self.order()
+
+    def _neighbor_id(self, ID, port):
+        # Identifier of the neighbor reached through port, or -1.
+        raise NotImplementedError
+
+    def _port_to(self, ID, neighbor_ID):
+        # Port leading to the given neighbor, or None.
+        raise NotImplementedError
+
+    def _ports(self, ID):
+        # Sorted list of the ports of the vertex.
+        raise NotImplementedError
+
+    def _vertex_name(self, ID):
+        if self._names is None:
+            return ID
+        return self._names[ID].item()
+
+    @staticmethod
+    def _names_array(names):
+        # Store names as int64 if they all are integers, and as fixed-length
+        # unicode strings otherwise. Returns the array, a kind (1 or 2) and
+        # the length of strings.
+        if all(isinstance(name, (int, np.integer)) for name in names):
+            return np.array(names, np.int64), 1, 0
+        array = np.array([str(name) for name in names])
+        if array.size == 0:
+            array = array.astype("<U1")
+        return array, 2, array.dtype.itemsize // 4
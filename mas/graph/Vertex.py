@@ -146,12 +146,11 @@ class Vertex:
         :rtype: boolean
 
         """
-        if len(self._portToNeighbor.values()) != len(portToNeighbor.values()):
+        if len(self._portToNeighbor) != len(portToNeighbor):
             return False
 
-        for vertex in self._portToNeighbor.values():
-            if vertex not in portToNeighbor.values():
-                return False
+        if set(self._portToNeighbor.values()) != set(portToNeighbor.values()):
+            return False
         self._portToNeighbor = portToNeighbor
         return True
 
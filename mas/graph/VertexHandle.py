@@ -0,0 +1,104 @@
+class VertexHandle:
+    """A vertex of an array-backed topology.
+    """
+
+    def __init__(self, graph, ID):
+        """A lightweight vertex, only made of a topology and an identifier.
+        Handles are created on demand and hold no adjacency: every query is
+        forwarded to the topology they belong to. Two handles are equal if
+        they belong to the same topology and have the same identifier.
+        The neighbor and port API is the same as the one of
+        :class:`mas.graph.Vertex.Vertex`.
+
+        :param graph: The topology of the vertex.
+        :type graph: :class:`mas.graph.ArrayGraph.ArrayGraph`
+
+        :param ID: Identifier of the vertex in ``graph``.
+        :type ID: int
+        """
+        self._graph = graph
+        self._id = ID
+
+    def get_neighbor_by_port(self, port):
+        """Get a neighbor given a port.
+
+        :param port: Port number.
+        :type port: int
+
+        :returns: The neighbor reached when following the given port. If the
+            port does not exist, then returns None.
+        :rtype: :class:`mas.graph.VertexHandle.VertexHandle`
+        """
+        ID = self._graph._neighbor_id(self._id, port)
+        if ID < 0:
+            return None
+        return self._graph.get_vertex_by_id(ID)
+
+    def get_neighbors(self):
+        """Get the list of all the neighbors.
+
+        :returns: All the neighbors of the current vertex, sorted by port.
+        :rtype: list
+        """
+        return list(self.get_port_associations().values())
+
+    def get_port_associations(self):
+        """Get all the ports available from the vertex, associated to the
+        vertices they lead to.
+
+        :returns: A dictionary of vertices keyed by ports (int)
+        :rtype: dict
+        """
+        return {port: self.get_neighbor_by_port(port)
+                for port in self.get_ports()}
+
+    def get_port_by_neighbor(self, neighbor):
+        """Get the port leading to the given neighbor.
+
+        :param neighbor: A vertex.
+        :type neighbor: :class:`mas.graph.VertexHandle.VertexHandle`
+
+        :returns: The port leading to neighbor. None, if neighbor is not an
+            actual neighbor of the vertex.
+        :rtype: int
+        """
+        if neighbor._graph is not self._graph:
+            return None
+        return self._graph._port_to(self._id, neighbor._id)
+
+    def get_ports(self):
+        """Get all the ports available.
+
+        :returns: The ports available from the given vertex.
+        :rtype: list
+        """
+        return self._graph._ports(self._id)
+
+    def id(self):
+        """Get the identifier of the vertex in its topology.
+
+        :returns: Vertex identifier.
+        :rtype: int
+        """
+        return self._id
+
+    def name(self):
+        """Get the name of the vertex.
+
+        :returns: Vertex name.
+        :rtype: string
+        """
+        return self._graph._vertex_name(self._id)
+
+    def __eq__(self, other):
+        return (isinstance(other, VertexHandle) and
+                other._graph is self._graph and other._id == self._id)
+
+    def __hash__(self):
+        return hash(self._id)
+
+    def __str__(self):
+        str = f"{self.name()} : {'{'}"
+        str += ", ".join(f"{v.name()}" for v in self.get_neighbors())
+        str += "}"
+        return str
@@ -46,6 +46,23 @@ Module classes
 
     * :class:`mas.graph.Graph.Graph`
     * :class:`mas.graph.Vertex.Vertex`
+    * :class:`mas.graph.ReadOnlyGraph.ReadOnlyGraph`
+    * :class:`mas.graph.ArrayGraph.ArrayGraph`
+    * :class:`mas.graph.GraphView.GraphView`
+    * :class:`mas.graph.FrozenGraph.FrozenGraph`
+    * :class:`mas.graph.CompressedGraph.CompressedGraph`
+    * :class:`mas.graph.ImplicitGraph.ImplicitGraph`
+    * :class:`mas.graph.ImplicitPath.ImplicitPath`
+    * :class:`mas.graph.ImplicitCycle.ImplicitCycle`
+    * :class:`mas.graph.ImplicitGrid.ImplicitGrid`
+    * :class:`mas.graph.ImplicitTorus.ImplicitTorus`
+    * :class:`mas.graph.ImplicitHypercube.ImplicitHypercube`
+    * :class:`mas.graph.ImplicitBinaryTree.ImplicitBinaryTree`
+    * :class:`mas.graph.LazyGraph.LazyGraph`
+    * :class:`mas.graph.LazyRandomTree.LazyRandomTree`
+    * :class:`mas.graph.LazyRandomRegularGraph.LazyRandomRegularGraph`
+    * :class:`mas.graph.VertexHandle.VertexHandle`
+    * :class:`mas.graph.GraphCache.GraphCache`
 
 Module content
 --------------
@@ -57,8 +74,82 @@ Module content
     :members:
     :special-members: __init__
 
+.. autoclass:: mas.graph.ReadOnlyGraph.ReadOnlyGraph
+    :members:
+    :special-members: __init__
+
+.. autoclass:: mas.graph.ArrayGraph.ArrayGraph
+    :members:
+    :special-members: __init__
+
+.. autoclass:: mas.graph.GraphView.GraphView
+    :members:
+    :special-members: __init__
+
+.. autoclass:: mas.graph.FrozenGraph.FrozenGraph
+    :members:
+    :special-members: __init__
+
+.. autoclass:: mas.graph.CompressedGraph.CompressedGraph
+    :members:
+    :special-members: __init__
+
+.. autoclass:: mas.graph.ImplicitGraph.ImplicitGraph
+    :members:
+    :special-members: __init__
+
+.. autoclass:: mas.graph.ImplicitPath.ImplicitPath
+    :members:
+    :special-members: __init__
+
+.. autoclass:: mas.graph.ImplicitCycle.ImplicitCycle
+    :members:
+    :special-members: __init__
+
+.. autoclass:: mas.graph.ImplicitGrid.ImplicitGrid
+    :members:
+    :special-members: __init__
+
+.. autoclass:: mas.graph.ImplicitTorus.ImplicitTorus
+    :members:
+    :special-members: __init__
+
+.. autoclass:: mas.graph.ImplicitHypercube.ImplicitHypercube
+    :members:
+    :special-members: __init__
+
+.. autoclass:: mas.graph.ImplicitBinaryTree.ImplicitBinaryTree
+    :members:
+    :special-members: __init__
+
+.. autoclass:: mas.graph.LazyGraph.LazyGraph
+    :members:
+    :special-members: __init__
+
+.. autoclass:: mas.graph.LazyRandomTree.LazyRandomTree
+    :members:
+    :special-members: __init__
+
+.. autoclass:: mas.graph.LazyRandomRegularGraph.LazyRandomRegularGraph
+    :members:
+    :special-members: __init__
+
+.. autoclass:: mas.graph.VertexHandle.VertexHandle
+    :members:
+    :special-members: __init__
+
+.. autoclass:: mas.graph.GraphCache.GraphCache
+    :members:
+    :special-members: __init__
+
 .. automodule:: mas.graph.graph_generator
     :members:
+
+.. automodule:: mas.graph.graph_algorithms
+    :members:
+
+.. automodule:: mas.graph.graph_memory
+    :members:
 """
 
 __author__ = 'Sébastien Ratel'
@@ -66,5 +157,24 @@ __author__ = 'Sébastien Ratel'
 __all__ = [
     "Graph",
     "Vertex",
-    "graph_generator"
+    "ReadOnlyGraph",
+    "ArrayGraph",
+    "GraphView",
+    "FrozenGraph",
+    "CompressedGraph",
+    "ImplicitGraph",
+    "ImplicitPath",
+    "ImplicitCycle",
+    "ImplicitGrid",
+    "ImplicitTorus",
+    "ImplicitHypercube",
+    "ImplicitBinaryTree",
+    "LazyGraph",
+    "LazyRandomTree",
+    "LazyRandomRegularGraph",
+    "VertexHandle",
+    "GraphCache",
+    "graph_generator",
+    "graph_algorithms",
+    "graph_memory",
 ]
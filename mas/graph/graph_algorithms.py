@@ -0,0 +1,333 @@
+"""Array-based graph traversals.
+
+The functions of this module work on *port tables*, i.e., on the flat arrays
+built by :meth:`mas.graph.Graph.Graph.port_table`: for every vertex identifier
+``u``, the slots ``offsets[u]`` to ``offsets[u+1] - 1`` of ``targets`` contain,
+for each port ``p`` of ``u``, the identifier of the neighbor reached through
+``p`` (at slot ``offsets[u] + p``), or -1 if ``p`` is not used.
+"""
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import (breadth_first_order, connected_components,
+                                  dijkstra as sparse_dijkstra,
+                                  reverse_cuthill_mckee)
+
+
+def ball(offsets, targets, source, radius, visited=None):
+    """Breadth first search from a vertex, bounded to a given depth.
+
+    :param offsets: Offsets of the port table.
+    :type offsets: numpy.array of int
+
+    :param targets: Targets of the port table.
+    :type targets: numpy.array of int
+
+    :param source: Identifier of the starting vertex.
+    :type source: int
+
+    :param radius: Maximum depth of the search.
+    :type radius: int
+
+    :param visited: Work array indexed by vertex identifiers, entirely False.
+        It is left entirely False on return, so that it can be shared by
+        successive searches.
+        Default to None (a new array is allocated).
+    :type visited: numpy.array of bool, optional
+
+    :returns: The identifiers of the vertices at distance at most ``radius``
+        from ``source``, sorted by distance, then by identifier.
+    :rtype: numpy.array of int
+    """
+    if visited is None:
+        visited = np.zeros(len(offsets) - 1, bool)
+
+    frontier = np.array([source], np.int64)
+    visited[source] = True
+    layers = [frontier]
+    for _ in range(radius):
+        neighbors = targets[expand(offsets, frontier)]
+        neighbors = neighbors[neighbors >= 0]
+        frontier = np.unique(neighbors[~visited[neighbors]])
+        if frontier.size == 0:
+            break
+        visited[frontier] = True
+        layers.append(frontier)
+
+    vertices = np.concatenate(layers)
+    visited[vertices] = False
+    return vertices
+
+
+def bfs(offsets, targets, source):
+    """Breadth first search from a vertex, one level at a time.
+
+    :param offsets: Offsets of the port table.
+    :type offsets: numpy.array of int
+
+    :param targets: Targets of the port table.
+    :type targets: numpy.array of int
+
+    :param source: Identifier of the starting vertex.
+    :type source: int
+
+    :returns: Two arrays indexed by vertex identifiers: the distance from
+        ``source`` (-1 for unreachable vertices), and the slot through which
+        every vertex was discovered (-1 for ``source`` and unreachable
+        vertices).
+    :rtype: tuple of numpy.array
+    """
+    order = len(offsets) - 1
+    distances = np.full(order, -1, np.int64)
+    parents = np.full(order, -1, np.int64)
+
+    distances[source] = 0
+    frontier = np.array([source], np.int64)
+    depth = 0
+    while frontier.size != 0:
+        slots = expand(offsets, frontier)
+        neighbors = targets[slots]
+        new = neighbors >= 0
+        new[new] = distances[neighbors[new]] < 0
+        frontier, first = np.unique(neighbors[new], return_index=True)
+        depth += 1
+        distances[frontier] = depth
+        parents[frontier] = slots[new][first]
+
+    return distances, parents
+
+
+def components(offsets, targets):
+    """Compute the connected components of a graph (edges are considered as
+    undirected).
+
+    :param offsets: Offsets of the port table.
+    :type offsets: numpy.array of int
+
+    :param targets: Targets of the port table.
+    :type targets: numpy.array of int
+
+    :returns: The number of connected components, and an array indexed by
+        vertex identifiers containing the label (between 0 and the number of
+        components - 1) of the component of every vertex.
+    :rtype: tuple (int, numpy.array)
+    """
+    return connected_components(to_sparse(offsets, targets), directed=True,
+                                connection="weak")
+
+
+def dijkstra(offsets, targets, weights, source):
+    """Shortest paths from a vertex in a graph with positive edge weights
+    (Dijkstra's algorithm, with a binary heap).
+
+    :param offsets: Offsets of the port table.
+    :type offsets: numpy.array of int
+
+    :param targets: Targets of the port table.
+    :type targets: numpy.array of int
+
+    :param weights: Weight of every slot of the port table.
+    :type weights: numpy.array of float
+
+    :param source: Identifier of the starting vertex.
+    :type source: int
+
+    :returns: Two arrays indexed by vertex identifiers: the distance from
+        ``source`` (``numpy.inf`` for unreachable vertices), and the slot
+        through which every vertex is reached along a shortest path (-1 for
+        ``source`` and unreachable vertices), as in :func:`bfs`.
+    :rtype: tuple of numpy.array
+    """
+    order = len(offsets) - 1
+    owners = np.repeat(np.arange(order), np.diff(offsets))
+    distances, predecessors = sparse_dijkstra(
+        to_sparse(offsets, targets, weights), indices=source,
+        return_predecessors=True)
+
+    # Among the slots from the predecessor of every vertex to this vertex,
+    # the lightest one is on a shortest path.
+    slots = np.flatnonzero(targets >= 0)
+    slots = slots[predecessors[targets[slots]] == owners[slots]]
+    slots = slots[np.argsort(weights[slots], kind="stable")]
+    reached, first = np.unique(targets[slots], return_index=True)
+    parents = np.full(order, -1, np.int64)
+    parents[reached] = slots[first]
+
+    return distances, parents
+
+
+def expand(offsets, frontier):
+    """Get the slots of the port table segments of several vertices.
+
+    :param offsets: Offsets of the port table.
+    :type offsets: numpy.array of int
+
+    :param frontier: Identifiers of vertices.
+    :type frontier: numpy.array of int
+
+    :returns: The concatenation of the slots of every vertex of
+        ``frontier``, in the order of ``frontier``.
+    :rtype: numpy.array of int
+    """
+    starts = offsets[frontier]
+    return ranges(starts, offsets[frontier + 1] - starts)
+
+
+def locality_ordering(offsets, targets, method="rcm"):
+    """Compute an ordering of the vertices placing neighbors close to each
+    other, in order to improve the memory locality of traversals.
+
+    :param offsets: Offsets of the port table.
+    :type offsets: numpy.array of int
+
+    :param targets: Targets of the port table.
+    :type targets: numpy.array of int
+
+    :param method: "rcm" for the Reverse Cuthill-McKee ordering, "bfs" for
+        breadth first search order (component by component, starting from
+        their smallest identifier), or "degree" for decreasing degrees.
+        Default to "rcm".
+    :type method: string, optional
+
+    :returns: A permutation ``perm`` of the vertex identifiers, such that
+        ``perm[i]`` is the identifier of the i-th vertex in the new order.
+    :rtype: numpy.array of int
+
+    :raises ValueError: If ``method`` is unknown.
+    """
+    order = len(offsets) - 1
+    if method == "rcm":
+        matrix = to_sparse(offsets, targets)
+        return reverse_cuthill_mckee(matrix, symmetric_mode=True).astype(
+            np.int64)
+    if method == "bfs":
+        matrix = to_sparse(offsets, targets)
+        visited = np.zeros(order, bool)
+        parts = []
+        for source in range(order):
+            if visited[source]:
+                continue
+            part = breadth_first_order(matrix, source, directed=False,
+                                       return_predecessors=False)
+            visited[part] = True
+            parts.append(part)
+        if len(parts) == 0:
+            return np.empty(0, np.int64)
+        return np.concatenate(parts).astype(np.int64)
+    if method == "degree":
+        owners = np.repeat(np.arange(order), np.diff(offsets))
+        degrees = np.bincount(owners[targets >= 0], minlength=order)
+        return np.argsort(-degrees, kind="stable").astype(np.int64)
+    raise ValueError(f"unknown ordering method {method}.")
+
+
+def port_labeling(offsets, targets, method="random", rng=None):
+    """Draw new port numbers for the neighbors of all the vertices at once.
+    Every vertex of degree d gets the ports 0 to d - 1.
+
+    :param offsets: Offsets of the port table.
+    :type offsets: numpy.array of int
+
+    :param targets: Targets of the port table.
+    :type targets: numpy.array of int
+
+    :param method: "random" for independent uniformly random permutations,
+        "sorted" for neighbors sorted by identifier, or "rotation" for
+        neighbors sorted by identifier and then rotated by a random offset
+        (so that the cyclic order of the neighbors is the same for every
+        vertex).
+        Default to "random".
+    :type method: string, optional
+
+    :param rng: Random generator.
+        Default to None (a new generator is created).
+    :type rng: numpy.random.Generator, optional
+
+    :returns: The offsets and the targets of the new port table.
+    :rtype: tuple of numpy.array
+
+    :raises ValueError: If ``method`` is unknown.
+    """
+    if method not in ("random", "sorted", "rotation"):
+        raise ValueError(f"unknown labeling method {method}.")
+    if rng is None:
+        rng = np.random.default_rng()
+
+    order = len(offsets) - 1
+    owners = np.repeat(np.arange(order), np.diff(offsets))
+    used = targets >= 0
+    owners, neighbors = owners[used], targets[used]
+    degrees = np.bincount(owners, minlength=order)
+    new_offsets = np.zeros(order + 1, np.int64)
+    np.cumsum(degrees, out=new_offsets[1:])
+
+    if method == "random":
+        keys = rng.random(len(neighbors))
+    else:
+        keys = neighbors
+    sort = np.lexsort((keys, owners))
+    owners, neighbors = owners[sort], neighbors[sort]
+    if method != "rotation":
+        return new_offsets, neighbors
+
+    shifts = rng.integers(0, np.maximum(degrees, 1))
+    ranks = np.arange(len(neighbors)) - new_offsets[owners]
+    new_targets = np.empty_like(neighbors)
+    new_targets[new_offsets[owners] +
+                (ranks + shifts[owners]) % degrees[owners]] = neighbors
+    return new_offsets, new_targets
+
+
+def ranges(starts, lengths):
+    """Concatenate several ranges of integers.
+
+    :param starts: First integer of every range.
+    :type starts: numpy.array of int
+
+    :param lengths: Length of every range.
+    :type lengths: numpy.array of int
+
+    :returns: The concatenation of the ranges ``starts[i]``, ...,
+        ``starts[i] + lengths[i] - 1``, for every i.
+    :rtype: numpy.array of int
+    """
+    total = lengths.sum()
+    if total == 0:
+        return np.empty(0, np.int64)
+    shifts = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+    return np.arange(total, dtype=np.int64) + shifts
+
+
+def to_sparse(offsets, targets, weights=None):
+    """Get the adjacency matrix of a graph as a sparse matrix.
+
+    :param offsets: Offsets of the port table.
+    :type offsets: numpy.array of int
+
+    :param targets: Targets of the port table.
+    :type targets: numpy.array of int
+
+    :param weights: If not None, weight of every slot of the port table.
+        When several slots link the same two vertices, the lightest one is
+        kept.
+        Default to None (every entry is 1).
+    :type weights: numpy.array of float, optional
+
+    :returns: The (directed) adjacency matrix of the graph.
+    :rtype: scipy.sparse.csr_matrix
+    """
+    order = len(offsets) - 1
+    owners = np.repeat(np.arange(order), np.diff(offsets))
+    used = targets >= 0
+    if weights is None:
+        return csr_matrix(
+            (np.ones(used.sum(), np.int8), (owners[used], targets[used])),
+            shape=(order, order))
+
+    slots = np.flatnonzero(used)
+    slots = slots[np.argsort(weights[slots], kind="stable")]
+    _, first = np.unique(owners[slots] * order + targets[slots],
+                         return_index=True)
+    slots = slots[first]
+    return csr_matrix((weights[slots], (owners[slots], targets[slots])),
+                      shape=(order, order))
@@ -0,0 +1,78 @@
+"""Memory accounting helpers.
+
+The functions of this module estimate the memory used by Python containers
+and objects. Numpy arrays are measured exactly (``nbytes``), containers by
+their own size (``sys.getsizeof``) and collections of objects by measuring a
+sample of them, so that reports stay cheap on large graphs.
+"""
+
+import numpy as np
+import sys
+
+
+def arrays_size(arrays):
+    """Get the memory used by the data of several numpy arrays.
+
+    :param arrays: Numpy arrays (None values are ignored).
+    :type arrays: iterable
+
+    :returns: A number of bytes.
+    :rtype: int
+    """
+    return sum(int(array.nbytes) for array in arrays if array is not None)
+
+
+def container_size(container):
+    """Get the memory used by a container itself, not by the objects it
+    refers to (e.g., the hash table of a dictionary).
+
+    :param container: A list, dictionary, set, ...
+    :type container: object
+
+    :returns: A number of bytes.
+    :rtype: int
+    """
+    return sys.getsizeof(container)
+
+
+def object_size(obj):
+    """Get the memory used by an object, its attributes dictionary and its
+    attributes (without following the objects they refer to).
+
+    :param obj: Any object.
+    :type obj: object
+
+    :returns: A number of bytes.
+    :rtype: int
+    """
+    if isinstance(obj, np.ndarray):
+        return sys.getsizeof(obj) + int(obj.nbytes)
+    size = sys.getsizeof(obj)
+    attributes = getattr(obj, "__dict__", None)
+    if attributes is not None:
+        size += sys.getsizeof(attributes)
+        size += sum(sys.getsizeof(value) for value in attributes.values())
+    return size
+
+
+def sampled_size(objects, sample_size=100):
+    """Estimate the memory used by a collection of objects (see
+    :func:`object_size`) from a sample of evenly spaced objects.
+
+    :param objects: Objects to measure.
+    :type objects: iterable
+
+    :param sample_size: Maximum number of objects actually measured.
+        Default to 100.
+    :type sample_size: int, optional
+
+    :returns: A number of bytes (exact if there are at most ``sample_size``
+        objects).
+    :rtype: int
+    """
+    objects = list(objects)
+    if len(objects) <= sample_size:
+        return sum(object_size(obj) for obj in objects)
+    indices = np.linspace(0, len(objects) - 1, sample_size).astype(np.int64)
+    sample = sum(object_size(objects[i]) for i in indices.tolist())
+    return int(sample * len(objects) / sample_size)
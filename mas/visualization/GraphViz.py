@@ -1,5 +1,8 @@
 import networkx as nx
+import numpy as np
+import sys
 from mas.graph.Graph import Graph
+from mas.graph.graph_memory import container_size, sampled_size
 
 
 class GraphViz(Graph):
@@ -131,6 +134,23 @@ class GraphViz(Graph):
         """
         return self._vertex_radius
 
+    def memory_usage(self):
+        """Get the memory used by the graph and its drawing, broken down by
+        component. See :meth:`mas.graph.Graph.Graph.memory_usage`.
+
+        :returns: Numbers of bytes keyed by component, including
+            "layout_positions" (coordinates of the vertices in the canvas),
+            and "total".
+        :rtype: dict
+        """
+        report = Graph.memory_usage(self)
+        positions = self._vertexToPosition
+        report["layout_positions"] = (
+            container_size(positions) + sampled_size(positions.values()) +
+            2 * sys.getsizeof(0.0) * len(positions))
+        report["total"] += report["layout_positions"]
+        return report
+
     def remove_vertex(self, vertex):
         """
           See :meth:`mas.graph.Graph.Graph.remove_vertex()`.
@@ -208,14 +228,18 @@ class GraphViz(Graph):
         if self._positions_computed:
             return
 
-        adjMat = self.adjacency_matrix()
-        G = nx.from_numpy_array(adjMat)
-        pos = self._nx_layout(G)
+        pos = self._load_from_cache(f"layout-{self._layout_method}")
+        if pos is None:
+            adjMat = self.adjacency_matrix()
+            G = nx.from_numpy_array(adjMat)
+            layout = self._nx_layout(G)
+            pos = np.array([layout[i] for i in range(self.order())], float)
+            self._store_in_cache(f"layout-{self._layout_method}", pos)
 
         for v in self.vertices():
             vertexID = self.get_vertex_id(v)
             # * self._position_scaling
-            self._vertexToPosition[v] = pos[vertexID]
+            self._vertexToPosition[v] = tuple(pos[vertexID])
 
         xmin = min([self._vertexToPosition[v][0] for v in self.vertices()])
         ymin = min([self._vertexToPosition[v][1] for v in self.vertices()])
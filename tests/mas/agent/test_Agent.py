@@ -148,7 +148,7 @@ def test_get_moves_nb():
     G, _, _ = _edge_graph()
 
     sim = Simulation(G, algorithm=move)
-    agent = sim.get_agent(0)
+    agent = sim.get_all_agents()[0]
 
     assert agent.get_moves_nb() == 0
 
@@ -163,7 +163,7 @@ def test_get_sim_step_synchronous():
     G, _ = _trivial_graph()
 
     sim = Simulation(G)
-    agent = sim.get_agent(0)
+    agent = sim.get_all_agents()[0]
 
     assert agent.get_sim_step() == 1
 
@@ -178,7 +178,7 @@ def test_get_sim_step_asynchronous():
     G, _ = _trivial_graph()
 
     sim = Simulation(G, synchronous=False)
-    agent = sim.get_agent(0)
+    agent = sim.get_all_agents()[0]
 
     assert agent.get_sim_step() is None
 
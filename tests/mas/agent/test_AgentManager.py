@@ -137,3 +137,30 @@ def test_notify_all_encounters():
     manager.move_multiple_agents([(a3, 0), (a4, 1)])
     assert manager.get_agent_position_contains_mate(a1)
     assert manager.get_agent_position_contains_mate(a2)
+
+
+def test_agents_at():
+    G, u, v = _edge_graph()
+
+    agents = [Agent(desired_position=u) for _ in range(4)]
+    manager = AgentManager(agents, G)
+    assert manager.count_at(u) == 4
+    assert manager.count_at(v) == 0
+    assert manager.agents_at(v) == []
+
+    manager.move_agent(agents[1], 0)
+    assert sorted(manager.agents_at(u), key=agents.index) == \
+        [agents[0], agents[2], agents[3]]
+    assert manager.agents_at(v) == [agents[1]]
+
+    for agent in [agents[0], agents[3], agents[2]]:
+        manager.move_agent(agent, 0)
+    assert manager.count_at(u) == 0
+    assert manager.count_at(v) == 4
+    assert manager.get_occupied_positions() == [v]
+
+    manager.move_agent(agents[2], 0)
+    manager.move_agent(agents[3], 0)
+    assert manager.get_agent_position_contains_mate(agents[1])
+    manager.move_agent(agents[0], 0)
+    assert not manager.get_agent_position_contains_mate(agents[1])
@@ -0,0 +1,193 @@
+import pickle
+import pytest
+
+from mas.agent.ArrayAgentManager import ArrayAgentManager
+from mas.agent.Simulation import Simulation
+from mas.graph.Graph import Graph
+from mas.graph.Vertex import Vertex
+from mas.graph.ImplicitGrid import ImplicitGrid
+from mas.graph.ImplicitTorus import ImplicitTorus
+from mas.graph.LazyRandomTree import LazyRandomTree
+
+from mas.agent.Agent import Agent
+
+
+def _edge_graph():
+    G = Graph()
+    u = Vertex(1)
+    v = Vertex(2)
+    G.add_vertex(u)
+    G.add_vertex(v)
+    G.add_edge(u, v)
+
+    return G, u, v
+
+
+def move(agent):
+    agent.move_along(agent.available_ports()[0])
+
+
+def test_init():
+    G, u, v = _edge_graph()
+
+    a1 = Agent(desired_id=3, desired_position=u, desired_latency=1)
+    a2 = Agent(desired_id=3, desired_position=u, desired_latency=None)
+    a3 = Agent(desired_position=v)
+
+    manager = ArrayAgentManager([a1, a2, a3], G, possible_latencies=[2, 3])
+
+    assert manager.get_agent_id(a1) == 3
+    assert not manager.get_agent_id(a2) == 3
+    assert manager.get_agent_latency(a1) == 1
+    assert manager.get_agent_latency(a2) in [2, 3]
+    assert manager.get_agent_position(a1) == u
+    assert manager.get_agent_position(a3) == v
+    assert manager.get_agent_port_back(a1) is None
+    assert manager.get_agent_last_move(a1) == 0
+    assert manager.contains_mate().tolist() == [True, True, False]
+
+
+def test_move_agent():
+    G, u, v = _edge_graph()
+
+    a1 = Agent(desired_position=u)
+    a2 = Agent(desired_position=v)
+
+    manager = ArrayAgentManager([a1, a2], G)
+    assert not manager.get_agent_position_contains_mate(a1)
+
+    manager.move_agent(a1, 0)
+    manager.agent_moved(a1, 4)
+    assert manager.get_agent_position(a1) == v
+    assert manager.get_agent_port_back(a1) == 0
+    assert manager.get_agent_last_move(a1) == 4
+    assert manager.get_agent_position_contains_mate(a1)
+    assert manager.get_agent_position_contains_mate(a2)
+    assert manager.get_occupied_positions() == [v]
+
+
+def test_move_multiple_agents():
+    G, u, v = _edge_graph()
+    w = Vertex(3)
+    G.add_vertex(w)
+    G.add_edge(u, w)
+    G.add_edge(v, w)
+
+    a1 = Agent(desired_position=u)
+    a2 = Agent(desired_position=v)
+    a3 = Agent(desired_position=w)
+    a4 = Agent(desired_position=w)
+
+    manager = ArrayAgentManager([a1, a2, a3, a4], G)
+    manager.move_multiple_agents([(a3, 0), (a4, 1)])
+
+    assert manager.get_agent_position(a3) == u
+    assert manager.get_agent_position(a4) == v
+    assert manager.contains_mate().tolist() == [True] * 4
+    assert manager.positions().tolist() == [G.get_vertex_id(u),
+                                            G.get_vertex_id(v),
+                                            G.get_vertex_id(u),
+                                            G.get_vertex_id(v)]
+
+
+def test_read_only_views():
+    G, u, v = _edge_graph()
+    a = Agent(desired_position=u)
+    manager = ArrayAgentManager([a], G)
+
+    positions = manager.positions()
+    with pytest.raises(ValueError):
+        positions[0] = 1
+    manager.move_agent(a, 0)
+    assert positions[0] == G.get_vertex_id(v)
+
+
+def test_simulation():
+    G = ImplicitGrid(5, 5)
+    sim = Simulation(G, algorithm=move, agents_number=30,
+                     agents_manager_class=ArrayAgentManager)
+    sim.step_algo()
+    sim.step_algo()
+
+    manager = sim.get_agents_manager()
+    assert isinstance(manager, ArrayAgentManager)
+    for agent in sim.get_all_agents():
+        assert agent.get_moves_nb() == 2
+        assert (manager.get_agent_position(agent).id() ==
+                manager.positions()[manager.get_agent_slot(agent)])
+
+    sim2 = pickle.loads(pickle.dumps(sim))
+    manager2 = sim2.get_agents_manager()
+    assert manager2.positions().tolist() == manager.positions().tolist()
+    assert manager2.memory_usage()["positions"] == 30 * 8
+
+
+def test_agents_at():
+    G, u, v = _edge_graph()
+
+    agents = [Agent(desired_position=u) for _ in range(3)]
+    manager = ArrayAgentManager(agents, G)
+    assert manager.count_at(u) == 3
+    assert manager.agents_at(v) == []
+
+    manager.move_agent(agents[1], 0)
+    assert manager.agents_at(u) == [agents[0], agents[2]]
+    assert manager.agents_at(v) == [agents[1]]
+    assert not manager.get_agent_position_contains_mate(agents[1])
+
+    manager.move_multiple_agents([(agents[0], 0), (agents[1], 0)])
+    assert manager.count_at(u) == 2
+    assert manager.count_at(v) == 1
+    assert manager.contains_mate().tolist() == [False, True, True]
+
+
+def test_agents_at_after_single_moves():
+    G = ImplicitGrid(3, 3)
+    sim = Simulation(G, algorithm=move, agents_number=20, synchronous=False,
+                     agents_manager_class=ArrayAgentManager, seed=3)
+    manager = sim.get_agents_manager()
+    vertices = [G.get_vertex_by_id(ID) for ID in range(G.order())]
+    manager.agents_at(vertices[0])
+
+    for _ in range(5):
+        sim.step_algo()
+        for vertex in vertices:
+            expected = [agent for agent in sim.get_all_agents()
+                        if manager.get_agent_position(agent) == vertex]
+            assert manager.count_at(vertex) == len(expected)
+            assert sorted(manager.agents_at(vertex), key=id) == \
+                sorted(expected, key=id)
+        mates = [manager.count_at(manager.get_agent_position(agent)) > 1
+                 for agent in manager.agents()]
+        assert manager.contains_mate().tolist() == mates
+
+
+def test_move_slots():
+    G, u, v = _edge_graph()
+    agents = [Agent(desired_position=u) for _ in range(3)]
+    manager = ArrayAgentManager(agents, G)
+    manager.agents_at(u)
+
+    manager.move_slots([0, 2], [G.get_vertex_id(v)] * 2, [0, 0], 1)
+    assert manager.count_at(u) == 1
+    assert sorted(manager.agents_at(v), key=id) == \
+        sorted([agents[0], agents[2]], key=id)
+    assert manager.contains_mate().tolist() == [True, False, True]
+    assert manager.get_occupied_positions() == [u, v]
+
+
+def test_huge_topologies():
+    G = ImplicitTorus(40000, 25000)
+    sim = Simulation(G, algorithm=move, agents_number=100,
+                     agents_manager_class=ArrayAgentManager)
+    sim.step_algo()
+    manager = sim.get_agents_manager()
+    assert sum(manager.count_at(vertex)
+               for vertex in manager.get_occupied_positions()) == 100
+    assert manager.memory_usage()["occupancy"] < 100000
+
+    T = LazyRandomTree(3, 40, seed=1)
+    sim = Simulation(T, algorithm=move, agents_number=5,
+                     agents_manager_class=ArrayAgentManager)
+    sim.step_algo()
+    assert len(sim.get_agents_manager().contains_mate()) == 5
@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+import random
+
+from mas.agent.Agent import Agent
+from mas.agent.BatchSimulation import BatchSimulation
+from mas.agent.Simulation import Simulation
+from mas.graph.graph_generator import grid, random_graph
+
+
+def next_port(agent):
+    # Leave through the port following the port back.
+    ports = agent.available_ports()
+    port_back = agent.get_port_back()
+    if port_back is None:
+        agent.move_along(ports[0])
+    else:
+        agent.move_along(ports[(ports.index(port_back) + 1) % len(ports)])
+
+
+def batched_next_port(step, positions, widths, ports_back, mates, state):
+    return np.where(ports_back < 0, 0, (ports_back + 1) % widths)
+
+
+def _agents(G, number):
+    vertices = list(G.vertices())
+    return [Agent(desired_position=random.choice(vertices),
+                  desired_latency=random.choice([1, 2]))
+            for _ in range(number)]
+
+
+def test_matches_simulation():
+    random.seed(3)
+    G = grid(6, 7)
+    agents = _agents(G, 40)
+    batch_agents = [Agent(desired_position=a.desired_initial_position(),
+                          desired_latency=a.desired_latency())
+                    for a in agents]
+
+    sim = Simulation(G, algorithm=next_port, agents_list=agents)
+    for agent in agents:
+        agent.join_to_simulation(sim)
+    batch = BatchSimulation(G, batched_next_port, agents_list=batch_agents)
+
+    for _ in range(30):
+        sim.step_algo()
+        batch.step_algo()
+
+    manager = sim.get_agents_manager()
+    batch_manager = batch.get_agents_manager()
+    for agent, batch_agent in zip(agents, batch_agents):
+        assert (manager.get_agent_position(agent) ==
+                batch_manager.get_agent_position(batch_agent))
+        assert (manager.get_agent_port_back(agent) ==
+                batch_manager.get_agent_port_back(batch_agent))
+        assert (manager.get_agent_position_contains_mate(agent) ==
+                batch_manager.get_agent_position_contains_mate(batch_agent))
+    assert (batch.moves_numbers().tolist() ==
+            [agent.get_moves_nb() for agent in agents])
+
+
+def test_illegal_ports_and_state():
+    G = random_graph(30, 0.2)
+
+    def policy(step, positions, widths, ports_back, mates, state):
+        state["calls"] += 1
+        return np.where(state["calls"] % 2 == 0, widths, -1)
+
+    batch = BatchSimulation(G, policy, agents_number=10,
+                            state={"calls": np.zeros(10, np.int64)})
+    before = batch.get_agents_manager().positions().copy()
+    batch.step_algo()
+    batch.step_algo()
+
+    assert batch.get_step() == 3
+    assert batch.get_state()["calls"].tolist() == [2] * 10
+    assert batch.get_agents_manager().positions().tolist() == before.tolist()
+    assert batch.moves_numbers().tolist() == [0] * 10
+
+
+def test_port_holes():
+    G = grid(3, 3)
+    center = G.get_vertex_by_name("(1,1)")
+    G.remove_edge(center, center.get_neighbor_by_port(1))
+    hole = [Agent(desired_position=center)]
+    batch_hole = [Agent(desired_position=center)]
+
+    sim = Simulation(G, agents_list=hole)
+    hole[0].join_to_simulation(sim)
+    assert not hole[0].move_along(1)
+
+    batch = BatchSimulation(
+        G, lambda step, positions, widths, ports_back, mates, state:
+        np.where(widths == 4, 1, -1), agents_list=batch_hole)
+    batch.step_algo()
+    assert batch.get_agents_manager().get_agent_position(batch_hole[0]) == \
+        center
+    assert batch.moves_numbers().tolist() == [0]
+
+
+def test_weighted_topology():
+    G = grid(2, 2)
+    u, v = G.get_vertex_by_id(0), G.get_vertex_by_id(1)
+    G.set_edge_weight(u, v, 2)
+    with pytest.raises(ValueError):
+        BatchSimulation(G, batched_next_port)
+
+
+def test_run():
+    G = grid(4, 4)
+    batch = BatchSimulation(G, batched_next_port, agents_number=5)
+
+    summary = batch.run(steps=3)
+    assert summary["steps"] == 3
+    assert summary["moves"] == 15
+    assert batch.moves_numbers().tolist() == [3] * 5
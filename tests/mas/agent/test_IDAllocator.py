@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from mas.agent.IDAllocator import IDAllocator
+
+
+def test_allocate():
+    allocator = IDAllocator(rng=np.random.default_rng(0))
+    ids = allocator.allocate([3, None, 3, 5, None])
+
+    assert ids[0] == 3
+    assert ids[3] == 5
+    assert len(set(ids.tolist())) == 5
+    assert all(0 <= ID < 50000 for ID in ids.tolist())
+
+
+def test_allocate_many():
+    allocator = IDAllocator()
+    ids = allocator.allocate([None] * 200000)
+
+    assert np.unique(ids).size == 200000
+    assert ids.max() < allocator.id_space(200000)
+
+
+def test_id_space():
+    allocator = IDAllocator(id_space=10)
+    ids = allocator.allocate([None] * 9 + [4])
+    assert sorted(ids.tolist()) == list(range(10))
+
+    with pytest.raises(ValueError):
+        allocator.allocate([None] * 11)
+
+
+def test_allocate_negative():
+    allocator = IDAllocator(id_space=10, rng=np.random.default_rng(0))
+    ids = allocator.allocate([-1, None, 3])
+    assert ids[0] == -1
+    assert ids[2] == 3
+    assert 0 <= ids[1] < 10 and ids[1] != 3
@@ -0,0 +1,68 @@
+from mas.agent.AdversarialScheduler import AdversarialScheduler
+from mas.agent.FairScheduler import FairScheduler
+from mas.agent.PoissonScheduler import PoissonScheduler
+from mas.agent.RandomSubsetScheduler import RandomSubsetScheduler
+from mas.agent.RoundRobinScheduler import RoundRobinScheduler
+from mas.agent.Simulation import Simulation
+from mas.graph.graph_generator import grid
+
+
+def _simulation(scheduler, agents_number=10):
+    return Simulation(grid(3, 3), agents_number=agents_number,
+                      synchronous=False, scheduler=scheduler, seed=1)
+
+
+def test_fair_scheduler():
+    sim = _simulation(FairScheduler())
+    assert sorted(sim.get_scheduler().activations(sim)) == list(range(10))
+
+
+def test_random_subset_scheduler():
+    sim = _simulation(RandomSubsetScheduler(0.5), agents_number=1000)
+    activated = sim.get_scheduler().activations(sim)
+    assert len(set(activated)) == len(activated)
+    assert 400 < len(activated) < 600
+
+    sim = _simulation(RandomSubsetScheduler(0))
+    assert sim.get_scheduler().activations(sim) == []
+
+
+def test_round_robin_scheduler():
+    sim = _simulation(RoundRobinScheduler(4))
+    scheduler = sim.get_scheduler()
+    assert scheduler.activations(sim) == [0, 1, 2, 3]
+    assert scheduler.activations(sim) == [4, 5, 6, 7]
+    assert scheduler.activations(sim) == [8, 9, 0, 1]
+
+
+def test_adversarial_scheduler():
+    sim = _simulation(AdversarialScheduler(lambda s: [s.get_step() % 10]))
+    sim.step_algo()
+    sim.step_algo()
+    assert sim.get_scheduler().activations(sim) == [3]
+
+
+def test_poisson_scheduler():
+    sim = _simulation(PoissonScheduler([10.0] + [0.1] * 99),
+                      agents_number=100)
+    scheduler = sim.get_scheduler()
+    activations = []
+    for _ in range(50):
+        activations.extend(scheduler.activations(sim))
+    assert 400 < activations.count(0) < 600
+    assert len(activations) - activations.count(0) < 1000
+    assert scheduler.rate(1) == 0.1
+
+
+def test_step_algo():
+    G = grid(3, 3)
+
+    def move(agent):
+        agent.move_along(agent.available_ports()[0])
+
+    sim = Simulation(G, algorithm=move, agents_number=5, synchronous=False,
+                     scheduler=RoundRobinScheduler(2))
+    agents = list(sim.get_all_agents())
+    sim.run(steps=3)
+    assert [agent.get_moves_nb() for agent in agents] == [2, 1, 1, 1, 1]
+    assert sim.get_all_agents() == agents
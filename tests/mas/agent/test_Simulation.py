@@ -1,10 +1,19 @@
+import pickle
+import pytest
+
 from mas.agent.Simulation import Simulation
+from mas.agent.AgentManager import AgentManager
+from mas.agent.ArrayAgentManager import ArrayAgentManager
 from mas.agent.Agent import Agent
 
 from mas.graph.Graph import Graph
 from mas.graph.Vertex import Vertex
 
 
+def move(agent):
+    agent.move_along(agent.available_ports()[0])
+
+
 def _trivial_graph():
     G = Graph()
     u = Vertex(1)
@@ -26,10 +35,10 @@ def _edge_graph():
 def test_get_agent():
     G, _ = _trivial_graph()
 
-    sim = Simulation(G)
+    sim = Simulation(G, agents_list=[Agent(desired_id=7)])
 
-    assert type(sim.get_agent(0)) == Agent
-    assert sim.get_agent(1) is None
+    assert type(sim.get_agent(7)) == Agent
+    assert sim.get_agent(0) is None
 
 
 def test_model():
@@ -75,3 +84,186 @@ def test_init_notifications():
     assert a1.position_contains_mate()
     assert a2.position_contains_mate()
     assert not a3.position_contains_mate()
+
+
+def test_check_connectivity():
+    G, _, _ = _edge_graph()
+    Simulation(G, check_connectivity=True)
+
+    G.add_vertex(Vertex(3))
+    Simulation(G)
+    with pytest.raises(ValueError):
+        Simulation(G, check_connectivity=True)
+
+
+def test_pickle():
+    G, u, v = _edge_graph()
+    sim1 = Simulation(G, algorithm=move, agents_number=3)
+    sim1.step_algo()
+
+    sim2 = pickle.loads(pickle.dumps(sim1))
+    manager1 = sim1.get_agents_manager()
+    manager2 = sim2.get_agents_manager()
+
+    assert sim2.get_step() == sim1.get_step()
+    for a1, a2 in zip(sim1.get_all_agents(), sim2.get_all_agents()):
+        assert a2._simulation is sim2
+        assert manager2.get_agent_id(a2) == manager1.get_agent_id(a1)
+        assert (manager2.get_agent_position(a2).name() ==
+                manager1.get_agent_position(a1).name())
+        assert manager2.get_agent_position(a2) in sim2.topology().vertices()
+        assert a2.get_port_back() == a1.get_port_back()
+
+    sim1.step_algo()
+    sim2.step_algo()
+    for a1, a2 in zip(sim1.get_all_agents(), sim2.get_all_agents()):
+        assert (manager2.get_agent_position(a2).name() ==
+                manager1.get_agent_position(a1).name())
+
+
+def test_transit():
+    G, u, v = _edge_graph()
+    G.set_edge_weight(u, v, 3)
+    agent = Agent(desired_position=u)
+    sim = Simulation(G, algorithm=move, agents_list=[agent])
+    agent.join_to_simulation(sim)
+    manager = sim.get_agents_manager()
+
+    sim.step_algo()
+    assert sim.in_transit(agent)
+    assert manager.get_agent_position(agent) == u
+    assert not agent.move_along(0)
+
+    sim.step_algo()
+    assert manager.get_agent_position(agent) == u
+    assert agent.get_moves_nb() == 1
+
+    sim.step_algo()
+    assert not sim.in_transit(agent)
+    assert manager.get_agent_position(agent) == v
+
+    sim.step_algo()
+    assert sim.in_transit(agent)
+    assert agent.get_moves_nb() == 2
+
+
+def test_unweighted_moves_skip_weights(monkeypatch):
+    G, u, v = _edge_graph()
+    agent = Agent(desired_position=u)
+    sim = Simulation(G, algorithm=move, agents_list=[agent])
+    agent.join_to_simulation(sim)
+
+    def edge_weight(u, v):
+        raise AssertionError("weight looked up on an unweighted topology")
+
+    monkeypatch.setattr(G, "edge_weight", edge_weight)
+    sim.step_algo()
+    assert sim.get_agents_manager().get_agent_position(agent) == v
+    assert not sim.in_transit(agent)
+
+
+def test_memory_usage():
+    G, u, v = _edge_graph()
+    sim = Simulation(G, algorithm=move, agents_number=200)
+    sim.step_algo()
+
+    report = sim.memory_usage()
+    manager_report = sim.get_agents_manager().memory_usage()
+    assert report["agents_manager"] == manager_report["total"]
+    assert manager_report["agents_position"] > 200 * 8
+    assert report["total"] == sum(size for component, size in report.items()
+                                  if component != "total")
+
+
+def test_run():
+    G, u, v = _edge_graph()
+    sim = Simulation(G, algorithm=move, agents_number=3)
+
+    summary = sim.run(steps=4)
+    assert summary["steps"] == 4
+    assert summary["moves"] == 12
+    assert summary["reason"] == "steps"
+    assert sim.get_step() == 5
+
+    summary = sim.run(steps=10, until=lambda s: s.get_step() == 7)
+    assert summary["steps"] == 2
+    assert summary["reason"] == "until"
+
+    summary = sim.run(time_budget=0)
+    assert summary["steps"] == 1
+    assert summary["reason"] == "time_budget"
+
+    with pytest.raises(ValueError):
+        sim.run()
+
+
+def test_seed():
+    G, u, v = _edge_graph()
+    G.add_vertex(Vertex(3))
+    G.add_edge(v, G.get_vertex_by_name(3))
+
+    def positions(sim):
+        manager = sim.get_agents_manager()
+        return [(manager.get_agent_id(a), manager.get_agent_position(a))
+                for a in sim.get_all_agents()]
+
+    sim1 = Simulation(G, algorithm=move, agents_number=10, synchronous=False,
+                      possible_latencies=[1, 2], seed=5)
+    sim2 = Simulation(G, algorithm=move, agents_number=10, synchronous=False,
+                      possible_latencies=[1, 2], seed=5)
+    assert positions(sim1) == positions(sim2)
+
+    sim1.run(steps=5)
+    sim2.run(steps=5)
+    assert positions(sim1) == positions(sim2)
+
+
+@pytest.mark.parametrize("manager_class", [AgentManager, ArrayAgentManager])
+def test_desired_latencies(manager_class):
+    G, u, v = _edge_graph()
+    agents = [Agent(desired_latency=3), Agent(), Agent(desired_latency=1)]
+    sim = Simulation(G, algorithm=move, agents_list=agents,
+                     possible_latencies=[2],
+                     agents_manager_class=manager_class)
+    manager = sim.get_agents_manager()
+    assert [manager.get_agent_latency(a) for a in agents] == [3, 2, 1]
+
+    agent = Agent(desired_latency=1)
+    sim = Simulation(G, algorithm=move, agents_list=[agent],
+                     possible_latencies=[], agents_manager_class=manager_class)
+    assert sim.get_agents_manager().get_agent_latency(agent) == 1
+
+
+def test_latency_wheel():
+    G, u, v = _edge_graph()
+    calls = {}
+
+    def count(agent):
+        calls[agent] = calls.get(agent, 0) + 1
+        move(agent)
+
+    agents = [Agent(desired_latency=latency) for latency in [1, 3, 4]]
+    sim = Simulation(G, algorithm=count, agents_list=agents)
+    for agent in agents:
+        agent.join_to_simulation(sim)
+    sim.run(steps=12)
+    assert [calls[agent] for agent in agents] == [12, 4, 3]
+    assert [agent.get_moves_nb() for agent in agents] == [12, 4, 3]
+
+    calls.clear()
+    agents = [Agent(desired_latency=latency) for latency in [1, 3, 4]]
+    sim = Simulation(G, algorithm=count, agents_list=agents,
+                     observe_every_round=True)
+    for agent in agents:
+        agent.join_to_simulation(sim)
+    sim.run(steps=12)
+    assert [calls[agent] for agent in agents] == [12, 12, 12]
+    assert [agent.get_moves_nb() for agent in agents] == [12, 4, 3]
+
+
+def test_get_agent_by_id():
+    G, u, v = _edge_graph()
+    sim = Simulation(G, agents_number=100)
+    manager = sim.get_agents_manager()
+    for agent in sim.get_all_agents():
+        assert sim.get_agent(manager.get_agent_id(agent)) is agent
@@ -0,0 +1,76 @@
+import numpy as np
+
+from mas.agent.Agent import Agent
+from mas.agent.BatchSimulation import BatchSimulation
+from mas.agent.Simulation import Simulation
+from mas.agent.encounters import (CROSSING, MEETING, crossings,
+                                  encounter_flags, meetings)
+from mas.graph.graph_generator import grid
+
+
+def test_crossings():
+    events = crossings([0, 1, 2, 3, 4], [1, 2, 1, 5, 2], [2, 1, 2, 6, 1])
+    assert events.tolist() == [
+        [CROSSING, 0, 1, 1, 2],
+        [CROSSING, 0, 4, 1, 2],
+        [CROSSING, 2, 1, 1, 2],
+        [CROSSING, 2, 4, 1, 2],
+    ]
+    assert crossings([], [], []).shape == (0, 5)
+
+
+def test_meetings():
+    events = meetings([4, 1, 2, 3, 0], [7, 7, 7, 8, 8],
+                      [True, False, False, False, False])
+    assert events.tolist() == [
+        [MEETING, 1, 4, 7, 7],
+        [MEETING, 2, 4, 7, 7],
+    ]
+    assert encounter_flags(events, 6).tolist() == \
+        [False, True, True, False, True, False]
+
+
+def move(agent):
+    agent.move_along(agent.available_ports()[0])
+
+
+def test_simulation_encounters():
+    G = grid(1, 2)
+    u, v = G.get_vertex_by_id(0), G.get_vertex_by_id(1)
+
+    agents = [Agent(desired_position=u), Agent(desired_position=v),
+              Agent(desired_position=v, desired_latency=2)]
+    sim = Simulation(G, algorithm=move, agents_list=agents,
+                     detect_encounters=True)
+    for agent in agents:
+        agent.join_to_simulation(sim)
+
+    sim.step_algo()
+    events = sim.encounters().tolist()
+    assert sorted(events) == [[MEETING, 0, 2, 1, 1], [CROSSING, 0, 1, 0, 1]]
+    assert sim.encounter_flags().tolist() == [True, True, True]
+
+    sim.step_algo()
+    events = sim.encounters().tolist()
+    assert sorted(events) == [[MEETING, 0, 2, 0, 0], [CROSSING, 1, 0, 0, 1],
+                              [CROSSING, 1, 2, 0, 1]]
+
+
+def test_batch_encounters():
+    G = grid(1, 2)
+
+    def policy(step, positions, widths, ports_back, mates, state):
+        return np.zeros(positions.size, np.int64)
+
+    batch = BatchSimulation(G, policy, agents_list=[
+        Agent(desired_position=G.get_vertex_by_id(0)),
+        Agent(desired_position=G.get_vertex_by_id(1)),
+        Agent(desired_position=G.get_vertex_by_id(1))],
+        detect_encounters=True)
+    batch.step_algo()
+
+    events = batch.encounters().tolist()
+    assert [MEETING, 1, 2, 0, 0] in events
+    assert [CROSSING, 0, 1, 0, 1] in events
+    assert [CROSSING, 0, 2, 0, 1] in events
+    assert len(events) == 3
@@ -0,0 +1,104 @@
+import os
+import pytest
+import time
+
+from mas.agent.sweep import expand_grid, sweep
+from mas.graph.graph_generator import grid
+
+
+def move(agent):
+    agent.move_along(agent.available_ports()[0])
+
+
+def crash(agent):
+    os._exit(1)
+
+
+def fail(agent):
+    raise RuntimeError("failure")
+
+
+def hang(agent):
+    time.sleep(60)
+
+
+def factory(key):
+    return grid(*key)
+
+
+def test_expand_grid():
+    configurations = expand_grid({"a": [1, 2], "b": ["x", "y", "z"]})
+    assert len(configurations) == 6
+    assert configurations[0] == {"a": 1, "b": "x"}
+    assert configurations[3] == {"a": 2, "b": "x"}
+
+
+def test_sweep():
+    parameters = {
+        "topology": [(3, 3), (2, 5)],
+        "agents_number": [1, 4],
+        "synchronous": [True, False],
+        "algorithm": [move],
+        "seed": [0],
+    }
+    results = list(sweep(parameters, factory, steps=5, processes=2,
+                         chunksize=3))
+
+    assert sorted(result["index"] for result in results) == list(range(8))
+    for result in results:
+        assert result["error"] is None
+        assert result["summary"]["steps"] == 5
+        configuration = result["configuration"]
+        if configuration["synchronous"]:
+            assert (result["summary"]["moves"] ==
+                    5 * configuration["agents_number"])
+
+
+@pytest.mark.parametrize("chunksize", [1, 4])
+def test_sweep_failures(chunksize):
+    parameters = {
+        "topology": [(3, 3)],
+        "algorithm": [move, fail, crash, move],
+    }
+    results = sorted(sweep(parameters, factory, steps=2, processes=2,
+                           chunksize=chunksize),
+                     key=lambda result: result["index"])
+
+    assert [result["error"] is None for result in results] == \
+        [True, False, False, True]
+    assert "RuntimeError" in results[1]["error"]
+    assert results[2]["error"] == "worker process died"
+    assert results[3]["summary"]["moves"] == 2
+
+
+def test_sweep_seeds():
+    parameters = {
+        "topology": [(4, 4)],
+        "agents_number": [3],
+        "synchronous": [False],
+        "algorithm": [move, move],
+    }
+    results1 = sorted(sweep(parameters, factory, steps=4, seed=7),
+                      key=lambda result: result["index"])
+    results2 = sorted(sweep(parameters, factory, steps=4, seed=7),
+                      key=lambda result: result["index"])
+    moves1 = [result["summary"]["moves"] for result in results1]
+    moves2 = [result["summary"]["moves"] for result in results2]
+    assert moves1 == moves2
+
+
+def test_sweep_timeout():
+    parameters = {
+        "topology": [(3, 3)],
+        "algorithm": [move, hang, move],
+    }
+    start = time.perf_counter()
+    results = sorted(sweep(parameters, factory, steps=2, timeout=0.5,
+                           processes=2, chunksize=3),
+                     key=lambda result: result["index"])
+
+    assert time.perf_counter() - start < 30
+    assert [result["error"] is None for result in results] == \
+        [True, False, True]
+    assert results[1]["error"] == "run killed after 1.0 seconds"
+    assert results[2]["summary"]["moves"] == 2
@@ -0,0 +1,89 @@
+from mas.graph.CompressedGraph import CompressedGraph
+from mas.graph.Graph import Graph
+from mas.graph.Vertex import Vertex
+from mas.graph.graph_generator import cycle, grid
+
+from mas.agent.Simulation import Simulation
+
+import numpy as np
+import pytest
+
+
+def test_compress():
+    G = grid(5, 4)
+    compressed = G.compress()
+
+    assert compressed.order() == G.order()
+    assert compressed.size() == G.size()
+    for ID in range(G.order()):
+        u = G.get_vertex_by_id(ID)
+        h = compressed.get_vertex_by_id(ID)
+        assert h.name() == u.name()
+        assert h.get_ports() == sorted(u.get_ports())
+        for port in u.get_ports():
+            v = u.get_neighbor_by_port(port)
+            w = h.get_neighbor_by_port(port)
+            assert w.name() == v.name()
+            assert h.get_port_by_neighbor(w) == port
+
+    u = compressed.get_vertex_by_name("(0,0)")
+    v = compressed.get_vertex_by_name("(4,3)")
+    assert compressed.distance(u, v) == 7
+    assert compressed.get_vertex_by_id(0).get_neighbor_by_port(9) is None
+
+
+def test_large_gaps_and_isolated_vertices():
+    G = Graph()
+    vertices = [Vertex(i) for i in range(300)]
+    for vertex in vertices:
+        G.add_vertex(vertex)
+    G.add_edge(vertices[299], vertices[0])
+    G.add_edge(vertices[299], vertices[150])
+    compressed = G.compress()
+
+    assert compressed.get_vertex_by_id(5).get_ports() == []
+    assert {w.id() for w in compressed.get_vertex_by_id(299).get_neighbors()} \
+        == {0, 150}
+    assert compressed.get_vertex_by_id(0).get_neighbors()[0].id() == 299
+    assert compressed.distances_from(0)[150] == 2
+
+
+def test_save_and_load(tmp_path):
+    filename = tmp_path / "grid.bin"
+    compressed = grid(5, 4).compress()
+    compressed.save(filename)
+
+    loaded = CompressedGraph.load(filename)
+    assert isinstance(loaded._data, np.memmap)
+    assert loaded.order() == 20 and loaded.size() == compressed.size()
+    assert loaded.get_vertex_by_name("(2,3)").id() == \
+        compressed.get_vertex_by_name("(2,3)").id()
+    assert list(loaded.distances_from(0)) == \
+        list(compressed.distances_from(0))
+
+    (tmp_path / "other.bin").write_bytes(b"not a graph")
+    with pytest.raises(ValueError):
+        CompressedGraph.load(tmp_path / "other.bin")
+
+
+def test_memory():
+    G = grid(30, 30)
+    offsets, targets, back_ports = G.port_table()
+    compressed = G.compress()
+
+    table = offsets.nbytes + targets.nbytes + back_ports.nbytes
+    assert compressed.nbytes() * 5 < table
+
+
+def test_simulation_on_compressed_graph():
+    compressed = cycle(6).compress()
+
+    def move(agent):
+        agent.move_along(0)
+
+    sim = Simulation(compressed, algorithm=move, agents_number=2)
+    sim.step_algo()
+
+    manager = sim.get_agents_manager()
+    for agent in sim.get_all_agents():
+        assert manager.get_agent_position(agent) in compressed.vertices()
@@ -0,0 +1,92 @@
+from mas.graph.FrozenGraph import FrozenGraph
+from mas.graph.graph_generator import cycle, grid
+
+from mas.agent.Simulation import Simulation
+
+from multiprocessing import get_context
+import pickle
+import pytest
+
+
+def _order_and_distance(frozen):
+    u = frozen.get_vertex_by_name("(0,0)")
+    v = frozen.get_vertex_by_name("(3,2)")
+    return frozen.order(), frozen.distance(u, v)
+
+
+def test_freeze():
+    G = grid(4, 3)
+    frozen = G.freeze()
+
+    assert frozen.order() == G.order()
+    assert frozen.size() == G.size()
+    for ID in range(G.order()):
+        u = G.get_vertex_by_id(ID)
+        h = frozen.get_vertex_by_id(ID)
+        assert h.name() == u.name()
+        assert h.get_ports() == sorted(u.get_ports())
+        for port in u.get_ports():
+            assert h.get_neighbor_by_port(port).name() == \
+                u.get_neighbor_by_port(port).name()
+
+    u = frozen.get_vertex_by_name("(0,0)")
+    v = frozen.get_vertex_by_name("(3,2)")
+    assert frozen.distance(u, v) == 5
+
+    frozen.close()
+    frozen.unlink()
+
+
+def test_integer_names_and_read_only():
+    frozen = cycle(5).freeze()
+
+    assert frozen.get_vertex_by_name(3).name() == 3
+    with pytest.raises(ValueError):
+        frozen._targets[0] = 1
+
+    frozen.close()
+    frozen.unlink()
+
+
+def test_attach():
+    frozen = grid(4, 3).freeze()
+
+    attached = FrozenGraph.attach(frozen.name())
+    assert attached._targets.ctypes.data != frozen._targets.ctypes.data
+    assert list(attached._targets) == list(frozen._targets)
+
+    copy = pickle.loads(pickle.dumps(frozen))
+    assert copy.name() == frozen.name()
+
+    for graph in (attached, copy, frozen):
+        graph.close()
+    frozen.unlink()
+
+
+def test_attach_from_worker():
+    frozen = grid(4, 3).freeze()
+
+    with get_context("spawn").Pool(2) as pool:
+        results = pool.map(_order_and_distance, [frozen, frozen])
+    assert results == [(12, 5), (12, 5)]
+
+    frozen.close()
+    frozen.unlink()
+
+
+def test_simulation_on_frozen_graph():
+    frozen = cycle(6).freeze()
+
+    def move(agent):
+        agent.move_along(0)
+
+    sim = Simulation(frozen, algorithm=move, agents_number=2)
+    sim.step_algo()
+    sim.step_algo()
+
+    manager = sim.get_agents_manager()
+    for agent in sim.get_all_agents():
+        assert manager.get_agent_position(agent) in frozen.vertices()
+
+    frozen.close()
+    frozen.unlink()
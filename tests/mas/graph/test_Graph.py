@@ -1,10 +1,12 @@
 
 from mas.graph.Graph import Graph
 from mas.graph.Vertex import Vertex
-from mas.graph.graph_generator import clique
+from mas.graph.graph_generator import clique, cycle, grid
 
 import numpy as np
 import os
+import pickle
+import pytest
 
 path = os.getcwd()
 tests_path = os.path.join(path, "tests")
@@ -476,3 +478,358 @@ def test_save_realids():
     assert u2.name() == "u"
     assert v2.name() == "v"
     assert (u2, v2) in G2.edges()
+
+
+def test_port_table():
+    G = Graph()
+
+    u = Vertex("u")
+    v = Vertex("v")
+
+    G.add_vertex(u)
+    G.add_vertex(v)
+    G.add_edge(u, v)
+    u.reset_port_associations({2: v})
+
+    offsets, targets, back_ports = G.port_table()
+    assert list(offsets) == [0, 3, 4]
+    assert list(targets) == [-1, -1, 1, 0]
+    assert list(back_ports) == [-1, -1, 0, 2]
+    assert list(G.port_edge_ids()) == [-1, -1, 0, 0]
+
+
+def test_next_port():
+    G = grid(4, 3)
+
+    u = G.get_vertex_by_name("(0,0)")
+    t = G.get_vertex_by_name("(3,2)")
+
+    vertex = u
+    steps = 0
+    while vertex != t:
+        vertex = vertex.get_neighbor_by_port(G.next_port(vertex, t))
+        steps += 1
+
+    assert steps == G.distance(u, t)
+    assert G.next_port(t, t) is None
+
+
+def test_next_port_unreachable():
+    G = cycle(3)
+    u = Vertex("u")
+    G.add_vertex(u)
+
+    assert G.next_port(G.get_vertex_by_id(0), u) is None
+
+
+def test_routing_table():
+    G = cycle(6)
+    t = G.get_vertex_by_id(0)
+
+    table = G.routing_table(t)
+    assert table.dtype == np.uint8
+    assert table is G.routing_table(t)
+
+    G.remove_edge(G.get_vertex_by_id(2), G.get_vertex_by_id(3))
+    assert table is not G.routing_table(t)
+
+
+def test_distances():
+    G = grid(3, 3)
+
+    sources = np.array([0, 0, 4, 8])
+    targets = np.array([8, 0, 1, 2])
+    expected = [G.distance(G.get_vertex_by_id(s), G.get_vertex_by_id(t))
+                for s, t in zip(sources, targets)]
+
+    H = grid(3, 3)
+    assert list(H.distances(sources, targets)) == expected
+    assert list(G.distances(sources, targets)) == expected
+    assert list(H.distances(0, targets)) == list(G.distances(0, targets))
+    assert list(H.distances(targets, 0)) == list(G.distances(0, targets))
+
+
+def test_distances_unreachable():
+    G = Graph()
+    G.add_vertex(Vertex("u"))
+    G.add_vertex(Vertex("v"))
+
+    assert list(G.distances([0], [1])) == [Graph.INFTY]
+
+
+def test_distances_from():
+    G = Graph()
+    G.init_from_adjacency_matrix(M)
+
+    assert list(G.distances_from(0)) == [0, 1, 2]
+
+
+def test_pairwise_distances():
+    G = cycle(6)
+
+    IDs = np.array([0, 3, 3, 5])
+    expected = np.array([
+        [0, 3, 3, 1],
+        [3, 0, 0, 2],
+        [3, 0, 0, 2],
+        [1, 2, 2, 0]
+    ])
+    assert np.array_equal(G.pairwise_distances(IDs), expected)
+
+    G.distance_matrix()
+    assert np.array_equal(G.pairwise_distances(IDs), expected)
+
+
+def test_components():
+    G = cycle(4)
+    u = Vertex("u")
+    v = Vertex("v")
+    G.add_vertex(u)
+    G.add_vertex(v)
+
+    assert G.components_number() == 3
+    assert not G.is_connected()
+    assert not G.same_component(u, v)
+    assert G.same_component(G.get_vertex_by_id(0), G.get_vertex_by_id(2))
+
+    G.add_edge(u, v)
+    assert G.components_number() == 2
+    assert G.same_component(u, v)
+
+    labels = G.component_labels()
+    assert labels[G.get_vertex_id(u)] == labels[G.get_vertex_id(v)]
+    assert len(set(labels[:4])) == 1
+    assert labels[0] != labels[G.get_vertex_id(u)]
+
+    G.add_edge(u, G.get_vertex_by_id(0))
+    assert G.is_connected()
+
+
+def test_components_after_remove_edge():
+    G = cycle(4)
+    a = G.get_vertex_by_id(0)
+    b = G.get_vertex_by_id(1)
+    c = G.get_vertex_by_id(2)
+
+    G.remove_edge(a, b)
+    assert G.is_connected()
+
+    G.remove_edge(b, c)
+    assert G.components_number() == 2
+    assert not G.same_component(a, b)
+    assert G.same_component(a, c)
+
+
+def test_ball():
+    G = grid(5, 5)
+    center = G.get_vertex_by_name("(2,2)")
+
+    assert list(G.ball(center, 0)) == [G.get_vertex_id(center)]
+
+    ball = G.ball(center, 2)
+    assert len(ball) == 13
+    distances = G.distances(G.get_vertex_id(center), ball)
+    assert list(distances) == sorted(distances)
+    assert ball is G.ball(center, 2)
+
+    G.remove_edge(center, G.get_vertex_by_name("(2,1)"))
+    assert len(G.ball(center, 2)) == 11
+
+
+def test_balls():
+    G = cycle(8)
+    vertices = [G.get_vertex_by_id(i) for i in [0, 3, 0]]
+
+    balls = G.balls(vertices, 1)
+    assert [sorted(ball) for ball in balls] == [[0, 1, 7], [2, 3, 4],
+                                                [0, 1, 7]]
+    assert balls[0] is balls[2]
+
+
+def test_remove_vertex_updates_ids():
+    G = cycle(4)
+    v = G.get_vertex_by_id(1)
+    w = G.get_vertex_by_id(3)
+
+    G.remove_vertex(v)
+    assert G.get_vertex_by_id(1) == w
+    assert G.get_vertex_id(w) == 1
+
+
+def test_reorder():
+    for method in ["rcm", "bfs", "degree"]:
+        G = grid(4, 4)
+        names = [G.get_vertex_by_id(i).name() for i in range(G.order())]
+        distances = G.distance_matrix().copy()
+        G.routing_table(G.get_vertex_by_id(0))
+
+        perm = G.reorder(method)
+
+        assert sorted(perm) == list(range(16))
+        for ID in range(G.order()):
+            vertex = G.get_vertex_by_id(ID)
+            assert G.get_vertex_id(vertex) == ID
+            assert vertex.name() == names[perm[ID]]
+        assert np.array_equal(G.distance_matrix(),
+                              distances[np.ix_(perm, perm)])
+
+        t = G.get_vertex_by_name(names[0])
+        for vertex in G.vertices():
+            if vertex != t:
+                next = vertex.get_neighbor_by_port(G.next_port(vertex, t))
+                assert G.distance(next, t) == G.distance(vertex, t) - 1
+
+
+def test_reorder_bandwidth():
+    shuffle = np.random.RandomState(0).permutation(50)
+    matrix = cycle(50).adjacency_matrix()[np.ix_(shuffle, shuffle)]
+    G = Graph()
+    G.init_from_adjacency_matrix(matrix)
+
+    edges = G.edge_array()
+    assert np.abs(edges[:, 0] - edges[:, 1]).max() > 2
+
+    G.reorder("rcm")
+    edges = G.edge_array()
+    assert np.abs(edges[:, 0] - edges[:, 1]).max() <= 2
+
+
+def test_pickle():
+    G1 = grid(3, 4)
+    u = G1.get_vertex_by_id(5)
+    u.reset_port_associations({7: u.get_neighbor_by_port(0),
+                               2: u.get_neighbor_by_port(1),
+                               0: u.get_neighbor_by_port(2),
+                               4: u.get_neighbor_by_port(3)})
+    G1.distance_matrix()
+
+    G2 = pickle.loads(pickle.dumps(G1))
+
+    assert G2.__str__() == G1.__str__()
+    assert G2.fingerprint() == G1.fingerprint()
+    assert G2.size() == G1.size()
+    assert G2.is_connected()
+    assert np.array_equal(G2.distance_matrix(), G1.distance_matrix())
+    for ID in range(G1.order()):
+        v1 = G1.get_vertex_by_id(ID)
+        v2 = G2.get_vertex_by_id(ID)
+        assert G2.get_vertex_by_name(v1.name()) == v2
+        for port in v1.get_ports():
+            assert (v2.get_neighbor_by_port(port).name() ==
+                    v1.get_neighbor_by_port(port).name())
+
+
+def test_pickle_long_path():
+    G1 = Graph()
+    G1.add_vertex(Vertex(0))
+    for i in range(1, 5000):
+        G1.add_vertex(Vertex(i))
+        G1.add_edge(G1.get_vertex_by_id(i - 1), G1.get_vertex_by_id(i))
+
+    G2 = pickle.loads(pickle.dumps(G1))
+    assert G2.size() == 4999
+    assert G2.get_vertex_by_id(4999).get_neighbors()[0].name() == 4998
+
+
+def test_edge_weights():
+    G = cycle(4)
+    u = G.get_vertex_by_id(0)
+    v = G.get_vertex_by_id(1)
+    w = G.get_vertex_by_id(2)
+
+    assert not G.is_weighted()
+    assert G.edge_weight(u, v) == 1
+    assert G.edge_weight(u, w) is None
+    assert not G.set_edge_weight(u, w, 2)
+    with pytest.raises(ValueError):
+        G.set_edge_weight(u, v, 0)
+
+    fingerprint = G.fingerprint()
+    assert G.set_edge_weight(v, u, 5)
+    assert G.is_weighted()
+    assert G.edge_weight(u, v) == 5
+    assert G.fingerprint() != fingerprint
+    assert sorted(G.edge_weights()) == [1, 1, 1, 5]
+
+    G.set_edge_weight(u, v, 1)
+    assert not G.is_weighted()
+
+
+def test_weighted_shortest_paths():
+    G = cycle(5)
+    u = G.get_vertex_by_id(0)
+    v = G.get_vertex_by_id(1)
+    G.set_edge_weight(u, v, 10)
+
+    assert G.distance(u, v) == 4
+    assert list(G.distances_from(1)) == [4, 0, 1, 2, 3]
+    assert G.diameter() == 4
+    assert G.next_port(u, v) == u.get_port_by_neighbor(
+        G.get_vertex_by_id(4))
+
+    G.set_edge_weight(u, v, 2.5)
+    assert G.distance(u, v) == 2.5
+    assert list(G.distances([0, 0], [1, 2])) == [2.5, 3]
+
+    H = pickle.loads(pickle.dumps(G))
+    assert H.edge_weight(H.get_vertex_by_id(0), H.get_vertex_by_id(1)) == 2.5
+
+    G.remove_edge(u, v)
+    G.add_edge(u, v)
+    assert not G.is_weighted()
+
+
+def test_relabel_ports():
+    G = grid(4, 4)
+    rng = np.random.default_rng(0)
+    neighbors = {u: set(u.get_neighbors()) for u in G.vertices()}
+
+    offsets, targets = G.relabel_ports("random", rng)
+    for u, ID in G.vertices().items():
+        assert sorted(u.get_ports()) == list(range(len(neighbors[u])))
+        assert set(u.get_neighbors()) == neighbors[u]
+        for port in u.get_ports():
+            assert (G.get_vertex_id(u.get_neighbor_by_port(port)) ==
+                    targets[offsets[ID] + port])
+
+    G.relabel_ports("sorted")
+    u = G.get_vertex_by_id(5)
+    assert [G.get_vertex_id(u.get_neighbor_by_port(p)) for p in range(4)] \
+        == [1, 4, 6, 9]
+
+    G.relabel_ports("rotation", rng)
+    ids = [G.get_vertex_id(u.get_neighbor_by_port(p)) for p in range(4)]
+    assert ids in ([1, 4, 6, 9], [4, 6, 9, 1], [6, 9, 1, 4], [9, 1, 4, 6])
+
+    with pytest.raises(ValueError):
+        G.relabel_ports("unknown")
+
+
+def test_set_port_labeling():
+    G = cycle(5)
+    offsets, targets = G.relabel_ports("random")
+    G.relabel_ports("sorted")
+
+    assert G.set_port_labeling(offsets, targets)
+    assert np.array_equal(G.port_table()[1], targets)
+
+    assert not G.set_port_labeling(offsets[:-1], targets[:-1])
+    wrong = targets.copy()
+    wrong[0] = (wrong[0] + 2) % 5
+    assert not G.set_port_labeling(offsets, wrong)
+    assert np.array_equal(G.port_table()[1], targets)
+
+
+def test_memory_usage():
+    G = grid(6, 6)
+    report = G.memory_usage()
+    assert report["distance_matrix"] == 0
+    assert report["vertices"] > 0 and report["edges"] > 0
+    assert report["total"] == sum(size for component, size in report.items()
+                                  if component != "total")
+
+    G.distance_matrix()
+    G.distances_from(3)
+    report = G.memory_usage()
+    assert report["distance_matrix"] == 36 * 36 * 8
+    assert report["port_table"] > 0
@@ -0,0 +1,76 @@
+from mas.graph.GraphCache import GraphCache
+from mas.graph.graph_generator import cycle, grid
+
+import numpy as np
+import os
+
+
+def test_fingerprint():
+    G1 = cycle(5)
+    G2 = cycle(5)
+    G3 = grid(2, 3)
+
+    assert G1.fingerprint() == G2.fingerprint()
+    assert G1.fingerprint() != G3.fingerprint()
+
+    G1.remove_edge(G1.get_vertex_by_id(0), G1.get_vertex_by_id(1))
+    assert G1.fingerprint() != G2.fingerprint()
+
+
+def test_fingerprint_ports():
+    G1 = cycle(5)
+    G2 = cycle(5)
+
+    u = G2.get_vertex_by_id(2)
+    u.reset_port_associations({0: u.get_neighbor_by_port(1),
+                               1: u.get_neighbor_by_port(0)})
+    assert G1.fingerprint() != G2.fingerprint()
+
+
+def test_store_and_load(tmp_path):
+    cache = GraphCache(str(tmp_path))
+    array = np.arange(6).reshape(2, 3)
+
+    assert cache.load("abc", "array") is None
+
+    cache.store("abc", "array", array)
+    loaded = cache.load("abc", "array")
+    assert np.array_equal(loaded, array)
+    assert not loaded.flags.writeable
+
+    cache.store("abc", "scalar", np.array(3.5))
+    assert cache.load("abc", "scalar") == 3.5
+
+
+def test_eviction(tmp_path):
+    cache = GraphCache(str(tmp_path), max_bytes=3000)
+    for i in range(3):
+        cache.store("abc", f"array{i}", np.zeros(100))
+        filename = os.path.join(str(tmp_path), f"abc-array{i}.npy")
+        os.utime(filename, (i, i))
+    cache.load("abc", "array0")
+
+    cache.store("abc", "array3", np.zeros(100))
+    assert cache.size() <= 3000
+    assert cache.load("abc", "array0") is not None
+    assert cache.load("abc", "array1") is None
+    assert cache.load("abc", "array3") is not None
+
+    cache.clear()
+    assert cache.size() == 0
+
+
+def test_graph_with_cache(tmp_path):
+    cache = GraphCache(str(tmp_path))
+
+    G1 = grid(3, 3)
+    G1.set_cache(cache)
+    distances = G1.distance_matrix()
+    assert cache.load(G1.fingerprint(), "distance_matrix") is not None
+
+    G2 = grid(3, 3)
+    G2.set_cache(cache)
+    assert np.array_equal(G2.distance_matrix(), distances)
+    assert G2.diameter() == G1.diameter() == 4
+    assert G2.is_planar()
+    assert G1.is_planar()
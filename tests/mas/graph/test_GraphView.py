@@ -0,0 +1,92 @@
+from mas.graph.GraphView import GraphView
+from mas.graph.graph_generator import cycle, grid
+
+from mas.agent.Simulation import Simulation
+
+import numpy as np
+
+
+def test_unfiltered_view():
+    G = cycle(5)
+    view = GraphView(G)
+
+    assert view.order() == 5
+    assert view.size() == 5
+
+    u = view.get_vertex_by_id(0)
+    for port in G.get_vertex_by_id(0).get_ports():
+        assert (u.get_neighbor_by_port(port).name() ==
+                G.get_vertex_by_id(0).get_neighbor_by_port(port).name())
+
+
+def test_vertex_mask():
+    G = cycle(5)
+    mask = np.ones(5, bool)
+    mask[1] = False
+    view = GraphView(G, vertex_mask=mask)
+
+    assert view.order() == 4
+    assert view.size() == 3
+    assert view.get_vertex_by_id(1) is None
+    assert set(view.vertices().values()) == {0, 2, 3, 4}
+
+    u = view.get_vertex_by_id(0)
+    assert [v.id() for v in u.get_neighbors()] == [4]
+    assert view.distance(u, view.get_vertex_by_id(2)) == 3
+
+    assert G.order() == 5
+    assert G.distance(G.get_vertex_by_id(0), G.get_vertex_by_id(2)) == 2
+
+
+def test_edge_mask():
+    G = cycle(4)
+    mask = np.ones(G.size(), bool)
+    mask[0] = False
+    view = GraphView(G, edge_mask=mask)
+
+    a, b = G.edge_array()[0]
+    u = view.get_vertex_by_id(a)
+    v = view.get_vertex_by_id(b)
+
+    assert view.size() == 3
+    assert u.get_port_by_neighbor(v) is None
+    assert view.distance(u, v) == 3
+
+    x = G.get_vertex_by_id(a)
+    port = x.get_port_by_neighbor(G.get_vertex_by_id(b))
+    assert u.get_neighbor_by_port(port) is None
+    assert port not in u.get_ports()
+
+
+def test_around():
+    G = grid(5, 5)
+    center = G.get_vertex_by_name("(2,2)")
+    view = GraphView.around(G, center, 1)
+
+    assert view.order() == 5
+    assert view.size() == 4
+    assert view.get_vertex_by_name("(0,0)") is None
+
+    G.set_edge_weight(center, G.get_vertex_by_name("(1,2)"), 5)
+    view = GraphView.around(G, center, 1)
+    assert view.order() == 5
+    assert view.vertex_mask().nonzero()[0].tolist() == \
+        sorted(G.ball(center, 1).tolist())
+
+
+def test_simulation_on_view():
+    G = cycle(4)
+    mask = np.ones(G.size(), bool)
+    mask[0] = False
+    view = GraphView(G, edge_mask=mask)
+
+    def move(agent):
+        agent.move_along(agent.available_ports()[0])
+
+    sim = Simulation(view, algorithm=move, agents_number=3)
+    for _ in range(5):
+        sim.step_algo()
+
+    manager = sim.get_agents_manager()
+    for agent in sim.get_all_agents():
+        assert manager.get_agent_position(agent) in view.vertices()
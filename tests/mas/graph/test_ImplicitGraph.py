@@ -0,0 +1,87 @@
+from mas.graph.ImplicitBinaryTree import ImplicitBinaryTree
+from mas.graph.ImplicitCycle import ImplicitCycle
+from mas.graph.ImplicitGrid import ImplicitGrid
+from mas.graph.ImplicitHypercube import ImplicitHypercube
+from mas.graph.ImplicitPath import ImplicitPath
+from mas.graph.ImplicitTorus import ImplicitTorus
+from mas.graph.graph_generator import binary_tree, cycle, grid, path
+
+from mas.agent.Simulation import Simulation
+
+import pickle
+import pytest
+
+
+def assert_same_topology(implicit, G):
+    assert implicit.order() == G.order()
+    assert implicit.size() == G.size()
+    for ID in range(G.order()):
+        u = G.get_vertex_by_id(ID)
+        h = implicit.get_vertex_by_id(ID)
+        assert h.name() == u.name()
+        assert implicit.get_vertex_by_name(u.name()) == h
+        assert h.get_ports() == sorted(u.get_ports())
+        for port in u.get_ports():
+            v = h.get_neighbor_by_port(port)
+            assert v.name() == u.get_neighbor_by_port(port).name()
+            assert h.get_port_by_neighbor(v) == port
+
+
+def test_same_as_generators():
+    assert_same_topology(ImplicitPath(1), path(1))
+    assert_same_topology(ImplicitPath(6), path(6))
+    assert_same_topology(ImplicitCycle(7), cycle(7))
+    assert_same_topology(ImplicitGrid(5, 4), grid(5, 4))
+    assert_same_topology(ImplicitBinaryTree(4), binary_tree(4))
+
+
+def test_torus():
+    T = ImplicitTorus(5, 4)
+    assert T.size() == 40
+    u = T.get_vertex_by_name("(0,0)")
+    assert [v.name() for v in u.get_neighbors()] == \
+        ["(0,3)", "(4,0)", "(0,1)", "(1,0)"]
+    assert T.distance(u, T.get_vertex_by_name("(2,2)")) == 4
+    assert T.get_vertex_by_name("(5,0)") is None
+    assert T.get_vertex_by_name("(0)") is None
+
+    with pytest.raises(ValueError):
+        ImplicitTorus(2, 5)
+
+
+def test_hypercube():
+    H = ImplicitHypercube(4)
+    assert H.order() == 16 and H.size() == 32
+    u = H.get_vertex_by_id(5)
+    assert [v.id() for v in u.get_neighbors()] == [4, 7, 1, 13]
+    assert u.get_port_by_neighbor(H.get_vertex_by_id(1)) == 2
+    assert H.distances_from(0)[15] == 4
+
+
+def test_huge_torus():
+    T = ImplicitTorus(10**5, 10**4)
+    assert T.order() == 10**9
+    assert len(pickle.dumps(T)) < 1000
+
+    u = T.get_vertex_by_id(T.order() - 1)
+    assert u.name() == "(99999,9999)"
+    assert u.get_neighbor_by_port(3).name() == "(0,9999)"
+    assert u.get_neighbor_by_port(2).get_neighbor_by_port(0) == u
+
+
+def test_simulation_on_implicit_torus():
+    T = ImplicitTorus(10**4, 10**4)
+
+    def move(agent):
+        agent.move_along(3)
+
+    sim = Simulation(T, algorithm=move, agents_number=3)
+    manager = sim.get_agents_manager()
+    positions = {agent: manager.get_agent_position(agent).id()
+                 for agent in sim.get_all_agents()}
+    sim.step_algo()
+
+    for agent in sim.get_all_agents():
+        assert manager.get_agent_position(agent).id() == \
+            (positions[agent] + 10**4) % T.order()
+        assert agent.get_port_back() == 1
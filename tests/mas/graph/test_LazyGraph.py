@@ -0,0 +1,92 @@
+from mas.graph.LazyRandomRegularGraph import LazyRandomRegularGraph
+from mas.graph.LazyRandomTree import LazyRandomTree
+
+from mas.agent.Simulation import Simulation
+
+import pytest
+
+
+def assert_consistent(G, vertex):
+    for port in vertex.get_ports():
+        neighbor = vertex.get_neighbor_by_port(port)
+        assert vertex in neighbor.get_neighbors()
+
+
+def test_random_regular_graph():
+    G = LazyRandomRegularGraph(1000, 4, seed=3)
+    assert G.materialized_number() == 0
+
+    for ID in range(0, 1000, 37):
+        u = G.get_vertex_by_id(ID)
+        assert u.get_ports() == [0, 1, 2, 3]
+        assert_consistent(G, u)
+        v = u.get_neighbor_by_port(2)
+        assert v.get_neighbor_by_port(3) == u
+
+    assert 0 < G.materialized_number() < 200
+    assert G.size() == 2000
+    assert G.distances_from(0).max() < G.INFTY
+
+    with pytest.raises(ValueError):
+        LazyRandomRegularGraph(10, 3)
+
+
+def test_deterministic_generation():
+    G = LazyRandomRegularGraph(10**12, 6, seed=7, cache_size=10)
+    H = LazyRandomRegularGraph(10**12, 6, seed=7)
+    other = LazyRandomRegularGraph(10**12, 6, seed=8)
+
+    neighbors = [G.get_vertex_by_id(ID).get_neighbors() for ID in range(50)]
+    assert G.materialized_number() == 10
+    for ID in range(50):
+        assert [v.id() for v in neighbors[ID]] == \
+            [v.id() for v in G.get_vertex_by_id(ID).get_neighbors()] == \
+            [v.id() for v in H.get_vertex_by_id(ID).get_neighbors()]
+    assert [v.id() for v in G.get_vertex_by_id(0).get_neighbors()] != \
+        [v.id() for v in other.get_vertex_by_id(0).get_neighbors()]
+
+
+def test_random_tree():
+    T = LazyRandomTree(3, 4, seed=1)
+    root = T.get_vertex_by_id(0)
+    assert 1 <= len(root.get_ports()) <= 3
+    assert T.get_vertex_by_id(3 * 40 + 1) is None or \
+        T.get_vertex_by_id(40) is not None
+
+    vertex = root
+    for depth in range(4):
+        child = vertex.get_neighbor_by_port(len(vertex.get_ports()) - 1)
+        assert_consistent(T, child)
+        assert child.get_neighbor_by_port(0) == vertex
+        vertex = child
+    assert vertex.get_ports() == [0]
+
+    missing = [ID for ID in range(1, 4) if T.get_vertex_by_id(ID) is None]
+    assert len(missing) == 3 - len(root.get_ports())
+
+    for _ in range(20):
+        assert T.random_vertex().id() < T._ids_number()
+
+    with pytest.raises(ValueError):
+        LazyRandomTree(1, 4)
+
+
+def test_random_tree_order():
+    T = LazyRandomTree(3, 6, seed=5)
+    assert T.order() == len(T.vertices())
+    assert T.size() == T.order() - 1
+    assert T.order() <= sum(3**i for i in range(7))
+    assert T.materialized_number() == 0
+
+
+def test_simulation_on_lazy_graph():
+    G = LazyRandomRegularGraph(10**15, 4, seed=0)
+
+    def move(agent):
+        agent.move_along(0)
+
+    sim = Simulation(G, algorithm=move, agents_number=5)
+    for _ in range(10):
+        sim.step_algo()
+
+    assert G.materialized_number() <= 5 * 11
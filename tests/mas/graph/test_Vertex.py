@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 from mas.graph.Vertex import Vertex
 
 
@@ -160,3 +163,34 @@ def test_get_port_by_neighbor():
 
     y = Vertex(5)
     assert u.get_port_by_neighbor(y) is None
+
+
+def test_reset_port_associations_duplicates():
+    u = Vertex(1)
+    v = Vertex(2)
+    w = Vertex(3)
+    u.add_neighbor(v)
+    u.add_neighbor(w)
+
+    assert not u.reset_port_associations({0: v})
+    assert not u.reset_port_associations({0: v, 1: v})
+    assert u.reset_port_associations({3: v, 0: w})
+    assert u.get_neighbor_by_port(3) == v
+
+
+def test_copy_and_pickle():
+    u = Vertex(1)
+    v = Vertex(2)
+    w = Vertex(3)
+    u.add_neighbor(v)
+    u.add_neighbor(w)
+    u.remove_neighbor(v)
+
+    for u2 in (copy.copy(u), copy.deepcopy(u), pickle.loads(pickle.dumps(u))):
+        assert [n.name() for n in u2.get_neighbors()] == [3]
+        assert u2.get_neighbor_by_port(1).name() == 3
+
+    u2 = pickle.loads(pickle.dumps(u))
+    u2.add_neighbor(Vertex(4))
+    assert u2.get_neighbor_by_port(0).name() == 4
+    assert len(u.get_neighbors()) == 1
@@ -130,3 +130,14 @@ def test_remove_vertex():
     G.add_vertex(u)
 
     assert G.remove_vertex(u)
+
+
+def test_memory_usage():
+    H = GraphViz()
+    H.init_from_graph(clique(5))
+    assert H.memory_usage()["layout_positions"] < 100
+
+    H.get_vertex_position(H.get_vertex_by_id(0))
+    report = H.memory_usage()
+    assert report["layout_positions"] > 5 * 2 * 8
+    assert report["total"] > report["layout_positions"]